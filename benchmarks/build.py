@@ -0,0 +1,233 @@
+"""
+Build pipeline benchmark on a synthetic project.
+
+Generates a project of configurable size in a temporary directory, with
+catalogs that miss part of the keys and hold some stale ones, then
+times each build phase separately: ``load_file`` (scan),
+``extract_entries`` (parse, extraction cache off), ``compute_changes``
+(diff), ``_locales_clean`` and ``save_to_yaml`` (fresh writes of every
+target locale). The translator is a zero-latency no-op, so nothing
+touches the network.
+
+Results (best of ``--repeat`` runs) can be written to JSON with
+``--output`` and compared with an earlier result with ``--baseline``:
+the run fails when a phase is slower than the baseline by more than
+``--threshold`` (relative) and ``--min-delta`` seconds (absolute, to
+ignore noise on fast phases).
+
+Usage::
+
+    uv run python benchmarks/build.py --files 2000 --calls 20 --output build.json
+    uv run python benchmarks/build.py --files 2000 --calls 20 --baseline build.json --threshold 0.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from easy_ai18n._builder import Builder
+from easy_ai18n._loader import catalog_files, dump_locale_file
+from easy_ai18n._types import TextId, TextMap
+from easy_ai18n.translators import BaseTranslator
+
+_FIELDS = ("{name}", "{user.name}", "{items[0]}", "{price:.2f}", "{name!r}")
+"""Replacement fields of increasing complexity, cycled through by ``--fstring-vars``."""
+
+
+class NoOpTranslator(BaseTranslator):
+    async def translate_chunk(self, *, texts: TextMap, target_lang: str, source_lang: str) -> TextMap:
+        return dict(texts)
+
+
+def generate_project(
+    root: Path,
+    *,
+    files: int,
+    calls: int,
+    fstring_vars: int,
+    duplicates: float,
+    filler: int,
+    seed: int = 0,
+) -> int:
+    """Write a synthetic project and return its number of call sites.
+
+    Files are spread over packages of 50 modules. Each call site reuses
+    the text of an earlier one with probability ``duplicates``; the
+    others get a unique text with ``fstring_vars`` replacement fields.
+    ``filler`` lines of plain code per file exercise the token prefilter.
+    """
+    rng = random.Random(seed)
+    fields = " ".join(_FIELDS[i % len(_FIELDS)] for i in range(fstring_vars))
+    texts: list[str] = []
+    for n in range(files):
+        lines = [f"def view_{n}(name, user, items, price):"]
+        lines += [f"    value_{i} = name + str({i})" for i in range(filler)]
+        for _ in range(calls):
+            if texts and rng.random() < duplicates:
+                text = rng.choice(texts)
+            else:
+                text = f"Message {len(texts)} in view {n} {fields}".rstrip()
+                texts.append(text)
+            lines.append(f'    _(f"{text}")' if "{" in text else f'    _("{text}")')
+        package = root / f"pkg{n // 50:03d}"
+        package.mkdir(exist_ok=True)
+        (package / f"mod{n:05d}.py").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return files * calls
+
+
+def _builder(args: argparse.Namespace, project: Path, locales_dir: Path) -> Builder:
+    return Builder(
+        sep=" ",
+        func_names=["_"],
+        locales_dir=locales_dir,
+        to_locales=[f"l{n:02d}" for n in range(args.locales)],
+        source_locale="en",
+        project_root=project,
+        translator=NoOpTranslator(),
+        show_progress=False,
+        jobs=args.jobs,
+        extract_cache=False,
+        checkpoint=False,
+    )
+
+
+def _write_catalogs(builder: Builder, missing: float, stale: float, seed: int = 0) -> None:
+    """Catalogs that lack ``missing`` of the keys and carry ``stale`` extra ones."""
+    rng = random.Random(seed)
+    entries = builder.extract_entries()
+    for locale in builder.to_locales:
+        texts = {i: entry.text for i, entry in entries.items() if rng.random() >= missing}
+        texts.update({TextId(f"stale{i:07d}"): f"Stale text {i}" for i in range(int(len(entries) * stale))})
+        dump_locale_file(builder.locales_dir, locale, texts)
+
+
+def _best(repeat: int, run: Callable[[], object], setup: Callable[[], object] | None = None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_phases(args: argparse.Namespace, root: Path) -> dict[str, Any]:
+    project = root / "project"
+    project.mkdir()
+    call_sites = generate_project(
+        project,
+        files=args.files,
+        calls=args.calls,
+        fstring_vars=args.fstring_vars,
+        duplicates=args.duplicates,
+        filler=args.filler,
+    )
+    locales_dir = root / "i18n"
+    _write_catalogs(_builder(args, project, locales_dir), args.missing, args.stale)
+    builder = _builder(args, project, locales_dir)
+
+    def reset_entries() -> None:
+        builder._entries = None
+
+    phases = {
+        "load_file": _best(args.repeat, builder.load_file),
+        "extract_entries": _best(args.repeat, builder.extract_entries, reset_entries),
+        "compute_changes": _best(args.repeat, builder.compute_changes),
+    }
+    changes = builder.compute_changes()
+    phases["_locales_clean"] = _best(args.repeat, lambda: builder._locales_clean(changes))
+
+    clean = builder._locales_clean(changes)
+    merged = {
+        locale: {**clean[locale], **{entry.id: entry.text for entry in changes.to_translate.get(locale, ())}}
+        for locale in builder.to_locales
+    }
+
+    def remove_catalogs() -> None:
+        for _, _, file in catalog_files(locales_dir, builder.to_locales):
+            file.unlink()
+
+    def save_all() -> None:
+        for locale, texts in merged.items():
+            builder.save_to_yaml(texts, locale)
+
+    phases["save_to_yaml"] = _best(args.repeat, save_all, remove_catalogs)
+    return {
+        "params": {
+            "files": args.files,
+            "calls": args.calls,
+            "fstring_vars": args.fstring_vars,
+            "duplicates": args.duplicates,
+            "filler": args.filler,
+            "locales": args.locales,
+            "missing": args.missing,
+            "stale": args.stale,
+            "jobs": args.jobs,
+        },
+        "python": platform.python_version(),
+        "call_sites": call_sites,
+        "entries": len(builder.extract_entries()),
+        "phases": phases,
+    }
+
+
+def regressions(result: dict[str, Any], baseline: dict[str, Any], threshold: float, min_delta: float) -> list[str]:
+    """The phases slower than ``baseline`` by more than ``threshold`` and ``min_delta`` seconds."""
+    slower: list[str] = []
+    for phase, seconds in result["phases"].items():
+        before = baseline.get("phases", {}).get(phase)
+        if before is not None and seconds > before * (1 + threshold) and seconds - before > min_delta:
+            slower.append(f"{phase}: {before:.4f}s -> {seconds:.4f}s (+{(seconds / before - 1) * 100:.0f}%)")
+    return slower
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=1000, help="source files to generate")
+    parser.add_argument("--calls", type=int, default=20, help="call sites per file")
+    parser.add_argument("--fstring-vars", type=int, default=2, help="replacement fields per f-string (0: plain)")
+    parser.add_argument("--duplicates", type=float, default=0.2, help="share of call sites repeating a text")
+    parser.add_argument("--filler", type=int, default=20, help="lines of plain code per file")
+    parser.add_argument("--locales", type=int, default=4, help="target locales")
+    parser.add_argument("--missing", type=float, default=0.1, help="share of keys missing from the catalogs")
+    parser.add_argument("--stale", type=float, default=0.05, help="stale keys per catalog, relative to the entries")
+    parser.add_argument("--jobs", type=int, default=None, help="extraction worker processes")
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    parser.add_argument("--output", type=Path, help="write the results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="fail when a phase regresses against this JSON result")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative slowdown per phase")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="ignore slowdowns below this many seconds")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        result = run_phases(args, Path(tmp))
+
+    print(f"{result['call_sites']} call sites, {result['entries']} entries, {args.locales} locales")
+    print(f"{'phase':<16} {'seconds':>10}")
+    for phase, seconds in result["phases"].items():
+        print(f"{phase:<16} {seconds:>10.4f}")
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("params") != result["params"]:
+            print("warning: the baseline was recorded with different parameters", file=sys.stderr)
+        slower = regressions(result, baseline, args.threshold, args.min_delta)
+        if slower:
+            print("Regressions:\n  " + "\n  ".join(slower), file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Locale loading benchmark: serial vs. parallel YAML parsing.
+
+Writes synthetic catalogs to a temporary directory and times
+``Loader.load_locales_file`` for increasing locale counts.
+
+Usage::
+
+    uv run python benchmarks/loader.py --keys 20000 --locales 1 5 10 40 --jobs 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from easy_ai18n._loader import Loader
+
+
+def _write_catalogs(root: Path, locales: int, keys: int) -> None:
+    texts = {
+        hashlib.md5(str(i).encode()).hexdigest()[:12]: f"Translated text number {i} with a {{variable}}"
+        for i in range(keys)
+    }
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    for n in range(locales):
+        with open(root / f"l{n:03d}.yaml", "w", encoding="utf-8") as f:
+            yaml.dump(texts, f, Dumper=dumper, allow_unicode=True, sort_keys=True)
+
+
+def _time(loader: Loader, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loader.load_locales_file()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=20_000, help="keys per locale file")
+    parser.add_argument("--locales", type=int, nargs="+", default=[1, 5, 10, 40], help="locale counts to test")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="worker processes for parallel mode")
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    args = parser.parse_args()
+
+    print(f"{'locales':>8} {'serial (s)':>12} {'parallel (s)':>13} {'speedup':>8}")
+    for count in args.locales:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write_catalogs(root, count, args.keys)
+            serial = _time(Loader(root), args.repeat)
+            parallel = _time(Loader(root, jobs=args.jobs), args.repeat)
+        print(f"{count:>8} {serial:>12.3f} {parallel:>13.3f} {serial / parallel:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
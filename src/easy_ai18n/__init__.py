@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+from collections.abc import Iterable, Mapping, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, overload
 
 from ._types import Text, TextId, TextMap
-from .i18n import I18n, LocaleContent, PostLocaleSelector, PreLocaleSelector
+from .i18n import I18n, LazyLocaleContent, LocaleContent, PostLocaleSelector, PreLocaleSelector
 
 if TYPE_CHECKING:
     from .translators import BaseTranslator
@@ -16,6 +18,7 @@ __all__ = [
     "PostLocaleSelector",
     "PreLocaleSelector",
     "LocaleContent",
+    "LazyLocaleContent",
     "Text",
     "TextId",
     "TextMap",
@@ -30,6 +33,9 @@ class EasyAI18n:
         func_names: str | list[str] | None = None,
         sep: str | None = None,
         locales_dir: str | Path | None = None,
+        load_jobs: int | None = None,
+        shared_catalog: str | None = None,
+        load_namespaces: Iterable[str] | None = None,
     ):
         """Set up the i18n environment.
 
@@ -42,12 +48,32 @@ class EasyAI18n:
                 a space).
             locales_dir: The directory for YAML translation files
                 (defaults to ``./i18n``).
+            load_jobs: How many worker processes parse the existing YAML
+                files in parallel during ``build``, ``watch`` and
+                ``coordinate``. Defaults to ``None`` (serial); worth
+                raising only for many large locale files. Like ``jobs``,
+                it needs an ``if __name__ == "__main__":`` guard where
+                processes are spawned (Windows, macOS). Translations
+                loaded at runtime (``i18n()``) are always parsed
+                serially, so importing a module never starts processes.
+            shared_catalog: The name of a catalog daemon started with
+                ``serve_catalog``. Instances then read its shared-memory
+                snapshot instead of parsing the YAML files, and pick up
+                new versions as the daemon publishes them. Falls back to
+                the YAML files while the daemon is not running.
+            load_namespaces: When the catalogs are sharded per
+                namespace (``build(namespaces=...)``), load only these
+                shards plus the common one, e.g. ``["billing"]`` in a
+                billing worker. Defaults to ``None`` (everything).
         """
         self.source_locale = source_locale.lower()
         self.func_names = func_names if isinstance(func_names, list) else [func_names] if func_names else ["_"]
         self.sep = sep or " "
         self.locales_dir = Path(locales_dir) if locales_dir else Path.cwd() / "i18n"
         self.locales_dir.mkdir(parents=True, exist_ok=True)
+        self.load_jobs = load_jobs
+        self.shared_catalog = shared_catalog
+        self.load_namespaces = list(load_namespaces) if load_namespaces is not None else None
 
     def build(
         self,
@@ -60,6 +86,16 @@ class EasyAI18n:
         show_progress: bool = True,
         concurrent_locales: bool = True,
         max_retries: int = 2,
+        dynamic_texts: Iterable[str] | None = None,
+        bundles: Mapping[str, Sequence[str]] | None = None,
+        bundles_dir: str | Path | None = None,
+        bundle_compress: Sequence[str] = (),
+        jobs: int | None = None,
+        extract_cache: bool = True,
+        gitignore: bool = True,
+        streaming: bool = False,
+        namespaces: Mapping[str, Sequence[str]] | None = None,
+        checkpoint: bool = True,
     ) -> None:
         """Build translation files (synchronous wrapper).
 
@@ -77,6 +113,42 @@ class EasyAI18n:
                 rate-limited free APIs.
             max_retries: Extra attempts per locale after a failure.
                 Defaults to ``2``.
+            dynamic_texts: Runtime values looked up with
+                ``_.dynamic(value)`` (e.g. labels stored in a database),
+                translated alongside the extracted strings. Pass them on
+                every build: unregistered values are removed as stale.
+            bundles: Bundle name to the file or directory patterns
+                (matched like ``include``) whose strings it contains,
+                e.g. ``{"checkout": ["web/checkout"]}``. Each bundle is
+                exported per locale as content-hashed JSON, listed in
+                ``manifest.json``; unchanged bundles are not rewritten.
+            bundles_dir: The output directory for bundles. Defaults to
+                ``locales_dir / "bundles"``.
+            bundle_compress: Precompressed bundle variants to write:
+                ``"gzip"`` and/or ``"br"`` (needs ``brotli``).
+            jobs: Worker processes for extracting strings from source
+                files. Defaults to ``None`` (serial); raise it for large
+                projects.
+            extract_cache: Whether to cache extracted strings per file
+                in ``locales_dir / ".cache"``, so later builds parse only
+                new or changed files. Defaults to ``True``.
+            gitignore: Whether to skip paths ignored by ``.gitignore``
+                and ``.ignore`` files. Defaults to ``True``.
+            streaming: Whether to start translating while source files
+                are still being scanned: new strings are sent in chunks
+                as soon as they are found, and stale keys are removed
+                once the scan completes. Defaults to ``False``.
+            namespaces: Namespace name to the file or directory
+                patterns (matched like ``include``) it covers, e.g.
+                ``{"billing": ["app/billing"]}``. Catalogs are then
+                written as ``{locale}/{namespace}.yaml`` shards (keys
+                shared across namespaces go to ``common.yaml``), and
+                only changed shards are rewritten. Defaults to ``None``
+                (one ``{locale}.yaml`` per locale).
+            checkpoint: Whether to journal translated chunks under
+                ``locales_dir / ".cache"``, so an interrupted or failed
+                build resumes without re-requesting finished items.
+                Defaults to ``True``.
         """
         return asyncio.run(
             self.build_async(
@@ -88,6 +160,16 @@ class EasyAI18n:
                 show_progress=show_progress,
                 concurrent_locales=concurrent_locales,
                 max_retries=max_retries,
+                dynamic_texts=dynamic_texts,
+                bundles=bundles,
+                bundles_dir=bundles_dir,
+                bundle_compress=bundle_compress,
+                jobs=jobs,
+                extract_cache=extract_cache,
+                gitignore=gitignore,
+                streaming=streaming,
+                namespaces=namespaces,
+                checkpoint=checkpoint,
             )
         )
 
@@ -102,6 +184,16 @@ class EasyAI18n:
         show_progress: bool = True,
         concurrent_locales: bool = True,
         max_retries: int = 2,
+        dynamic_texts: Iterable[str] | None = None,
+        bundles: Mapping[str, Sequence[str]] | None = None,
+        bundles_dir: str | Path | None = None,
+        bundle_compress: Sequence[str] = (),
+        jobs: int | None = None,
+        extract_cache: bool = True,
+        gitignore: bool = True,
+        streaming: bool = False,
+        namespaces: Mapping[str, Sequence[str]] | None = None,
+        checkpoint: bool = True,
     ) -> None:
         """Build translation files asynchronously.
 
@@ -119,6 +211,42 @@ class EasyAI18n:
                 rate-limited free APIs.
             max_retries: Extra attempts per locale after a failure.
                 Defaults to ``2``.
+            dynamic_texts: Runtime values looked up with
+                ``_.dynamic(value)`` (e.g. labels stored in a database),
+                translated alongside the extracted strings. Pass them on
+                every build: unregistered values are removed as stale.
+            bundles: Bundle name to the file or directory patterns
+                (matched like ``include``) whose strings it contains,
+                e.g. ``{"checkout": ["web/checkout"]}``. Each bundle is
+                exported per locale as content-hashed JSON, listed in
+                ``manifest.json``; unchanged bundles are not rewritten.
+            bundles_dir: The output directory for bundles. Defaults to
+                ``locales_dir / "bundles"``.
+            bundle_compress: Precompressed bundle variants to write:
+                ``"gzip"`` and/or ``"br"`` (needs ``brotli``).
+            jobs: Worker processes for extracting strings from source
+                files. Defaults to ``None`` (serial); raise it for large
+                projects.
+            extract_cache: Whether to cache extracted strings per file
+                in ``locales_dir / ".cache"``, so later builds parse only
+                new or changed files. Defaults to ``True``.
+            gitignore: Whether to skip paths ignored by ``.gitignore``
+                and ``.ignore`` files. Defaults to ``True``.
+            streaming: Whether to start translating while source files
+                are still being scanned: new strings are sent in chunks
+                as soon as they are found, and stale keys are removed
+                once the scan completes. Defaults to ``False``.
+            namespaces: Namespace name to the file or directory
+                patterns (matched like ``include``) it covers, e.g.
+                ``{"billing": ["app/billing"]}``. Catalogs are then
+                written as ``{locale}/{namespace}.yaml`` shards (keys
+                shared across namespaces go to ``common.yaml``), and
+                only changed shards are rewritten. Defaults to ``None``
+                (one ``{locale}.yaml`` per locale).
+            checkpoint: Whether to journal translated chunks under
+                ``locales_dir / ".cache"``, so an interrupted or failed
+                build resumes without re-requesting finished items.
+                Defaults to ``True``.
         """
         from ._builder import Builder
 
@@ -135,9 +263,266 @@ class EasyAI18n:
             show_progress=show_progress,
             concurrent_locales=concurrent_locales,
             max_retries=max_retries,
+            load_jobs=self.load_jobs,
+            dynamic_texts=dynamic_texts,
+            bundles=bundles,
+            bundles_dir=Path(bundles_dir) if bundles_dir else None,
+            bundle_compress=bundle_compress,
+            jobs=jobs,
+            extract_cache=extract_cache,
+            gitignore=gitignore,
+            streaming=streaming,
+            namespaces=namespaces,
+            checkpoint=checkpoint,
         )
         await builder.run()
 
+    def watch(
+        self,
+        to_locales: str | list[str],
+        *,
+        project_root: str | Path | None = None,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        translator: BaseTranslator | None = None,
+        show_progress: bool = True,
+        concurrent_locales: bool = True,
+        max_retries: int = 2,
+        dynamic_texts: Iterable[str] | None = None,
+        bundles: Mapping[str, Sequence[str]] | None = None,
+        bundles_dir: str | Path | None = None,
+        bundle_compress: Sequence[str] = (),
+        jobs: int | None = None,
+        extract_cache: bool = True,
+        gitignore: bool = True,
+        namespaces: Mapping[str, Sequence[str]] | None = None,
+        checkpoint: bool = True,
+        poll_interval: float = 1.0,
+        debounce: float = 0.3,
+        stop: threading.Event | None = None,
+    ) -> None:
+        """Build, then rebuild incrementally whenever sources or catalogs change (blocking).
+
+        Meant for development: one builder stays resident, so each edit
+        re-parses only the changed files, translates only the new keys
+        and rewrites only the catalogs that changed. The options match
+        ``build``.
+
+        Args:
+            to_locales: The target language codes to translate to.
+            project_root: The project root directory.
+            include: File or directory patterns to include.
+            exclude: File or directory patterns to exclude.
+            translator: The translator instance. Defaults to
+                ``GoogleTranslator``.
+            show_progress: Whether to display progress.
+            concurrent_locales: Whether to translate all locales in
+                parallel.
+            max_retries: Extra attempts per locale after a failure.
+            dynamic_texts: Runtime values looked up with
+                ``_.dynamic(value)``.
+            bundles: Bundle name to the file or directory patterns
+                whose strings it contains; re-exported after each
+                rebuild.
+            bundles_dir: The output directory for bundles.
+            bundle_compress: Precompressed bundle variants to write:
+                ``"gzip"`` and/or ``"br"`` (needs ``brotli``).
+            jobs: Worker processes for the initial extraction.
+            extract_cache: Whether the initial extraction uses and
+                updates the per-file cache in ``locales_dir / ".cache"``.
+            gitignore: Whether to skip paths ignored by ``.gitignore``
+                and ``.ignore`` files.
+            namespaces: Namespace name to the patterns it covers; the
+                catalogs are written as per-namespace shards.
+            checkpoint: Whether to journal translated chunks, so an
+                interrupted rebuild resumes without re-requesting them.
+            poll_interval: Seconds between checks for changes.
+            debounce: Seconds without further changes before a burst
+                of edits is rebuilt.
+            stop: Set this event to stop watching; defaults to watching
+                until the process exits.
+        """
+        from ._builder import Builder
+
+        builder = Builder(
+            to_locales=[to_locales] if isinstance(to_locales, str) else to_locales,
+            sep=self.sep,
+            func_names=self.func_names,
+            project_root=Path(project_root) if project_root else None,
+            locales_dir=self.locales_dir,
+            include=include,
+            exclude=exclude,
+            translator=translator,
+            source_locale=self.source_locale,
+            show_progress=show_progress,
+            concurrent_locales=concurrent_locales,
+            max_retries=max_retries,
+            load_jobs=self.load_jobs,
+            dynamic_texts=dynamic_texts,
+            bundles=bundles,
+            bundles_dir=Path(bundles_dir) if bundles_dir else None,
+            bundle_compress=bundle_compress,
+            jobs=jobs,
+            extract_cache=extract_cache,
+            gitignore=gitignore,
+            namespaces=namespaces,
+            checkpoint=checkpoint,
+        )
+        asyncio.run(builder.watch(poll_interval=poll_interval, debounce=debounce, stop=stop))
+
+    def coordinate(
+        self,
+        to_locales: str | list[str],
+        *,
+        project_root: str | Path | None = None,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        dynamic_texts: Iterable[str] | None = None,
+        jobs: int | None = None,
+        gitignore: bool = True,
+        namespaces: Mapping[str, Sequence[str]] | None = None,
+        chunk_size: int = 100,
+        local_workers: Sequence[BaseTranslator] = (),
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        poll_interval: float = 1.0,
+        stop: threading.Event | None = None,
+    ) -> bool:
+        """Run a distributed build: plan work units, wait for workers, merge their results (blocking).
+
+        The missing translations are split per locale into units of
+        ``chunk_size`` entries, queued in ``locales_dir / ".cache"``.
+        Workers started with ``work`` (in other processes, or on other
+        machines sharing ``locales_dir``) translate them; each locale is
+        written once all of its units are done. Restarting the
+        coordinator keeps the units already finished.
+
+        Args:
+            to_locales: The target language codes to translate to.
+            project_root: The project root directory.
+            include: File or directory patterns to include.
+            exclude: File or directory patterns to exclude.
+            dynamic_texts: Runtime values looked up with
+                ``_.dynamic(value)``.
+            jobs: Worker processes for extracting strings.
+            gitignore: Whether to skip paths ignored by ``.gitignore``
+                and ``.ignore`` files.
+            namespaces: Namespace name to the patterns it covers; the
+                catalogs are written as per-namespace shards.
+            chunk_size: Entries per work unit. Defaults to ``100``.
+            local_workers: Translators to run as workers inside this
+                process as well.
+            lease_seconds: The lease of the local workers.
+            max_attempts: Failed attempts after which a unit (and its
+                locale) is given up. Defaults to ``3``.
+            poll_interval: Seconds between checks for finished units.
+            stop: Set this event to stop waiting; finished units stay
+                queued for the next run.
+
+        Returns:
+            ``True`` when every target locale was merged.
+        """
+        from ._builder import Builder
+        from ._coordinator import QUEUE_FILE, WorkQueue
+
+        builder = Builder(
+            to_locales=[to_locales] if isinstance(to_locales, str) else to_locales,
+            sep=self.sep,
+            func_names=self.func_names,
+            project_root=Path(project_root) if project_root else None,
+            locales_dir=self.locales_dir,
+            include=include,
+            exclude=exclude,
+            source_locale=self.source_locale,
+            load_jobs=self.load_jobs,
+            dynamic_texts=dynamic_texts,
+            jobs=jobs,
+            gitignore=gitignore,
+            namespaces=namespaces,
+        )
+        queue = WorkQueue(self.locales_dir / ".cache" / QUEUE_FILE, max_attempts=max_attempts)
+        try:
+            return asyncio.run(
+                builder.coordinate(
+                    queue,
+                    chunk_size=chunk_size,
+                    poll_interval=poll_interval,
+                    local_workers=local_workers,
+                    lease_seconds=lease_seconds,
+                    stop=stop,
+                )
+            )
+        finally:
+            queue.close()
+
+    def work(
+        self,
+        translator: BaseTranslator,
+        *,
+        worker_id: str | None = None,
+        lease_seconds: float = 300.0,
+        poll_interval: float = 1.0,
+        wait: bool = False,
+        stop: threading.Event | None = None,
+    ) -> int:
+        """Translate work units planned by ``coordinate`` until none are left (blocking).
+
+        Run any number of workers, each with its own translator (and API
+        key or rate limit). A unit whose worker dies is handed out again
+        once its lease expires.
+
+        Args:
+            translator: This worker's translator.
+            worker_id: A name for this worker in leases and logs;
+                defaults to ``host:pid``.
+            lease_seconds: How long this worker may hold a unit before
+                another one takes it over. Keep it well above the time
+                one unit takes to translate.
+            poll_interval: Seconds between checks while the remaining
+                units are leased by other workers.
+            wait: Keep waiting on an empty queue for the coordinator to
+                plan units, instead of returning. Defaults to ``False``.
+            stop: Set this event to stop after the current unit.
+
+        Returns:
+            The number of units this worker completed.
+        """
+        from ._coordinator import QUEUE_FILE, WorkQueue, run_worker
+
+        queue = WorkQueue(self.locales_dir / ".cache" / QUEUE_FILE)
+        try:
+            return asyncio.run(
+                run_worker(
+                    queue,
+                    translator,
+                    worker_id=worker_id,
+                    lease_seconds=lease_seconds,
+                    poll_interval=poll_interval,
+                    wait=wait,
+                    stop=stop,
+                )
+            )
+        finally:
+            queue.close()
+
+    def serve_catalog(self, name: str, *, poll_interval: float = 1.0, stop: threading.Event | None = None) -> None:
+        """Run a catalog daemon for worker processes on this host (blocking).
+
+        Parses the YAML files once and publishes them to shared memory
+        under ``name``, republishing whenever a file changes. Workers
+        created with ``EasyAI18n(..., shared_catalog=name)`` attach to
+        the snapshot instead of each parsing and holding its own copy.
+
+        Args:
+            name: The shared-memory name workers attach to.
+            poll_interval: Seconds between checks for changed files.
+            stop: Set this event to stop serving; defaults to serving
+                until the process exits.
+        """
+        from ._shared import CatalogPublisher
+
+        CatalogPublisher(self.locales_dir, name).serve_forever(poll_interval, stop)
+
     @overload
     def i18n(
         self,
@@ -145,6 +530,7 @@ class EasyAI18n:
         *,
         pre_locale_selector: None = None,
         post_locale_selector: None = None,
+        log_locale: str | None = None,
     ) -> I18n[str | None]: ...
 
     @overload
@@ -154,6 +540,7 @@ class EasyAI18n:
         *,
         pre_locale_selector: type[PreLocaleSelector[L]] | None = None,
         post_locale_selector: type[PostLocaleSelector[L]],
+        log_locale: str | None = None,
     ) -> I18n[L]: ...
 
     def i18n[L](
@@ -162,6 +549,7 @@ class EasyAI18n:
         *,
         pre_locale_selector: type[PreLocaleSelector[L]] | None = None,
         post_locale_selector: type[PostLocaleSelector[L]] | None = None,
+        log_locale: str | None = None,
     ) -> I18n[L]:
         """Create an ``I18n`` instance for translation.
 
@@ -170,6 +558,8 @@ class EasyAI18n:
                 the ``source_locale`` set on ``EasyAI18n``.
             pre_locale_selector: The pre-call locale selector class.
             post_locale_selector: The post-call locale selector class.
+            log_locale: The locale ``_.log(...)`` messages are rendered
+                in. Defaults to the ``source_locale``.
 
         Returns:
             An ``I18n`` instance.
@@ -182,4 +572,7 @@ class EasyAI18n:
             func_names=self.func_names,
             pre_locale_selector=pre_locale_selector,
             post_locale_selector=post_locale_selector,
+            shared_catalog=self.shared_catalog,
+            load_namespaces=self.load_namespaces,
+            log_locale=log_locale,
         )
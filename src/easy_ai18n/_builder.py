@@ -2,19 +2,35 @@ from __future__ import annotations
 
 import ast
 import asyncio
-import os
+import inspect
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
-import yaml
 from loguru import logger
 
-from ._loader import Loader
-from ._parser import ASTParser
+from ._bundles import Manifest, write_bundles
+from ._catalog import reload_catalog
+from ._coordinator import WorkQueue, default_worker_id, run_worker
+from ._extract_cache import ExtractionCache, file_digest
+from ._journal import TranslationJournal
+from ._loader import DEFAULT_NAMESPACE, Loader, catalog_files, dump_locale_file, dump_locale_shards
+from ._message import is_message
+from ._parser import ASTParser, candidate_lines
 from ._progress import ProgressHandle, translation_progress
-from ._types import TextId, TextMap
-from .errors import TranslationError
-from .translators import BaseTranslator, GoogleTranslator
+from ._scanner import PathMatcher, scan_project
+from ._types import Text, TextId, TextMap
+from .errors import EasyAI18nError, TranslationError
+from .translators import BaseTranslator, GoogleTranslator, _mask, _restore, _translate_messages
+
+_STREAM_CHUNK = 100
+"""Entries per translation chunk in a streaming build."""
+
+_STREAM_QUEUE = 64
+"""Extracted files buffered between the scan and the translation dispatch."""
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -36,6 +52,29 @@ class _SourceEntry:
     """The placeholder tokens in first-occurrence order."""
 
 
+def _parse_source_file(file: Path, sep: str, func_names: list[str]) -> list[_SourceEntry]:
+    """Read and parse one file into source entries (AST objects dropped).
+
+    Module-level so extraction workers can run it in other processes.
+    A token prefilter skips ``ast.parse`` for files that never mention
+    a translation function, and limits the AST walk to the statements
+    that do.
+    """
+    source = file.read_text(encoding="utf-8")
+    lines = candidate_lines(source, func_names)
+    if not lines:
+        return []
+    module = ast.parse(source)
+    parser = ASTParser(sep=sep, func_names=func_names)
+    entries: list[_SourceEntry] = []
+    for string_data in parser.extract_all(node=module, source_path=file, source=source, lines=lines):
+        text = str(string_data.string)
+        if not text:
+            continue
+        entries.append(_SourceEntry(id=string_data.string.id, text=text, placeholders=tuple(string_data.variables)))
+    return entries
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class _Changes:
     """What a build must do, expressed as pure set differences.
@@ -64,27 +103,6 @@ class _LocaleOutcome:
     error: str | None
 
 
-# Placeholder masking: translators receive ``\uE000<i>\uE001`` instead of
-# the real ``{variable}`` tokens, so a variable name can never collide
-# with the marker (the old ``{{i}}`` scheme could be corrupted by a
-# literal ``{{0}}`` in the source) and translation cannot mangle it.
-# The markers are restored after translation.
-_MASK_START = "\ue000"
-_MASK_END = "\ue001"
-
-
-def _mask(text: str, placeholders: tuple[str, ...]) -> str:
-    for i, placeholder in enumerate(placeholders):
-        text = text.replace(placeholder, f"{_MASK_START}{i}{_MASK_END}")
-    return text
-
-
-def _restore(text: str, placeholders: tuple[str, ...]) -> str:
-    for i, placeholder in enumerate(placeholders):
-        text = text.replace(f"{_MASK_START}{i}{_MASK_END}", placeholder)
-    return text
-
-
 class Builder:
     def __init__(
         self,
@@ -101,6 +119,17 @@ class Builder:
         show_progress: bool = True,
         concurrent_locales: bool = True,
         max_retries: int = 2,
+        load_jobs: int | None = None,
+        dynamic_texts: Iterable[str] | None = None,
+        bundles: Mapping[str, Sequence[str]] | None = None,
+        bundles_dir: Path | None = None,
+        bundle_compress: Sequence[str] = (),
+        jobs: int | None = None,
+        extract_cache: bool = True,
+        gitignore: bool = True,
+        streaming: bool = False,
+        namespaces: Mapping[str, Sequence[str]] | None = None,
+        checkpoint: bool = True,
     ):
         """Set up the translation build pipeline.
 
@@ -132,12 +161,50 @@ class Builder:
                 free APIs.
             max_retries: How many extra attempts a locale gets after a
                 translation failure. Defaults to ``2``.
+            load_jobs: Worker processes for parsing the existing YAML
+                files. Defaults to ``None`` (serial).
+            dynamic_texts: Runtime values looked up by content with
+                ``_.dynamic(value)``; they are added to the extracted
+                entries as plain texts without placeholders.
+            bundles: Bundle name to the file or directory patterns
+                (matched like ``include``) whose strings it contains.
+                Each bundle is exported per locale as content-hashed
+                JSON for frontend clients (see ``export_bundles``).
+            bundles_dir: The output directory for bundles. Defaults to
+                ``locales_dir / "bundles"``.
+            bundle_compress: Precompressed bundle variants to write:
+                ``"gzip"`` and/or ``"br"``.
+            jobs: Worker processes for parsing source files. ``None``
+                or ``1`` (default) parses serially. Results are merged
+                in file order either way, so the output is identical.
+            extract_cache: Whether to keep a persistent extraction
+                cache in ``locales_dir / ".cache"``, so only new or
+                changed files are parsed. Defaults to ``True``.
+            gitignore: Whether paths ignored by ``.gitignore`` and
+                ``.ignore`` files (and ``.git/info/exclude``) are
+                skipped. Defaults to ``True``.
+            streaming: Whether ``run`` translates while extracting,
+                dispatching each locale's translation chunks as soon as
+                they fill up instead of after the whole scan. Defaults
+                to ``False``.
+            namespaces: Namespace name to the file or directory patterns
+                (matched like ``include``) it covers. When set, each
+                locale is written as ``{locale}/{namespace}.yaml``
+                shards: a key goes to the namespace of the files using
+                it, or to the ``common`` shard when files of several
+                namespaces (or none) use it. Only shards whose content
+                changed are rewritten.
+            checkpoint: Whether to journal each translated chunk in
+                ``locales_dir / ".cache" / "journal"``, so a build that
+                crashes, is interrupted or runs out of retries resumes
+                without re-requesting finished items. Defaults to
+                ``True``.
         """
         self.project_root = Path(project_root) if project_root else Path.cwd()
         self.locales_dir = Path(locales_dir)
         self.include = include or []
         self.exclude = exclude or []
-        self.default_exclude = [".venv", "venv", ".git", ".idea"]
+        self.default_exclude = [".venv", "venv", ".git", ".idea", "node_modules", "__pycache__"]
         self.func_names = func_names
         self.sep = sep
         self.source_locale = source_locale.lower()
@@ -149,20 +216,40 @@ class Builder:
         self.show_progress = show_progress
         self.concurrent_locales = concurrent_locales
         self.max_retries = max(0, max_retries)
+        self.dynamic_texts = list(dict.fromkeys(dynamic_texts or ()))
+        self.bundles = {name: list(patterns) for name, patterns in (bundles or {}).items()}
+        self.bundles_dir = Path(bundles_dir) if bundles_dir else self.locales_dir / "bundles"
+        self.bundle_compress = tuple(bundle_compress)
+        self.jobs = jobs
+        self.extract_cache = extract_cache
+        self.gitignore = gitignore
+        self.streaming = streaming
+        self.namespaces = {name: list(patterns) for name, patterns in namespaces.items()} if namespaces else None
+        self._journal = TranslationJournal(self.locales_dir / ".cache") if checkpoint else None
 
         self.project_files = self.load_file()
-        self._locales = Loader(self.locales_dir).load_locales_file(self.to_locales)
+        self._locales = Loader(self.locales_dir, jobs=load_jobs).load_locales_file(self.to_locales)
         self._entries: dict[TextId, _SourceEntry] | None = None
+        self._file_ids: dict[Path, tuple[TextId, ...]] = {}
+        self._by_file: dict[Path, list[_SourceEntry]] = {}
 
     # ── Orchestration ────────────────────────────────────────────
 
     async def run(self) -> None:
         """Build only when something changed; skip the network otherwise."""
+        if self.streaming:
+            await self._run_streaming()
+            if self.bundles:
+                self.export_bundles()
+            return
         changes = self.compute_changes()
         if changes.is_empty:
             logger.info("Content unchanged, skipping build")
-            return
-        await self._build(changes)
+            self._reshard()
+        else:
+            await self._build(changes)
+        if self.bundles:
+            self.export_bundles()
 
     async def build(self, save_to_file: bool = True) -> bool:
         """Build the translation dictionaries.
@@ -183,25 +270,34 @@ class Builder:
         errors: dict[str, str] = {}
 
         async with translation_progress(locale_totals, show_progress=self.show_progress) as handle:
+
+            async def translate(locale: str, entries: tuple[_SourceEntry, ...]) -> _LocaleOutcome:
+                outcome = await self._translate_with_retries(
+                    locale,
+                    entries,
+                    handle,
+                    live=True,
+                    on_success=lambda attempt: handle.succeed(locale, completed=len(entries) if attempt > 0 else None),
+                )
+                if outcome.result is None:
+                    handle.fail(locale)
+                else:
+                    locales[locale] = {**locales.get(locale, {}), **outcome.result}
+                    # Publish each locale as soon as it completes, not after the slowest one.
+                    if save_to_file:
+                        self._publish(locale, locales[locale])
+                return outcome
+
             if self.concurrent_locales:
                 outcomes = await asyncio.gather(
-                    *(
-                        self._translate_with_retries(locale, entries, handle)
-                        for locale, entries in changes.to_translate.items()
-                    )
+                    *(translate(locale, entries) for locale, entries in changes.to_translate.items())
                 )
             else:
-                outcomes = [
-                    await self._translate_with_retries(locale, entries, handle)
-                    for locale, entries in changes.to_translate.items()
-                ]
+                outcomes = [await translate(locale, entries) for locale, entries in changes.to_translate.items()]
 
             for locale, outcome in zip(changes.to_translate, outcomes, strict=True):
                 if outcome.result is None:
                     errors[locale] = outcome.error or "unknown error"
-                    continue
-                current = locales.get(locale, {})
-                locales[locale] = {**current, **outcome.result}
             handle.finish(ok=not errors)
 
         # Key deltas: added = newly translated keys (0 when the locale
@@ -214,15 +310,359 @@ class Builder:
         handle.report_stats(added=added, removed=removed)
         handle.report_errors(errors)
 
+        self._persist(locales, save_to_file=save_to_file)
+        return not errors
+
+    def _publish(self, locale: str, texts: TextMap) -> None:
+        """Write one finished locale right away and drop its journal.
+
+        ``_persist`` later skips it, since the written content becomes
+        the locale's current state.
+        """
+        self.save_to_yaml(texts, locale)
+        self._locales = {**self._locales, locale: texts}
+        if self._journal is not None:
+            self._journal.clear(locale)
+
+    def _persist(self, locales: dict[str, TextMap], *, save_to_file: bool = True) -> None:
+        """Write the locales that changed and adopt ``locales`` as the current state."""
         if save_to_file:
             for locale in self.to_locales:
                 merged = locales[locale]
-                if merged != self._locales.get(locale):
+                # Shards are written whenever namespaces are set: keys
+                # may have moved between shards without any text changing.
+                if merged != self._locales.get(locale) or self.namespaces is not None:
                     self.save_to_yaml(merged, locale)
+            # Running ``I18n`` views share the process-wide catalog;
+            # refresh it so they see what was just written.
+            reload_catalog(self.locales_dir)
         # The in-memory view must reflect what was just built, or the
         # next compute_changes (e.g. a second ``run``) would re-translate
         # everything it already persisted.
         self._locales = locales
+
+    # ── Streaming ────────────────────────────────────────────────
+
+    async def _run_streaming(self) -> bool:
+        """Translate while extracting: entries flow from the scan straight into translation chunks.
+
+        A worker thread runs extraction (parsing across ``jobs``
+        processes) and feeds ``(file, entries)`` through a bounded
+        queue. Each entry seen for the first time is diffed against
+        every target locale, and a locale's chunk is dispatched as soon
+        as it holds ``_STREAM_CHUNK`` entries. Stale keys are only
+        known once the scan completes, so they are removed last.
+
+        A locale whose chunk fails for good is not sent further chunks;
+        the chunks it already completed are kept.
+
+        Returns:
+            ``True`` when every target locale was translated.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[tuple[Path, list[_SourceEntry]] | None] = asyncio.Queue(maxsize=_STREAM_QUEUE)
+        stop = threading.Event()
+        scan_error: list[BaseException] = []
+
+        def produce() -> None:
+            try:
+                for item in self._iter_extracted():
+                    if stop.is_set():
+                        return
+                    asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+            except BaseException as e:
+                scan_error.append(e)
+            finally:
+                if not stop.is_set():
+                    asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+
+        pending: dict[str, list[_SourceEntry]] = {locale: [] for locale in self.to_locales}
+        translated: dict[str, TextMap] = {locale: {} for locale in self.to_locales}
+        errors: dict[str, str] = {}
+        tasks: list[asyncio.Task[None]] = []
+        shared = asyncio.Semaphore(1)
+        limiters = {
+            locale: shared if not self.concurrent_locales else asyncio.Semaphore(1) for locale in self.to_locales
+        }
+        by_file: dict[Path, list[_SourceEntry]] = {}
+        seen: set[TextId] = set()
+
+        async with translation_progress(
+            dict.fromkeys(self.to_locales, 0), show_progress=self.show_progress, streaming=True
+        ) as handle:
+
+            async def translate_chunk(locale: str, chunk: tuple[_SourceEntry, ...]) -> None:
+                async with limiters[locale]:
+                    if locale in errors:
+                        return
+                    outcome = await self._translate_with_retries(
+                        locale, chunk, handle, on_success=lambda _: handle.advance(locale, len(chunk))
+                    )
+                if outcome.result is None:
+                    if locale not in errors:
+                        errors[locale] = outcome.error or "unknown error"
+                        handle.fail(locale)
+                    return
+                translated[locale].update(outcome.result)
+
+            def dispatch(locale: str) -> None:
+                chunk = tuple(pending[locale])
+                pending[locale].clear()
+                if chunk and locale not in errors:
+                    handle.extend(locale, len(chunk))
+                    tasks.append(asyncio.create_task(translate_chunk(locale, chunk)))
+
+            def diff(entries: Iterable[_SourceEntry]) -> None:
+                for entry in entries:
+                    if entry.id in seen:
+                        continue
+                    seen.add(entry.id)
+                    for locale in self.to_locales:
+                        if entry.id not in self._locales.get(locale, {}):
+                            pending[locale].append(entry)
+                            if len(pending[locale]) >= _STREAM_CHUNK:
+                                dispatch(locale)
+
+            producer = loop.run_in_executor(None, produce)
+            try:
+                while (item := await queue.get()) is not None:
+                    file, file_entries = item
+                    by_file[file] = file_entries
+                    diff(file_entries)
+                await producer
+                if scan_error:
+                    raise scan_error[0]
+                diff(self._dynamic_entries())
+                for locale in self.to_locales:
+                    dispatch(locale)
+                await asyncio.gather(*tasks)
+            except BaseException:
+                stop.set()
+                for task in tasks:
+                    task.cancel()
+                while not producer.done():  # unblock a producer waiting on a full queue
+                    while not queue.empty():
+                        queue.get_nowait()
+                    await asyncio.sleep(0.01)
+                raise
+            for locale in self.to_locales:
+                if locale not in errors:
+                    handle.succeed(locale)
+            handle.finish(ok=not errors)
+
+        entries = self._merge_entries(by_file)
+        changes = self._changes_from(entries, missing=False)
+        locales = self._locales_clean(changes)
+        for locale, result in translated.items():
+            if result:
+                locales[locale] = {**locales[locale], **result}
+        added = {locale: len(result) for locale, result in translated.items() if result}
+        removed = {locale: len(ids) for locale, ids in changes.stale.items()}
+        handle.report_stats(added=added, removed=removed)
+        handle.report_errors(errors)
+        if not added and not removed:
+            logger.info("Content unchanged, skipping build")
+            self._reshard()
+            return not errors
+        self._persist(locales)
+        if self._journal is not None:
+            for locale in self.to_locales:
+                if locale not in errors:
+                    self._journal.clear(locale)
+        return not errors
+
+    # ── Watch mode ───────────────────────────────────────────────
+
+    async def watch(
+        self,
+        *,
+        poll_interval: float = 1.0,
+        debounce: float = 0.3,
+        stop: threading.Event | None = None,
+    ) -> None:
+        """Build, then stay resident and rebuild incrementally on every change until ``stop`` is set.
+
+        The project and ``locales_dir`` are polled by ``(mtime, size)``.
+        A burst of edits is folded into one rebuild once nothing has
+        changed for ``debounce`` seconds. Only the changed files are
+        re-parsed, only the new keys are translated, and only the
+        catalogs whose content changed are rewritten. A catalog edited
+        by hand is reloaded, so a deleted translation is filled in again.
+
+        A file that fails to parse is reported and keeps its previous
+        strings until it is fixed.
+
+        Args:
+            poll_interval: Seconds between checks for changes.
+            debounce: Seconds without further changes before rebuilding.
+            stop: Set this event to stop watching; defaults to watching
+                until the process exits.
+        """
+        stop = stop or threading.Event()
+        # Stat before the first build: an edit made during it is picked up by the first poll.
+        sources = self._source_stats()
+        await self.run()
+        catalogs = self._catalog_stats()
+        broken: dict[str, tuple[tuple[str, int, int], ...]] | None = None
+        logger.info(f"Watching {self.project_root} ({len(sources)} files) for changes")
+        while not await asyncio.to_thread(stop.wait, poll_interval):
+            current = self._source_stats()
+            if current == sources and self._catalog_stats() == catalogs:
+                continue
+            # Debounce: wait until the tree stops changing.
+            while not await asyncio.to_thread(stop.wait, debounce):
+                settled = self._source_stats()
+                if settled == current:
+                    break
+                current = settled
+            if stop.is_set():
+                break
+
+            edited = self._catalog_stats()
+            reloaded = [locale for locale in self.to_locales if edited.get(locale) != catalogs.get(locale)]
+            if reloaded:
+                try:
+                    fresh = Loader(self.locales_dir).load_locales_file(reloaded)
+                except ValueError as e:
+                    # A file mid-edit: retry on the next poll, and never
+                    # overwrite it by building in the meantime.
+                    if edited != broken:
+                        logger.error(f"Catalogs not reloaded: {e}")
+                    broken = edited
+                    continue
+                self._locales = {**self._locales, **{locale: fresh.get(locale, {}) for locale in reloaded}}
+                logger.info(f"Reloaded edited catalogs: {', '.join(reloaded)}")
+            self._apply_source_changes(sources, current)
+            sources = current
+
+            changes = self.compute_changes()
+            if not changes.is_empty:
+                await self._build(changes)
+            if self.bundles:
+                self.export_bundles()
+            catalogs = self._catalog_stats()
+
+    def _apply_source_changes(self, before: dict[Path, tuple[int, int]], after: dict[Path, tuple[int, int]]) -> None:
+        """Re-parse the files whose stat changed and re-merge the entries."""
+        changed = [file for file, stat in after.items() if before.get(file) != stat]
+        removed = before.keys() - after.keys()
+        if changed or removed:
+            logger.info(f"Source changes: {len(changed)} changed, {len(removed)} removed")
+        by_file = {file: entries for file, entries in self._by_file.items() if file in after}
+        for file in changed:
+            try:
+                by_file[file] = self._parse_file(file)
+            except (SyntaxError, ValueError, OSError, EasyAI18nError) as e:
+                logger.error(f"Skipping {file} until it is fixed: {e}")
+                by_file.setdefault(file, [])
+        self.project_files = list(after)
+        self._merge_entries(by_file)
+
+    def _source_stats(self) -> dict[Path, tuple[int, int]]:
+        """``(mtime_ns, size)`` of every project file, rescanning the tree."""
+        stats: dict[Path, tuple[int, int]] = {}
+        for file in self.load_file():
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            stats[file] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def _catalog_stats(self) -> dict[str, tuple[tuple[str, int, int], ...]]:
+        """``(file, mtime_ns, size)`` of each target locale's catalog files (flat or sharded)."""
+        stats: dict[str, list[tuple[str, int, int]]] = {}
+        for locale, _, file in catalog_files(self.locales_dir, self.to_locales):
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            stats.setdefault(locale, []).append((str(file), stat.st_mtime_ns, stat.st_size))
+        return {locale: tuple(files) for locale, files in stats.items()}
+
+    # ── Distributed builds ───────────────────────────────────────
+
+    async def coordinate(
+        self,
+        queue: WorkQueue,
+        *,
+        chunk_size: int = _STREAM_CHUNK,
+        poll_interval: float = 1.0,
+        local_workers: Sequence[BaseTranslator] = (),
+        lease_seconds: float = 300.0,
+        stop: threading.Event | None = None,
+    ) -> bool:
+        """Plan the missing translations as work units, then merge what workers return.
+
+        Each locale is written once all of its units are done, and its
+        units are deleted right after, so a result is merged only once.
+        A locale whose units failed ``queue.max_attempts`` times is left
+        untouched; its finished units are kept for the next run.
+
+        Args:
+            queue: The shared queue workers lease units from.
+            chunk_size: Entries per work unit.
+            poll_interval: Seconds between checks for finished units.
+            local_workers: Translators to run as workers in this
+                process, alongside any external ones.
+            lease_seconds: The lease of the local workers.
+            stop: Set this event to stop waiting; unmerged units stay
+                in the queue for the next run.
+
+        Returns:
+            ``True`` when every target locale was merged.
+        """
+        stop = stop or threading.Event()
+        changes = self.compute_changes()
+        entries = self.extract_entries()
+        locales = self._locales_clean(changes)
+        planned = queue.plan(
+            self.source_locale,
+            {
+                locale: [(entry.id, entry.text, entry.placeholders) for entry in locale_entries]
+                for locale, locale_entries in changes.to_translate.items()
+            },
+            chunk_size=chunk_size,
+        )
+        waiting = {locale for locale in queue.progress() if locale in self.to_locales}
+        logger.info(f"Planned {planned} work unit(s) for {len(waiting)} locale(s)")
+
+        workers = [
+            asyncio.create_task(
+                run_worker(queue, translator, worker_id=f"{default_worker_id()}:{i}", lease_seconds=lease_seconds)
+            )
+            for i, translator in enumerate(local_workers)
+        ]
+        errors: dict[str, str] = {}
+        try:
+            while waiting:
+                progress = queue.progress()
+                for locale in sorted(waiting):
+                    counts = progress.get(locale, {})
+                    if counts.get("pending") or counts.get("leased"):
+                        continue
+                    waiting.discard(locale)
+                    if counts.get("failed"):
+                        errors[locale] = "; ".join(queue.errors(locale))
+                        continue
+                    results = {i: text for i, text in queue.results(locale).items() if i in entries}
+                    locales[locale] = {**locales[locale], **results}
+                    self._publish(locale, locales[locale])
+                    queue.retire(locale)
+                    logger.info(f"Merged {len(results)} translation(s) into {locale}")
+                if not waiting or await asyncio.to_thread(stop.wait, poll_interval):
+                    break
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        for locale, error in errors.items():
+            logger.error(f"Translation to {locale} failed: {error}")
+        if stop.is_set() and waiting:
+            logger.warning(f"Stopped with unmerged locales: {', '.join(sorted(waiting))}")
+            return False
+        self._persist(locales)
         return not errors
 
     # ── Diffing ──────────────────────────────────────────────────
@@ -236,18 +676,29 @@ class Builder:
         Returns:
             The set differences to apply, as a ``_Changes``.
         """
-        entries = self.extract_entries()
+        return self._changes_from(self.extract_entries())
+
+    def _changes_from(self, entries: dict[TextId, _SourceEntry], *, missing: bool = True) -> _Changes:
+        """Diff ``entries`` against the existing translations.
+
+        Args:
+            entries: The source entries.
+            missing: Whether to collect the missing IDs; a streaming
+                build has already dispatched them and only needs the
+                stale ones.
+        """
         entry_ids = set(entries)
         to_translate: dict[str, tuple[_SourceEntry, ...]] = {}
         stale: dict[str, frozenset[TextId]] = {}
         for locale in self.to_locales:
             current = self._locales.get(locale)
             if current is None:
-                to_translate[locale] = tuple(entries[i] for i in sorted(entries))
+                if missing:
+                    to_translate[locale] = tuple(entries[i] for i in sorted(entries))
                 continue
-            missing = entry_ids - set(current)
-            if missing:
-                to_translate[locale] = tuple(entries[i] for i in sorted(missing))
+            missing_ids = entry_ids - set(current) if missing else None
+            if missing_ids:
+                to_translate[locale] = tuple(entries[i] for i in sorted(missing_ids))
             gone = set(current) - entry_ids
             if gone:
                 stale[locale] = frozenset(gone)
@@ -280,18 +731,32 @@ class Builder:
         locale: str,
         entries: tuple[_SourceEntry, ...],
         handle: ProgressHandle,
+        *,
+        on_success: Callable[[int], None],
+        live: bool = False,
     ) -> _LocaleOutcome:
-        """Translate one locale, retrying silently up to ``max_retries`` times.
+        """Translate ``entries`` for one locale, retrying up to ``max_retries`` times.
+
+        Args:
+            locale: The target locale.
+            entries: The entries to translate.
+            handle: Receives the retry notices, and the first attempt's
+                progress when ``live`` is set.
+            on_success: Called with the index of the attempt that
+                succeeded, to settle the progress for ``entries``.
+            live: Whether the first attempt reports progress item by
+                item. Retries always run against a no-op handle, so
+                progress is never double-counted.
 
-        The first attempt reports progress through ``handle``; retries
-        run against a no-op handle so progress is never double-counted,
-        and the child task is topped up on success.
+        Returns:
+            The translations, or the last error once every attempt failed.
         """
         attempts = self.max_retries + 1
         last_error: Exception | None = None
         for attempt in range(attempts):
             try:
-                result = await self._translate_locale(locale, entries, handle if attempt == 0 else ProgressHandle())
+                progress = handle if live and attempt == 0 else ProgressHandle()
+                result = await self._translate_locale(locale, entries, progress)
             except Exception as e:
                 last_error = e
                 if isinstance(e, TranslationError):
@@ -303,9 +768,8 @@ class Builder:
                 if attempt < attempts - 1:
                     handle.retrying(locale)
                 continue
-            handle.succeed(locale, completed=len(entries) if attempt > 0 else None)
+            on_success(attempt)
             return _LocaleOutcome(result=result, error=None)
-        handle.fail(locale)
         return _LocaleOutcome(result=None, error=str(last_error) if last_error else "unknown error")
 
     async def _translate_locale(
@@ -314,88 +778,238 @@ class Builder:
         entries: tuple[_SourceEntry, ...],
         handle: ProgressHandle,
     ) -> TextMap:
-        """Mask variables, translate, then restore them."""
-        texts: TextMap = {entry.id: _mask(entry.text, entry.placeholders) for entry in entries}
-        translated = await self.translator.translate(
-            texts=texts,
-            target_lang=locale,
-            source_lang=self.source_locale,
-            on_progress=lambda n: handle.advance(locale, n),
-        )
-        for entry in entries:
-            translated[entry.id] = _restore(translated[entry.id], entry.placeholders)
-        return translated
+        """Mask variables, translate, then restore them.
+
+        Plural/select messages are translated branch by branch (see
+        ``_translate_messages``), so their ICU structure survives.
+        With checkpointing, translations journaled earlier (by a failed
+        attempt or an interrupted build) are reused, and each chunk is
+        journaled as soon as the translator returns it.
+        """
+        journal = self._journal
+        done: TextMap = {}
+        if journal is not None:
+            journaled = journal.load(locale)
+            done = {entry.id: journaled[entry.id] for entry in entries if entry.id in journaled}
+            if done:
+                handle.advance(locale, len(done))
+        todo = [entry for entry in entries if entry.id not in done]
+        if not todo:
+            return done
+
+        messages: TextMap = {entry.id: entry.text for entry in todo if is_message(entry.text)}
+        by_id = {entry.id: entry for entry in todo if entry.id not in messages}
+        texts: TextMap = {entry.id: _mask(entry.text, entry.placeholders) for entry in by_id.values()}
+        options: dict[str, Any] = {}
+        if journal is not None and self._translator_journals_chunks():
+
+            def on_chunk(chunk: TextMap) -> None:
+                journal.record(
+                    locale, {i: _restore(text, by_id[i].placeholders) for i, text in chunk.items() if i in by_id}
+                )
+
+            options["on_chunk"] = on_chunk
+        translated: TextMap = {}
+        if texts:
+            translated = await self.translator.translate(
+                texts=texts,
+                target_lang=locale,
+                source_lang=self.source_locale,
+                on_progress=lambda n: handle.advance(locale, n),
+                **options,
+            )
+            for entry in by_id.values():
+                translated[entry.id] = _restore(translated[entry.id], entry.placeholders)
+        if messages:
+            translated |= await _translate_messages(
+                self.translator, messages, target_lang=locale, source_lang=self.source_locale
+            )
+            handle.advance(locale, len(messages))
+        if journal is not None:
+            journaled_ids = messages if "on_chunk" in options else translated
+            journal.record(locale, {text_id: translated[text_id] for text_id in journaled_ids})
+        return {**done, **translated}
+
+    def _translator_journals_chunks(self) -> bool:
+        """Whether the translator's ``translate`` reports finished chunks (custom overrides may not)."""
+        return "on_chunk" in inspect.signature(self.translator.translate).parameters
 
     # ── Extraction ───────────────────────────────────────────────
 
     def extract_entries(self) -> dict[TextId, _SourceEntry]:
-        """Extract every source entry, parsing each file at most once."""
+        """Extract every source entry (plus ``dynamic_texts``), parsing each file at most once.
+
+        With the extraction cache, unchanged files are not parsed at
+        all: their entries come from the cache.
+        """
         if self._entries is None:
-            entries: dict[TextId, _SourceEntry] = {}
-            for file in self.project_files:
-                for entry in self._parse_file(file):
-                    entries[entry.id] = entry
-            self._entries = entries
+            self._merge_entries(self._extract_files())
+        assert self._entries is not None
         return self._entries
 
+    def _merge_entries(self, by_file: dict[Path, list[_SourceEntry]]) -> dict[TextId, _SourceEntry]:
+        """Merge per-file entries in ``project_files`` order, then ``dynamic_texts``, and memoize them."""
+        entries: dict[TextId, _SourceEntry] = {}
+        self._file_ids = {}
+        for file in self.project_files:
+            file_entries = by_file[file]
+            for entry in file_entries:
+                entries[entry.id] = entry
+            self._file_ids[file] = tuple(entry.id for entry in file_entries)
+        self._by_file = by_file
+        for entry in self._dynamic_entries():
+            entries.setdefault(entry.id, entry)
+        self._entries = entries
+        return entries
+
+    def _dynamic_entries(self) -> list[_SourceEntry]:
+        """``dynamic_texts`` as plain entries without placeholders."""
+        return [_SourceEntry(id=Text.id_of(text), text=text, placeholders=()) for text in self.dynamic_texts if text]
+
+    def _extract_files(self) -> dict[Path, list[_SourceEntry]]:
+        """Entries per project file: cached for unchanged files, parsed for the rest."""
+        return dict(self._iter_extracted())
+
+    def _iter_extracted(self) -> Iterator[tuple[Path, list[_SourceEntry]]]:
+        """Yield ``(file, entries)`` as each file is done: cache hits first, then parsed files in order.
+
+        The extraction cache is saved once every file has been yielded.
+        """
+        if not self.extract_cache:
+            yield from zip(self.project_files, self._parse_files(self.project_files), strict=True)
+            return
+
+        cache = ExtractionCache(self.locales_dir / ".cache", sep=self.sep, func_names=self.func_names)
+        misses: list[Path] = []
+        for file in self.project_files:
+            cached = cache.get(self._cache_key(file), file)
+            if cached is None:
+                misses.append(file)
+            else:
+                yield file, [_SourceEntry(id=i, text=text, placeholders=p) for i, text, p in cached]
+        # Stat and hash before parsing: an edit made meanwhile is caught next time.
+        fingerprints = [(file.stat(), file_digest(file.read_bytes())) for file in misses]
+        for file, (stat, digest), file_entries in zip(misses, fingerprints, self._parse_files(misses), strict=True):
+            cache.put(self._cache_key(file), stat, digest, [(e.id, e.text, e.placeholders) for e in file_entries])
+            yield file, file_entries
+        cache.save()
+        logger.debug(f"Extraction cache: {len(self.project_files) - len(misses)} reused, {len(misses)} parsed")
+
+    def _cache_key(self, file: Path) -> str:
+        return file.relative_to(self.project_root).as_posix()
+
     def _parse_file(self, file: Path) -> list[_SourceEntry]:
         """Read and parse one file into source entries (AST objects dropped)."""
-        source = file.read_text(encoding="utf-8")
-        module = ast.parse(source)
-        parser = ASTParser(sep=self.sep, func_names=self.func_names)
-        entries: list[_SourceEntry] = []
-        for string_data in parser.extract_all(node=module, source_path=file, source=source):
-            text = str(string_data.string)
-            if not text:
-                continue
-            entries.append(_SourceEntry(id=string_data.string.id, text=text, placeholders=tuple(string_data.variables)))
-        return entries
+        return _parse_source_file(file, self.sep, self.func_names)
+
+    def _parse_files(self, files: list[Path]) -> Iterator[list[_SourceEntry]]:
+        """Parse ``files``, in order, serially or across ``jobs`` worker processes.
+
+        Results are yielded in input order as they become available, so
+        the first failing file raises first, exactly as in the serial
+        loop; errors such as ``UnsupportedSyntaxError`` cross the
+        process boundary with their message (file, line and code
+        context) intact.
+        """
+        jobs = min(self.jobs or 1, len(files))
+        if jobs <= 1:
+            yield from map(self._parse_file, files)
+            return
+        chunksize = max(1, len(files) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            yield from pool.map(
+                _parse_source_file,
+                files,
+                [self.sep] * len(files),
+                [self.func_names] * len(files),
+                chunksize=chunksize,
+            )
+
+    # ── Bundles ──────────────────────────────────────────────────
+
+    def bundle_ids(self) -> dict[str, set[TextId]]:
+        """The IDs each bundle contains: those extracted from its matching files."""
+        self.extract_entries()
+        result: dict[str, set[TextId]] = {}
+        for name, patterns in self.bundles.items():
+            matcher = PathMatcher(patterns)
+            ids: set[TextId] = set()
+            for file, file_ids in self._file_ids.items():
+                if matcher.match(file.relative_to(self.project_root).as_posix()):
+                    ids.update(file_ids)
+            if not ids:
+                logger.warning(f"Bundle {name!r} matches no translatable strings")
+            result[name] = ids
+        return result
+
+    def export_bundles(self) -> Manifest:
+        """Export each bundle as per-locale JSON, source locale included.
+
+        Only bundles whose key set or translations changed get new
+        (content-hashed) files; the rest are left untouched.
+
+        Returns:
+            The bundle manifest (bundle to locale to file name).
+        """
+        entries = self.extract_entries()
+        locales: dict[str, TextMap] = {self.source_locale: {text_id: entry.text for text_id, entry in entries.items()}}
+        for locale in self.to_locales:
+            locales[locale] = self._locales.get(locale, {})
+        return write_bundles(self.bundles_dir, self.bundle_ids(), locales, compress=self.bundle_compress)
 
     # ── Scanning and persistence ─────────────────────────────────
 
     def load_file(self) -> list[Path]:
-        """Discover the project's Python files.
+        """Discover the project's Python files (see ``scan_project``).
 
         Exclude patterns prune directories from the walk; include
         patterns filter files.  One matching rule serves both: a path
         matches when it equals a pattern, descends from it, or
         glob-matches it.
         """
-        include = [Path(p) for p in self.include]
-        exclude = [Path(p) for p in self.default_exclude + self.exclude]
-        project_files: list[Path] = []
-        for root, dirs, names in self.project_root.walk():
-            root_rel = Path(root).relative_to(self.project_root)
-            dirs[:] = [d for d in dirs if not self._matches(root_rel / d, exclude)]
-            for name in names:
-                if not name.endswith(".py"):
-                    continue
-                rel = root_rel / name
-                if include and not self._matches(rel, include):
-                    continue
-                project_files.append(Path(root) / name)
-        return project_files
-
-    @staticmethod
-    def _matches(rel: Path, patterns: list[Path]) -> bool:
-        """True when ``rel`` equals, descends from, or glob-matches a pattern."""
-        for pattern in patterns:
-            if rel == pattern or rel.is_relative_to(pattern) or rel.match(str(pattern)):
-                return True
-        return False
-
-    def save_to_yaml(self, texts: TextMap, locale: str) -> None:
-        """Atomically write one locale's dictionary to YAML.
-
-        The file is written to a temporary sibling and renamed into
-        place, so an interrupted build never leaves a truncated file.
+        return scan_project(
+            self.project_root,
+            include=self.include,
+            exclude=self.default_exclude + self.exclude,
+            ignore_files=self.gitignore,
+        )
+
+    def save_to_yaml(self, texts: TextMap, locale: str) -> bool:
+        """Atomically write one locale's dictionary to YAML, as shards when ``namespaces`` is set.
+
+        Returns:
+            Whether any file changed.
         """
-        self.locales_dir.mkdir(parents=True, exist_ok=True)
-        target = self.locales_dir / f"{locale}.yaml"
-        tmp = target.with_name(f".{target.stem}.{os.getpid()}.tmp")
-        try:
-            with open(tmp, "w", encoding="utf-8") as f:
-                yaml.dump(texts, f, allow_unicode=True, sort_keys=True)
-            os.replace(tmp, target)
-        finally:
-            tmp.unlink(missing_ok=True)
+        if self.namespaces is None:
+            return dump_locale_file(self.locales_dir, locale, texts)
+        namespace_of = self._namespace_of()
+        shards: dict[str, TextMap] = {}
+        for text_id, text in texts.items():
+            shards.setdefault(namespace_of.get(text_id, DEFAULT_NAMESPACE), {})[text_id] = text
+        return dump_locale_shards(self.locales_dir, locale, shards)
+
+    def _namespace_of(self) -> dict[TextId, str]:
+        """The shard of each extracted ID: its namespace when only files of one namespace use it, else the common one.
+
+        A file belongs to the first namespace whose patterns match it.
+        """
+        assert self.namespaces is not None
+        matchers = {name: PathMatcher(patterns) for name, patterns in self.namespaces.items()}
+        owners: dict[TextId, set[str]] = {}
+        for file, file_ids in self._file_ids.items():
+            rel = file.relative_to(self.project_root).as_posix()
+            namespace = next((name for name, matcher in matchers.items() if matcher.match(rel)), DEFAULT_NAMESPACE)
+            for text_id in file_ids:
+                owners.setdefault(text_id, set()).add(namespace)
+        return {text_id: names.pop() if len(names) == 1 else DEFAULT_NAMESPACE for text_id, names in owners.items()}
+
+    def _reshard(self) -> None:
+        """Move keys between shards when no content changed (e.g. a file moved to another namespace)."""
+        if self.namespaces is None:
+            return
+        self.extract_entries()
+        written = [
+            self.save_to_yaml(self._locales[locale], locale) for locale in self.to_locales if locale in self._locales
+        ]
+        if any(written):
+            reload_catalog(self.locales_dir)
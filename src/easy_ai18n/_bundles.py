@@ -0,0 +1,125 @@
+"""
+Per-entrypoint JSON bundles for frontend clients.
+
+A bundle is the subset of the catalogs that one client entrypoint
+needs: only the IDs extracted from its source files, one JSON object
+``{TextId: text}`` per locale. File names carry a hash of the content
+(``{bundle}.{locale}.{hash}.json``), so they can be cached forever;
+a bundle whose key set and translations are unchanged keeps its name
+and is not rewritten or recompressed. ``manifest.json`` maps each
+bundle and locale to its current file.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+from collections.abc import Collection, Mapping, Sequence
+from pathlib import Path
+
+from loguru import logger
+
+from ._types import TextId, TextMap
+from .errors import BuildDependencyError, BuildError
+
+MANIFEST_NAME = "manifest.json"
+
+Manifest = dict[str, dict[str, str]]
+"""Bundle name to locale to the bundle's current file name."""
+
+_COMPRESSIONS = ("gzip", "br")
+
+
+def _compress(data: bytes, method: str) -> bytes:
+    if method == "gzip":
+        # ``mtime=0`` keeps the output reproducible for identical content.
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    try:
+        import brotli
+    except ImportError as e:
+        raise BuildDependencyError("Brotli bundles need the brotli package. Install with: pip install brotli") from e
+    return bytes(brotli.compress(data, quality=11))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _read_manifest(out_dir: Path) -> Manifest:
+    try:
+        data = json.loads((out_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_bundles(
+    out_dir: Path,
+    bundles: Mapping[str, Collection[TextId]],
+    locales: Mapping[str, TextMap],
+    *,
+    compress: Sequence[str] = (),
+) -> Manifest:
+    """Write one content-hashed JSON file per bundle and locale.
+
+    Args:
+        out_dir: The output directory.
+        bundles: Bundle name to the IDs the bundle contains.
+        locales: Locale code to its translations (include the source
+            locale to ship the source texts). IDs a locale lacks are
+            left out of its file, so clients fall back to the source.
+        compress: Precompressed variants written next to each file:
+            ``"gzip"`` (``.gz``) and/or ``"br"`` (``.br``, needs the
+            ``brotli`` package).
+
+    Returns:
+        The new manifest, also written to ``manifest.json``.
+    """
+    unknown = [method for method in compress if method not in _COMPRESSIONS]
+    if unknown:
+        raise BuildError(f"Unknown bundle compression {unknown}; use {list(_COMPRESSIONS)}")
+    suffixes = {"gzip": ".gz", "br": ".br"}
+    out_dir.mkdir(parents=True, exist_ok=True)
+    previous = _read_manifest(out_dir)
+    manifest: Manifest = {}
+    written = 0
+
+    for name, ids in sorted(bundles.items()):
+        wanted = sorted(ids)
+        manifest[name] = {}
+        for locale, texts in sorted(locales.items()):
+            payload = {text_id: texts[text_id] for text_id in wanted if text_id in texts}
+            data = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode()
+            digest = hashlib.sha256(data).hexdigest()[:12]
+            file_name = f"{name}.{locale}.{digest}.json"
+            manifest[name][locale] = file_name
+
+            # Same name means same bytes: only missing variants are written.
+            target = out_dir / file_name
+            if not target.exists():
+                _write_atomic(target, data)
+                written += 1
+            for method in compress:
+                variant = target.with_name(target.name + suffixes[method])
+                if not variant.exists():
+                    _write_atomic(variant, _compress(data, method))
+
+    # Drop the files this exporter wrote before and no longer references.
+    current = {file for files in manifest.values() for file in files.values()}
+    for files in previous.values():
+        for file_name in files.values() if isinstance(files, dict) else ():
+            if file_name in current or Path(file_name).name != file_name:
+                continue
+            for suffix in ("", *suffixes.values()):
+                (out_dir / (file_name + suffix)).unlink(missing_ok=True)
+
+    _write_atomic(out_dir / MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True).encode())
+    logger.info(f"Bundles exported to {out_dir}: {written} file(s) regenerated")
+    return manifest
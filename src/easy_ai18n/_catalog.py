@@ -0,0 +1,200 @@
+"""
+Process-wide catalog registry.
+
+Every ``I18n`` instance bound to the same ``locales_dir`` shares one
+``Catalog``: the YAML files are parsed once per process, and compiled
+call sites are cached once per ``func_names`` set instead of once per
+instance. ``I18n`` objects become cheap views that differ only in
+their default locale and selectors.
+
+With ``shared=name`` the translations come from a catalog daemon's
+shared-memory snapshot (see ``_shared``) instead of the YAML files, and
+a watcher thread swaps in new versions as they are published.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterable, Iterator, MutableMapping
+from pathlib import Path
+from types import CodeType
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from ._loader import Loader
+from ._parser import _CompiledCall
+from ._shared import SnapshotReader
+from ._types import TextId
+
+if TYPE_CHECKING:
+    from ._filler import BackgroundFiller
+    from ._reverse import ReverseIndex
+
+CallKey = tuple[CodeType, int, str]
+"""``(code object, call offset, sep)``: identifies one call site."""
+
+
+class Catalog:
+    """One locales directory's translations plus its compiled call sites."""
+
+    def __init__(
+        self,
+        locales_dir: Path,
+        *,
+        shared: str | None = None,
+        poll_interval: float = 1.0,
+        namespaces: tuple[str, ...] | None = None,
+    ) -> None:
+        """Load the catalog for ``locales_dir``.
+
+        Args:
+            locales_dir: The resolved directory for YAML translation
+                files.
+            shared: The name of a catalog daemon's snapshot to read
+                instead of the YAML files. While no snapshot is
+                available the YAML files are loaded, and the snapshot
+                is picked up once published.
+            poll_interval: Seconds between checks for a new snapshot
+                version (``shared`` only).
+            namespaces: Load only these catalog shards (plus the common
+                one) from the YAML files. ``None`` loads every shard.
+                A shared snapshot always holds every shard.
+        """
+        self.locales_dir = locales_dir
+        self.shared = shared
+        self.poll_interval = poll_interval
+        self.namespaces = namespaces
+        self.version = 0
+        """The snapshot version loaded; ``0`` when loaded from the YAML files."""
+        self._reader: SnapshotReader | None = None
+        self.locales: dict[str, MutableMapping[TextId, str]] = self._load()
+        self._calls: dict[tuple[str, ...], dict[CallKey, _CompiledCall]] = {}
+        self._failures: dict[tuple[str, ...], set[CallKey]] = {}
+        self.filler: BackgroundFiller | None = None
+        """Fills keys missing at render time, when runtime translation is enabled."""
+        self.reverse: ReverseIndex | None = None
+        """Maps translated texts back to IDs, when the reverse index is enabled."""
+        if shared is not None:
+            threading.Thread(target=self._watch, name="easy-ai18n-snapshot", daemon=True).start()
+
+    def _load(self) -> dict[str, MutableMapping[TextId, str]]:
+        """Read the shared snapshot if one is available, else the YAML files.
+
+        Snapshot locales are ``SharedTexts`` views of the daemon's
+        segment, not copies.
+        """
+        if self.shared is not None:
+            try:
+                if self._reader is None:
+                    self._reader = SnapshotReader(self.shared)
+                self.version, snapshot = self._reader.load()
+                return dict(snapshot)
+            except (FileNotFoundError, LookupError) as e:
+                logger.warning(f"Shared catalog {self.shared!r} unavailable, loading {self.locales_dir}: {e}")
+        self.version = 0
+        return dict(Loader(self.locales_dir).load_locales_file(namespaces=self.namespaces))
+
+    def calls(self, func_names: list[str]) -> dict[CallKey, _CompiledCall]:
+        """The compiled call-site cache shared by every view using ``func_names``.
+
+        Which call node a call site compiles to depends on the
+        recognized function names, so each distinct set gets its own
+        cache.
+        """
+        return self._calls.setdefault(tuple(func_names), {})
+
+    def compiled_calls(self) -> Iterator[_CompiledCall]:
+        """Every call site compiled so far, across all ``func_names`` sets."""
+        for calls in self._calls.values():
+            yield from calls.values()
+
+    def failures(self, func_names: list[str]) -> set[CallKey]:
+        """The parse-failure record shared by every view using ``func_names``."""
+        return self._failures.setdefault(tuple(func_names), set())
+
+    def reload(self) -> None:
+        """Re-read the YAML files (or the shared snapshot) in place.
+
+        The ``locales`` dictionary object is kept, so every view (and
+        every ``LocaleContent`` already handed out) sees the new data.
+        Each locale's map is swapped in one assignment and removed
+        locales are dropped afterwards, so a concurrent render sees the
+        old or the new translations, never an empty catalog.
+        Compiled call sites depend only on source code and stay valid.
+        """
+        fresh = self._load()
+        self.locales.update(fresh)
+        for locale in [locale for locale in self.locales if locale not in fresh]:
+            self.locales.pop(locale, None)
+        if self.reverse is not None:
+            self.reverse.rebuild(self.locales)
+
+    def refresh(self) -> bool:
+        """Reload when the catalog daemon has published a newer snapshot.
+
+        Returns:
+            ``True`` when a new version was loaded.
+        """
+        if self.shared is None:
+            return False
+        try:
+            if self._reader is None:
+                self._reader = SnapshotReader(self.shared)
+            latest = self._reader.version()
+        except FileNotFoundError:
+            return False
+        if latest == 0 or latest == self.version:
+            return False
+        self.reload()
+        return True
+
+    def _watch(self) -> None:
+        while True:
+            time.sleep(self.poll_interval)
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception(f"Failed to refresh shared catalog {self.shared!r}")
+
+
+_catalogs: dict[tuple[Path, tuple[str, ...] | None], Catalog] = {}
+_lock = threading.Lock()
+
+
+def get_catalog(
+    locales_dir: Path,
+    *,
+    shared: str | None = None,
+    namespaces: Iterable[str] | None = None,
+) -> Catalog:
+    """Return the process-wide catalog for ``locales_dir`` and ``namespaces``, loading it on first use.
+
+    ``shared`` only applies to that first load.
+    """
+    path = locales_dir.resolve()
+    key = (path, tuple(sorted(set(namespaces))) if namespaces is not None else None)
+    catalog = _catalogs.get(key)
+    if catalog is not None:
+        return catalog
+    with _lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = Catalog(path, shared=shared, namespaces=key[1])
+    return catalog
+
+
+def reload_catalog(locales_dir: Path) -> None:
+    """Reload the catalogs for ``locales_dir`` (every namespace selection) that are registered.
+
+    Called after a build writes new YAML files, so running views pick
+    up the translations without being recreated. Catalogs reading a
+    shared snapshot are left alone: reloading now would only re-read
+    the old snapshot. The daemon notices the new files and publishes
+    them, and the catalogs' watchers load that version.
+    """
+    path = locales_dir.resolve()
+    for (catalog_dir, _), catalog in list(_catalogs.items()):
+        if catalog_dir == path and catalog.version == 0:
+            catalog.reload()
@@ -0,0 +1,319 @@
+"""
+Distributed builds: a durable work queue shared by several workers.
+
+The coordinator splits a build's missing translations into work units
+(one locale, up to ``chunk_size`` entries) stored in a SQLite database
+under ``locales_dir/.cache``. Workers, in other processes or on other
+machines sharing the directory, lease a unit, translate it with their
+own translator and report the result. A lease that is not completed in
+time (a crashed worker) expires and the unit is handed out again.
+
+Each lease carries a random token, and a unit accepts a result only
+from its current lease: a worker whose lease expired and was taken
+over, or whose unit was dropped by a re-plan, has its result rejected.
+Unit IDs are never reused, so a stale worker cannot hit a new unit. The
+coordinator merges a locale into its catalog once all of its units are
+done, then deletes them, so every result is merged exactly once; a
+coordinator restart keeps finished units and only re-plans the rest.
+
+SQLite relies on file locks: on network filesystems make sure they are
+supported (NFSv4, SMB), or run workers on one host. A queue written by
+another version of the schema is never dropped: opening it raises
+``BuildError``, since it may still hold finished, unmerged results.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from ._loader import make_cache_dir
+from ._message import is_message
+from ._types import TextId, TextMap
+from .errors import BuildError
+from .translators import BaseTranslator, _mask, _restore, _translate_messages
+
+QUEUE_FILE = "queue.sqlite3"
+
+_SCHEMA_VERSION = 2
+"""Stored as ``PRAGMA user_version``; ``0`` marks a database not initialized yet."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS units (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    locale TEXT NOT NULL,
+    source_locale TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    lease TEXT,
+    expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    result TEXT
+);
+CREATE INDEX IF NOT EXISTS units_state ON units (state, locale);
+"""
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class WorkUnit:
+    """One leased chunk of one locale."""
+
+    id: int
+    """The unit's row ID, passed back to ``complete`` / ``fail``."""
+
+    locale: str
+    """The target locale."""
+
+    source_locale: str
+    """The language of the source texts."""
+
+    entries: tuple[tuple[TextId, str, tuple[str, ...]], ...]
+    """``(id, text, placeholders)`` of each source string."""
+
+    lease: str
+    """The token of this lease, required to ``complete`` or ``fail`` the unit."""
+
+
+class WorkQueue:
+    def __init__(self, path: Path, *, max_attempts: int = 3) -> None:
+        """Open (and create) the queue database.
+
+        Args:
+            path: The SQLite file, e.g. ``locales_dir / ".cache" / QUEUE_FILE``.
+            max_attempts: How many failed attempts a unit gets before it
+                is marked failed.
+
+        Raises:
+            BuildError: The database holds a queue of another schema version.
+        """
+        self.path = path
+        self.max_attempts = max_attempts
+        make_cache_dir(path.parent)
+        self._db = sqlite3.connect(path, timeout=30.0, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        try:
+            with self._transaction() as db:
+                version = db.execute("PRAGMA user_version").fetchone()[0]
+                if version not in (0, _SCHEMA_VERSION):
+                    raise BuildError(
+                        f"Work queue {path} has schema version {version}, expected {_SCHEMA_VERSION}; "
+                        "finish it with the version that created it, or delete the file to start over"
+                    )
+                db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+                for statement in _SCHEMA.split(";"):
+                    if statement.strip():
+                        db.execute(statement)
+        except BaseException:
+            self._db.close()
+            raise
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """An immediate (write-locked) transaction, committed on success."""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    # ── Coordinator side ─────────────────────────────────────────
+
+    def plan(
+        self,
+        source_locale: str,
+        to_translate: dict[str, Sequence[tuple[TextId, str, tuple[str, ...]]]],
+        *,
+        chunk_size: int,
+    ) -> int:
+        """Replace the unfinished units with a fresh plan; finished units are kept.
+
+        Entries already covered by a finished, unmerged unit are not
+        planned again.
+
+        Returns:
+            The number of units planned.
+        """
+        planned = 0
+        with self._transaction() as db:
+            db.execute("DELETE FROM units WHERE state != 'done'")
+            done: dict[str, set[str]] = {}
+            for locale, payload in db.execute("SELECT locale, payload FROM units"):
+                done.setdefault(locale, set()).update(entry[0] for entry in json.loads(payload))
+            for locale, entries in to_translate.items():
+                todo = [list(entry[:2]) + [list(entry[2])] for entry in entries if entry[0] not in done.get(locale, ())]
+                for start in range(0, len(todo), chunk_size):
+                    db.execute(
+                        "INSERT INTO units (locale, source_locale, payload) VALUES (?, ?, ?)",
+                        (locale, source_locale, json.dumps(todo[start : start + chunk_size], ensure_ascii=False)),
+                    )
+                    planned += 1
+        return planned
+
+    def progress(self) -> dict[str, dict[str, int]]:
+        """Unit counts per locale and state (``pending``, ``leased``, ``done``, ``failed``)."""
+        counts: dict[str, dict[str, int]] = {}
+        with self._lock:
+            for locale, state, count in self._db.execute(
+                "SELECT locale, state, COUNT(*) FROM units GROUP BY locale, state"
+            ):
+                counts.setdefault(locale, {})[state] = count
+        return counts
+
+    def errors(self, locale: str) -> list[str]:
+        """The last errors of ``locale``'s failed units."""
+        with self._lock:
+            rows = self._db.execute("SELECT error FROM units WHERE locale = ? AND state = 'failed'", (locale,))
+            return [error or "unknown error" for (error,) in rows]
+
+    def results(self, locale: str) -> TextMap:
+        """The merged results of ``locale``'s finished units."""
+        texts: TextMap = {}
+        with self._lock:
+            rows = self._db.execute("SELECT result FROM units WHERE locale = ? AND state = 'done'", (locale,))
+            for (result,) in rows:
+                texts.update(json.loads(result))
+        return texts
+
+    def retire(self, locale: str) -> None:
+        """Delete ``locale``'s units once its results are in the catalog."""
+        with self._transaction() as db:
+            db.execute("DELETE FROM units WHERE locale = ?", (locale,))
+
+    # ── Worker side ──────────────────────────────────────────────
+
+    def lease(self, owner: str, lease_seconds: float) -> WorkUnit | None:
+        """Take the next pending (or expired) unit for ``lease_seconds``, or ``None`` when there is none."""
+        now = time.time()
+        token = uuid.uuid4().hex
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT id, locale, source_locale, payload FROM units "
+                "WHERE state = 'pending' OR (state = 'leased' AND expires < ?) ORDER BY id LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+            unit_id, locale, source_locale, payload = row
+            db.execute(
+                "UPDATE units SET state = 'leased', owner = ?, lease = ?, expires = ? WHERE id = ?",
+                (owner, token, now + lease_seconds, unit_id),
+            )
+        entries = tuple((TextId(i), text, tuple(placeholders)) for i, text, placeholders in json.loads(payload))
+        return WorkUnit(id=unit_id, locale=locale, source_locale=source_locale, entries=entries, lease=token)
+
+    def complete(self, unit: WorkUnit, result: TextMap) -> bool:
+        """Record a unit's translations.
+
+        Returns:
+            ``False`` when ``unit``'s lease is no longer current (it
+            expired and was taken over, or the unit was re-planned); the
+            result is dropped.
+        """
+        with self._transaction() as db:
+            cursor = db.execute(
+                "UPDATE units SET state = 'done', result = ?, owner = NULL, lease = NULL, expires = NULL "
+                "WHERE id = ? AND state = 'leased' AND lease = ?",
+                (json.dumps(result, ensure_ascii=False), unit.id, unit.lease),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, unit: WorkUnit, error: str) -> None:
+        """Give a leased unit back after a failed attempt, or mark it failed after ``max_attempts``."""
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE units SET attempts = attempts + 1, error = ?, owner = NULL, lease = NULL, expires = NULL, "
+                "state = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END "
+                "WHERE id = ? AND state = 'leased' AND lease = ?",
+                (error, self.max_attempts, unit.id, unit.lease),
+            )
+
+    def drained(self) -> bool:
+        """True when no unit is waiting to be translated or in flight."""
+        with self._lock:
+            row = self._db.execute("SELECT 1 FROM units WHERE state IN ('pending', 'leased') LIMIT 1").fetchone()
+        return row is None
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def default_worker_id() -> str:
+    """``host:pid``, unique across machines sharing the queue."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+async def run_worker(
+    queue: WorkQueue,
+    translator: BaseTranslator,
+    *,
+    worker_id: str | None = None,
+    lease_seconds: float = 300.0,
+    poll_interval: float = 1.0,
+    wait: bool = False,
+    stop: threading.Event | None = None,
+) -> int:
+    """Lease and translate units until the queue is drained or ``stop`` is set.
+
+    Args:
+        queue: The shared queue.
+        translator: This worker's translator.
+        worker_id: Recorded as the lease owner; defaults to ``host:pid``.
+        lease_seconds: How long a unit stays leased before another
+            worker may take it over.
+        poll_interval: Seconds between checks while other workers hold
+            the remaining units.
+        wait: Keep polling an empty queue (for units a coordinator has
+            yet to plan) instead of returning.
+        stop: Set this event to stop after the current unit.
+
+    Returns:
+        The number of units this worker completed.
+    """
+    owner = worker_id or default_worker_id()
+    stop = stop or threading.Event()
+    completed = 0
+    while not stop.is_set():
+        unit = queue.lease(owner, lease_seconds)
+        if unit is None:
+            if not wait and queue.drained():
+                break
+            # Units leased by others may still come back when a lease expires.
+            await asyncio.to_thread(stop.wait, poll_interval)
+            continue
+        messages: TextMap = {text_id: text for text_id, text, _ in unit.entries if is_message(text)}
+        plain = [entry for entry in unit.entries if entry[0] not in messages]
+        texts: TextMap = {text_id: _mask(text, placeholders) for text_id, text, placeholders in plain}
+        try:
+            translated = await translator.translate(
+                texts=texts, target_lang=unit.locale, source_lang=unit.source_locale
+            )
+            result = {text_id: _restore(translated[text_id], placeholders) for text_id, _, placeholders in plain}
+            result |= await _translate_messages(
+                translator, messages, target_lang=unit.locale, source_lang=unit.source_locale
+            )
+        except Exception as e:
+            logger.error(f"Worker {owner}: unit {unit.id} ({unit.locale}) failed: {e}")
+            queue.fail(unit, str(e))
+            continue
+        if queue.complete(unit, result):
+            completed += 1
+        else:
+            logger.warning(f"Worker {owner}: lease on unit {unit.id} was lost (expired or re-planned); result dropped")
+    return completed
@@ -0,0 +1,104 @@
+"""
+Persistent extraction cache.
+
+Maps each source file to the strings extracted from it, so a build
+re-parses only files that are new or changed. A file is reused when
+its ``(mtime_ns, size)`` match the cached stat, or, when the stat
+changed (a checkout, ``touch``), its content hash still matches. The
+whole cache is dropped when ``sep``, ``func_names`` or the cache
+format change, since either changes what extraction produces.
+
+Stat-only reuse is skipped for files modified within ``_RACY_NS`` of
+the previous save: such a file may have been rewritten in the same
+timestamp tick without changing size, so its content is hashed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from ._loader import make_cache_dir
+from ._types import TextId
+
+_CACHE_VERSION = 1
+_CACHE_FILE = "extract.json"
+_RACY_NS = 2_000_000_000
+
+CachedEntry = tuple[TextId, str, tuple[str, ...]]
+"""``(id, text, placeholders)`` of one extracted string."""
+
+
+def file_digest(data: bytes) -> str:
+    """The content hash recorded for a source file."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ExtractionCache:
+    def __init__(self, cache_dir: Path, *, sep: str, func_names: list[str]) -> None:
+        """Load the cache from ``cache_dir``, or start empty.
+
+        Args:
+            cache_dir: The cache directory (``locales_dir / ".cache"``).
+            sep: The separator the entries were extracted with.
+            func_names: The translation function names the entries
+                were extracted with.
+        """
+        self.path = cache_dir / _CACHE_FILE
+        self.settings = {"version": _CACHE_VERSION, "sep": sep, "func_names": list(func_names)}
+        self._saved_ns = 0
+        # relative path -> [mtime_ns, size, content hash, [[id, text, [placeholders]], ...]]
+        self._files: dict[str, Any] = {}
+        self._fresh: dict[str, Any] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable extraction cache {self.path}: {e}")
+            return
+        if isinstance(data, dict) and data.get("settings") == self.settings:
+            self._saved_ns = int(data.get("saved_ns", 0))
+            self._files = data.get("files", {})
+
+    def get(self, key: str, file: Path) -> list[CachedEntry] | None:
+        """The cached entries of ``file`` when it is unchanged, else ``None``.
+
+        Args:
+            key: The file's path relative to the project root.
+            file: The file itself.
+        """
+        record = self._files.get(key)
+        if record is None:
+            return None
+        mtime_ns, size, digest, entries = record
+        stat = file.stat()
+        if (stat.st_mtime_ns, stat.st_size) != (mtime_ns, size) or stat.st_mtime_ns + _RACY_NS > self._saved_ns:
+            if file_digest(file.read_bytes()) != digest:
+                return None
+            record = [stat.st_mtime_ns, stat.st_size, digest, entries]
+        self._fresh[key] = record
+        return [(TextId(i), text, tuple(placeholders)) for i, text, placeholders in entries]
+
+    def put(self, key: str, stat: os.stat_result, digest: str, entries: list[CachedEntry]) -> None:
+        """Record what was just extracted from a file, with its stat and content hash taken before reading."""
+        self._fresh[key] = [stat.st_mtime_ns, stat.st_size, digest, [list(entry) for entry in entries]]
+
+    def save(self) -> None:
+        """Write the entries used or recorded by this build; files no longer scanned are dropped."""
+        data = {"settings": self.settings, "saved_ns": time.time_ns(), "files": self._fresh}
+        make_cache_dir(self.path.parent)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save extraction cache {self.path}: {e}")
+        finally:
+            tmp.unlink(missing_ok=True)
@@ -0,0 +1,236 @@
+"""
+On-demand runtime translation.
+
+When a rendered key is missing from a locale, the runtime answers with
+the source text right away and hands the key to a ``BackgroundFiller``.
+The filler runs its own asyncio loop in a daemon thread (so it serves
+synchronous and asynchronous apps alike), batches the queued keys per
+locale through any ``BaseTranslator``, writes the results into the live
+catalog and to the locale's YAML file, and stops itself after repeated
+failures (e.g. rate limits). Long-tail strings heal without a rebuild.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import yaml
+from loguru import logger
+
+from ._loader import dump_runtime_translations
+from ._message import is_message
+from ._types import TextId, TextMap
+from .translators import _mask, _restore, _translate_messages
+
+if TYPE_CHECKING:
+    from ._catalog import Catalog
+    from .translators import BaseTranslator
+
+_MAX_PENDING = 10_000
+"""Cap for keys queued or in flight; misses beyond it are dropped and resubmitted on a later render."""
+
+
+@dataclass(frozen=True, slots=True)
+class _Missing:
+    """One key to fill: the locale, its ID, and the source template."""
+
+    locale: str
+    id: TextId
+    text: str
+    placeholders: tuple[str, ...]
+
+
+class BackgroundFiller:
+    def __init__(
+        self,
+        *,
+        catalog: Catalog,
+        translator: BaseTranslator,
+        source_locale: str,
+        locales: list[str] | None = None,
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+        max_failures: int = 3,
+        save_to_file: bool = True,
+    ) -> None:
+        """Set up the filler (the worker thread starts on the first miss).
+
+        Args:
+            catalog: The shared catalog to fill.
+            translator: The translator used for missing keys.
+            source_locale: The source language of the texts.
+            locales: The locales that may be filled. Defaults to the
+                locales already present in the catalog, so arbitrary
+                locale codes requested at runtime are never translated.
+            batch_size: The most keys sent per locale in one batch.
+            flush_interval: Seconds to wait for more misses before a
+                batch is sent.
+            max_failures: Consecutive failed batches after which the
+                filler stops itself.
+            save_to_file: Whether filled keys are written to the
+                locale's YAML file as well.
+        """
+        self.catalog = catalog
+        self.translator = translator
+        self.source_locale = source_locale
+        self.locales = {locale.lower() for locale in locales} if locales is not None else None
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_failures = max(1, max_failures)
+        self.save_to_file = save_to_file
+
+        self.stopped = False
+        self._pending: set[tuple[str, TextId]] = set()
+        self._failures = 0
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[_Missing] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    # ── Producer side (any thread) ───────────────────────────────
+
+    def submit(self, locale: str, text_id: TextId, text: str, placeholders: tuple[str, ...]) -> None:
+        """Queue a missing key; keys already queued or in flight are dropped.
+
+        Never blocks the render: the caller has already answered with
+        the source text. A key leaves the pending set once its batch is
+        handled, so a key whose batch failed is resubmitted by the next
+        render that misses it.
+        """
+        if self.stopped:
+            return
+        allowed = self.locales if self.locales is not None else self.catalog.locales
+        if locale not in allowed:
+            return
+        key = (locale, text_id)
+        with self._lock:
+            if key in self._pending or len(self._pending) >= _MAX_PENDING:
+                return
+            self._pending.add(key)
+            if self._thread is None:
+                # The loop and queue exist before the thread runs them, so
+                # keys submitted meanwhile simply wait in the loop's queue.
+                self._loop = asyncio.new_event_loop()
+                self._queue = asyncio.Queue()
+                self._thread = threading.Thread(target=self._thread_main, name="easy-ai18n-filler", daemon=True)
+                self._thread.start()
+            loop, queue = self._loop, self._queue
+        assert loop is not None and queue is not None
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, _Missing(locale, text_id, text, placeholders))
+        except RuntimeError:  # the worker exited and closed its loop
+            self.stopped = True
+            with self._lock:
+                self._pending.discard(key)
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait until every queued key has been handled.
+
+        Returns:
+            ``True`` when the queue drained within ``timeout``.
+        """
+        loop, queue = self._loop, self._queue
+        if loop is None or queue is None or self.stopped:
+            return True
+        future = asyncio.run_coroutine_threadsafe(queue.join(), loop)
+        try:
+            future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            return False
+        return True
+
+    def stop(self) -> None:
+        """Stop the worker; keys still queued are dropped."""
+        self.stopped = True
+        loop, task = self._loop, self._task
+        if loop is not None and task is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:  # the loop closed in the meantime
+                pass
+
+    # ── Worker side (filler thread) ──────────────────────────────
+
+    def _thread_main(self) -> None:
+        loop = self._loop
+        assert loop is not None
+        task = self._task = loop.create_task(self._run())
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:  # ``stop``
+            pass
+        except Exception:
+            logger.exception("Runtime translation worker failed")
+        finally:
+            self.stopped = True
+            loop.close()
+
+    async def _run(self) -> None:
+        queue = self._queue
+        assert queue is not None
+        while not self.stopped:
+            batch = [await queue.get()]
+            deadline = asyncio.get_running_loop().time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except TimeoutError:
+                    break
+            try:
+                await self._fill(batch)
+            except Exception:
+                logger.exception(f"Runtime translation batch of {len(batch)} keys failed")
+            finally:
+                with self._lock:
+                    self._pending.difference_update((item.locale, item.id) for item in batch)
+                for _ in batch:
+                    queue.task_done()
+
+    async def _fill(self, batch: list[_Missing]) -> None:
+        """Translate one batch, grouped by locale, and publish the results."""
+        by_locale: dict[str, list[_Missing]] = {}
+        for item in batch:
+            by_locale.setdefault(item.locale, []).append(item)
+        for locale, items in by_locale.items():
+            if self.stopped:
+                return
+            messages: TextMap = {item.id: item.text for item in items if is_message(item.text)}
+            texts: TextMap = {item.id: _mask(item.text, item.placeholders) for item in items if item.id not in messages}
+            try:
+                translated = await self.translator.translate(
+                    texts=texts,
+                    target_lang=locale,
+                    source_lang=self.source_locale,
+                )
+                translated |= await _translate_messages(
+                    self.translator, messages, target_lang=locale, source_lang=self.source_locale
+                )
+            except Exception as e:
+                self._failures += 1
+                logger.warning(f"Runtime translation to {locale} failed ({self._failures}/{self.max_failures}): {e}")
+                if self._failures >= self.max_failures:
+                    logger.warning("Runtime translation stopped after repeated failures")
+                    self.stopped = True
+                continue
+            self._failures = 0
+            live = self.catalog.locales.setdefault(locale, {})
+            reverse = self.catalog.reverse
+            added: TextMap = {}
+            for item in items:
+                if item.id in translated:
+                    live[item.id] = added[item.id] = _restore(translated[item.id], item.placeholders)
+                    if reverse is not None:
+                        reverse.add(locale, item.id, live[item.id])
+            if self.save_to_file:
+                try:
+                    dump_runtime_translations(self.catalog.locales_dir, locale, added, dict(live))
+                except (OSError, ValueError, yaml.YAMLError) as e:
+                    logger.warning(f"Failed to save runtime translations for {locale}: {e}")
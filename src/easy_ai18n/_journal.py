@@ -0,0 +1,85 @@
+"""
+Translation journal for resumable builds.
+
+Every chunk the translator returns is appended to
+``{cache_dir}/journal/{locale}.jsonl`` (one ``{"id": ..., "text": ...}``
+object per line) and flushed to disk before the build moves on. When a
+build crashes, is interrupted, or a locale runs out of retries, the next
+build reads the journal and only sends the items it lacks. A locale's
+journal is deleted once its catalog has been written.
+
+IDs are content hashes of the source text, so a journaled translation
+can never be applied to a different source string.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from loguru import logger
+
+from ._loader import make_cache_dir
+from ._types import TextId, TextMap
+
+_JOURNAL_DIR = "journal"
+
+
+class TranslationJournal:
+    def __init__(self, cache_dir: Path) -> None:
+        """Set up the journal under ``cache_dir`` (``locales_dir / ".cache"``); files are read lazily."""
+        self.dir = cache_dir / _JOURNAL_DIR
+        self._loaded: dict[str, TextMap] = {}
+
+    def _path(self, locale: str) -> Path:
+        return self.dir / f"{locale}.jsonl"
+
+    def load(self, locale: str) -> TextMap:
+        """The translations journaled for ``locale`` by this or an earlier build.
+
+        A line cut short by a crash is skipped.
+        """
+        texts = self._loaded.get(locale)
+        if texts is not None:
+            return texts
+        texts = {}
+        try:
+            with self._path(locale).open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        texts[TextId(record["id"])] = record["text"]
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable translation journal for {locale}: {e}")
+        if texts:
+            logger.info(f"Resuming {locale}: {len(texts)} translation(s) journaled by an earlier build")
+        self._loaded[locale] = texts
+        return texts
+
+    def record(self, locale: str, texts: TextMap) -> None:
+        """Append one chunk of finished translations and flush it to disk."""
+        if not texts:
+            return
+        self.load(locale).update(texts)
+        lines = "".join(
+            json.dumps({"id": text_id, "text": text}, ensure_ascii=False) + "\n" for text_id, text in texts.items()
+        )
+        try:
+            make_cache_dir(self.dir.parent)
+            self.dir.mkdir(exist_ok=True)
+            with self._path(locale).open("a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            logger.warning(f"Failed to journal translations for {locale}: {e}")
+
+    def clear(self, locale: str) -> None:
+        """Forget ``locale``'s journal once its catalog holds the translations."""
+        self._loaded.pop(locale, None)
+        self._path(locale).unlink(missing_ok=True)
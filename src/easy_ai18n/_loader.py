@@ -1,3 +1,7 @@
+import os
+import threading
+from collections.abc import Collection, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import yaml
@@ -5,45 +9,259 @@ from loguru import logger
 
 from ._types import TextMap
 
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+DEFAULT_NAMESPACE = "common"
+"""The shard holding keys used by no single namespace; always loaded."""
+
+
+def _is_sharded(directory: Path) -> bool:
+    """Whether ``directory`` holds a sharded locale: sharded writes always leave its common shard."""
+    return (directory / f"{DEFAULT_NAMESPACE}.yaml").is_file()
+
+
+def catalog_files(
+    locales_dir: Path,
+    locales: list[str] | None = None,
+    namespaces: Collection[str] | None = None,
+) -> list[tuple[str, str | None, Path]]:
+    """The catalog files of ``locales_dir`` as ``(locale, namespace, file)``, in path order.
+
+    ``<locale>/<namespace>.yaml`` is a shard of ``locale`` when
+    ``<locale>/common.yaml`` exists; any other ``<name>.yaml``, at any
+    depth, is a whole (flat) catalog of locale ``<name>``, with
+    namespace ``None``.
+
+    Args:
+        locales_dir: The directory for YAML translation files.
+        locales: Only these language codes; ``None`` for all.
+        namespaces: Only shards of these namespaces (and of
+            ``DEFAULT_NAMESPACE``); flat catalogs always qualify.
+            ``None`` for all.
+    """
+    wanted = {code.lower() for code in locales} if locales is not None else None
+    sharded: dict[Path, bool] = {}
+    files: list[tuple[str, str | None, Path]] = []
+    for file in sorted(locales_dir.rglob("*.yaml")):
+        parts = file.relative_to(locales_dir).parts
+        if len(parts) == 2 and sharded.setdefault(file.parent, _is_sharded(file.parent)):
+            locale_code, namespace = parts[0], file.stem
+            if namespaces is not None and namespace != DEFAULT_NAMESPACE and namespace not in namespaces:
+                continue
+        else:
+            locale_code, namespace = file.stem, None
+        if wanted is None or locale_code.lower() in wanted:
+            files.append((locale_code, namespace, file))
+    return files
+
+
+def _read_yaml(file: Path) -> object:
+    """Parse one YAML file; parse errors propagate."""
+    with file.open(encoding="utf-8") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+def _read_yaml_safe(file: Path) -> tuple[object, str | None]:
+    """Parse one YAML file in a worker process: ``(data, error message)``.
+
+    The error is returned rather than raised, so the merge step decides
+    whether it matters (a duplicate file that is ignored anyway must not
+    fail the load) and the exception never has to be pickled.
+    """
+    try:
+        return _read_yaml(file), None
+    except (yaml.YAMLError, UnicodeDecodeError) as exc:
+        return None, str(exc)
+
 
 class Loader:
-    def __init__(self, locales_dir: Path):
+    def __init__(self, locales_dir: Path, *, jobs: int | None = None):
+        """Set up the loader.
+
+        Args:
+            locales_dir: The directory for YAML translation files.
+            jobs: How many worker processes parse files in parallel.
+                ``None`` or ``1`` (default) parses serially; larger
+                values pay off only for many large catalogs, since
+                libyaml holds the GIL and a process pool has a startup
+                cost. Only build-side code passes it: a runtime load
+                can run at import time, where starting processes fails
+                under the spawn start method.
+        """
         self.locales_dir = locales_dir
+        self.jobs = jobs
 
-    def load_locales_file(self, locales: list[str] | None = None) -> dict[str, TextMap]:
+    def load_locales_file(
+        self,
+        locales: list[str] | None = None,
+        *,
+        namespaces: Collection[str] | None = None,
+    ) -> dict[str, TextMap]:
         """Load YAML translation files from the locales directory.
 
+        A locale's flat ``{locale}.yaml`` and its ``{locale}/*.yaml``
+        shards are merged into one dictionary.
+
         Args:
             locales: An optional list of language codes to load.
                 If ``None``, all ``*.yaml`` files are loaded; an empty
                 list loads nothing.
+            namespaces: Only load the shards of these namespaces (plus
+                the common shard). ``None`` loads every shard.
 
         Returns:
             A dictionary mapping locale codes to their translation
             dictionaries.
         """
-        wanted = {code.lower() for code in locales} if locales is not None else None
+        files = catalog_files(self.locales_dir, locales, namespaces)
+
+        # Parallel mode parses everything up front; the merge below stays
+        # sequential in sorted order, so duplicate handling and
+        # validation behave exactly as in the serial load.
+        parsed = self._parse_parallel([file for _, _, file in files])
 
         result: dict[str, TextMap] = {}
-        for file in sorted(self.locales_dir.rglob("*.yaml")):
-            locale_code = file.stem
-            if wanted is not None and locale_code.lower() not in wanted:
-                continue
-            if locale_code in result:
-                logger.warning(f"Duplicate locale file {file} ignored: {locale_code} already loaded")
-                continue
+        flat: set[str] = set()
+        for index, (locale_code, namespace, file) in enumerate(files):
+            if namespace is None:
+                if locale_code in flat:
+                    logger.warning(f"Duplicate locale file {file} ignored: {locale_code} already loaded")
+                    continue
+                flat.add(locale_code)
 
-            try:
-                with file.open(encoding="utf-8") as f:
-                    data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
-            except (yaml.YAMLError, UnicodeDecodeError) as exc:
-                raise ValueError(f"Failed to parse locale file {file}: {exc}") from exc
+            if parsed is None:
+                try:
+                    data = _read_yaml(file)
+                except (yaml.YAMLError, UnicodeDecodeError) as exc:
+                    raise ValueError(f"Failed to parse locale file {file}: {exc}") from exc
+            else:
+                data, error = parsed[index]
+                if error is not None:
+                    raise ValueError(f"Failed to parse locale file {file}: {error}")
 
             if data is None:
                 continue
             if not isinstance(data, dict):
                 raise ValueError(f"Expected a mapping in {file}, got {type(data).__name__}")
             if data:
-                result[locale_code] = data
+                result.setdefault(locale_code, {}).update(data)
 
         return result
+
+    def _parse_parallel(self, files: list[Path]) -> list[tuple[object, str | None]] | None:
+        """Parse ``files`` across a process pool, or ``None`` when ``jobs`` asks for a serial load."""
+        jobs = min(self.jobs or 1, len(files))
+        if jobs <= 1:
+            return None
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(_read_yaml_safe, files))
+
+
+def _dump(texts: TextMap) -> bytes:
+    """Serialize a catalog with libyaml when available: keys sorted, so diffs stay minimal."""
+    plain = {str(k): str(v) for k, v in texts.items()}
+    text: str = yaml.dump(plain, Dumper=_SafeDumper, allow_unicode=True, sort_keys=True)
+    return text.encode("utf-8")
+
+
+def _write_if_changed(target: Path, data: bytes) -> bool:
+    """Atomically write ``data`` to ``target`` unless it already holds exactly that.
+
+    The file is written to a temporary sibling and renamed into
+    place, so an interrupted write never leaves a truncated file.
+    """
+    try:
+        if target.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return True
+
+
+def make_cache_dir(cache_dir: Path) -> None:
+    """Create ``cache_dir`` (``locales_dir / ".cache"``) with a ``.gitignore`` excluding everything in it.
+
+    ``locales_dir`` is normally committed, while the extraction cache,
+    translation journal and work queue are machine-local state.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    ignore = cache_dir / ".gitignore"
+    if not ignore.exists():
+        ignore.write_text("*\n", encoding="utf-8")
+
+
+def _shard_files(locales_dir: Path, locale: str) -> list[Path]:
+    """The shards of ``locale``; none unless its directory is a sharded locale."""
+    directory = locales_dir / locale
+    return sorted(directory.glob("*.yaml")) if _is_sharded(directory) else []
+
+
+def dump_locale_file(locales_dir: Path, locale: str, texts: TextMap) -> bool:
+    """Write one locale's dictionary to the flat ``{locale}.yaml``.
+
+    Shards of the locale are removed, since the flat file now holds
+    every key.
+
+    Returns:
+        Whether anything on disk changed.
+    """
+    changed = _write_if_changed(locales_dir / f"{locale}.yaml", _dump(texts))
+    for shard in _shard_files(locales_dir, locale):
+        shard.unlink(missing_ok=True)
+        changed = True
+    return changed
+
+
+def dump_locale_shards(locales_dir: Path, locale: str, shards: Mapping[str, TextMap]) -> bool:
+    """Write one locale as ``{locale}/{namespace}.yaml`` shards, touching only shards whose content changed.
+
+    The common shard is always written, even when empty: it marks the
+    directory as a sharded locale. Other shards no longer present (or
+    empty) are removed, and so is a flat ``{locale}.yaml`` left from
+    the unsharded layout.
+
+    Returns:
+        Whether anything on disk changed.
+    """
+    changed = False
+    for namespace, texts in sorted({DEFAULT_NAMESPACE: {}, **shards}.items()):
+        if texts or namespace == DEFAULT_NAMESPACE:
+            changed |= _write_if_changed(locales_dir / locale / f"{namespace}.yaml", _dump(texts))
+    for shard in _shard_files(locales_dir, locale):
+        if shard.stem != DEFAULT_NAMESPACE and not shards.get(shard.stem):
+            shard.unlink(missing_ok=True)
+            changed = True
+    flat = locales_dir / f"{locale}.yaml"
+    if flat.exists():
+        flat.unlink()
+        changed = True
+    return changed
+
+
+def dump_runtime_translations(locales_dir: Path, locale: str, added: TextMap, texts: TextMap) -> None:
+    """Persist translations filled in at runtime.
+
+    A sharded locale gets ``added`` merged into its common shard (the
+    process may have loaded only some namespaces, so ``texts`` is not
+    the whole catalog); a flat one is rewritten from ``texts``.
+
+    Args:
+        locales_dir: The directory for YAML translation files.
+        locale: The language code.
+        added: The translations just filled in.
+        texts: Every translation of ``locale`` held in memory.
+    """
+    if not _shard_files(locales_dir, locale):
+        _write_if_changed(locales_dir / f"{locale}.yaml", _dump(texts))
+        return
+    target = locales_dir / locale / f"{DEFAULT_NAMESPACE}.yaml"
+    current = _read_yaml(target) if target.exists() else None
+    _write_if_changed(target, _dump({**(current if isinstance(current, dict) else {}), **added}))
@@ -0,0 +1,480 @@
+"""
+Plural and select messages (an ICU MessageFormat subset).
+
+``_.icu("{count, plural, one {# file} other {# files}}", count=n)``
+keeps every form of a message under one catalog key. Two things are
+compiled once and reused on every render:
+
+- CLDR plural rules, per locale, into plain Python functions
+  (``plural_rule``);
+- each message text, into a render plan whose branches are already
+  split (``compile_message``), memoized by the text itself.
+
+Picking a form is then a rule call plus a dictionary lookup; no message
+is re-parsed per render.
+
+Supported syntax: ``{name}``, ``{name, plural, [offset:N] =N {...}
+category {...} ... other {...}}``, ``{name, select, key {...} ...
+other {...}}`` and ``#`` (the plural number, minus the offset) inside
+plural branches. Apostrophe quoting is not supported.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+
+from .errors import FormatError
+
+# ── CLDR plural rules ────────────────────────────────────────────
+
+# Cardinal rules from CLDR, keyed by language; ``other`` is implicit.
+# Rules using the compact-exponent operand ``e`` are left out: they only
+# matter for numbers like "1.2 million".
+_CLDR_RULES: dict[str, dict[str, str]] = {
+    **dict.fromkeys(
+        ["en", "de", "nl", "sv", "et", "fi", "it", "ca", "gl", "ur", "sw", "fy", "io", "ia", "sc"],
+        {"one": "i = 1 and v = 0"},
+    ),
+    **dict.fromkeys(
+        ["es", "tr", "el", "hu", "bg", "nb", "no", "nn", "az", "ka", "kk", "ky", "uz", "sq", "mn", "ta", "te", "ml"],
+        {"one": "n = 1"},
+    ),
+    **dict.fromkeys(["hi", "bn", "fa", "gu", "kn", "mr", "zu", "am", "as"], {"one": "i = 0 or n = 1"}),
+    **dict.fromkeys(["fr", "pt", "hy", "ff", "kab"], {"one": "i = 0,1"}),
+    "pt-pt": {"one": "i = 1 and v = 0"},
+    "da": {"one": "n = 1 or t != 0 and i = 0,1"},
+    "is": {"one": "t = 0 and i % 10 = 1 and i % 100 != 11 or t % 10 = 1 and t % 100 != 11"},
+    "mk": {"one": "v = 0 and i % 10 = 1 and i % 100 != 11 or f % 10 = 1 and f % 100 != 11"},
+    **dict.fromkeys(
+        ["ru", "uk", "be"],
+        {
+            "one": "v = 0 and i % 10 = 1 and i % 100 != 11",
+            "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14",
+            "many": "v = 0 and i % 10 = 0 or v = 0 and i % 10 = 5..9 or v = 0 and i % 100 = 11..14",
+        },
+    ),
+    "pl": {
+        "one": "i = 1 and v = 0",
+        "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14",
+        "many": "v = 0 and i != 1 and i % 10 = 0..1 or v = 0 and i % 10 = 5..9 or v = 0 and i % 100 = 12..14",
+    },
+    **dict.fromkeys(["cs", "sk"], {"one": "i = 1 and v = 0", "few": "i = 2..4 and v = 0", "many": "v != 0"}),
+    **dict.fromkeys(
+        ["hr", "sr", "bs", "sh"],
+        {
+            "one": "v = 0 and i % 10 = 1 and i % 100 != 11 or f % 10 = 1 and f % 100 != 11",
+            "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14 or f % 10 = 2..4 and f % 100 != 12..14",
+        },
+    ),
+    "sl": {
+        "one": "v = 0 and i % 100 = 1",
+        "two": "v = 0 and i % 100 = 2",
+        "few": "v = 0 and i % 100 = 3..4 or v != 0",
+    },
+    "lt": {
+        "one": "n % 10 = 1 and n % 100 != 11..19",
+        "few": "n % 10 = 2..9 and n % 100 != 11..19",
+        "many": "f != 0",
+    },
+    "lv": {
+        "zero": "n % 10 = 0 or n % 100 = 11..19 or v = 2 and f % 100 = 11..19",
+        "one": "n % 10 = 1 and n % 100 != 11 or v = 2 and f % 10 = 1 and f % 100 != 11 or v != 2 and f % 10 = 1",
+    },
+    "ro": {"one": "i = 1 and v = 0", "few": "v != 0 or n = 0 or n != 1 and n % 100 = 1..19"},
+    "ar": {"zero": "n = 0", "one": "n = 1", "two": "n = 2", "few": "n % 100 = 3..10", "many": "n % 100 = 11..99"},
+    "he": {"one": "i = 1 and v = 0 or i = 0 and v != 0", "two": "i = 2 and v = 0"},
+    "ga": {"one": "n = 1", "two": "n = 2", "few": "n = 3..6", "many": "n = 7..10"},
+    "cy": {"zero": "n = 0", "one": "n = 1", "two": "n = 2", "few": "n = 3", "many": "n = 6"},
+}
+"""Languages missing here (ja, zh, ko, vi, th, id, ...) only have ``other``."""
+
+_CATEGORY_ORDER = ("zero", "one", "two", "few", "many")
+
+_RULE_TOKEN = re.compile(r"\s*(\.\.|!=|=|%|,|\d+|[a-z]+)")
+
+PluralRule = Callable[[Decimal | int | float], str]
+
+
+def _compile_condition(rule: str) -> str:
+    """Translate one CLDR condition into a Python expression over the operands."""
+    tokens: list[str] = _RULE_TOKEN.findall(rule)
+    pos = 0
+
+    def take() -> str:
+        nonlocal pos
+        token = tokens[pos]
+        pos += 1
+        return token
+
+    def peek() -> str | None:
+        return tokens[pos] if pos < len(tokens) else None
+
+    def relation() -> str:
+        operand = take()
+        if operand not in ("n", "i", "v", "w", "f", "t"):
+            raise ValueError(f"unknown plural operand {operand!r} in {rule!r}")
+        expr = operand
+        if peek() in ("%", "mod"):
+            take()
+            expr = f"({operand} % {take()})"
+        op = take()
+        negate = False
+        within = False
+        if op == "is":
+            if peek() == "not":
+                take()
+                negate = True
+        elif op == "not":
+            negate = True
+            op = take()
+            within = op == "within"
+        elif op == "!=":
+            negate = True
+        elif op == "within":
+            within = True
+        items: list[str] = []
+        while True:
+            low = take()
+            high = low
+            if peek() == "..":
+                take()
+                high = take()
+            if low == high:
+                items.append(f"{expr} == {low}")
+            elif within:
+                items.append(f"{low} <= {expr} <= {high}")
+            else:
+                items.append(f"({expr} % 1 == 0 and {low} <= {expr} <= {high})")
+            if peek() != ",":
+                break
+            take()
+        test = " or ".join(items)
+        return f"not ({test})" if negate else f"({test})"
+
+    def conjunction() -> str:
+        parts = [relation()]
+        while peek() == "and":
+            take()
+            parts.append(relation())
+        return " and ".join(parts)
+
+    parts = [conjunction()]
+    while peek() == "or":
+        take()
+        parts.append(conjunction())
+    if pos != len(tokens):
+        raise ValueError(f"unexpected {tokens[pos]!r} in plural rule {rule!r}")
+    return " or ".join(f"({p})" for p in parts)
+
+
+def _operands(number: Decimal | int | float) -> tuple[Decimal | int, int, int, int, int, int]:
+    """The CLDR operands ``(n, i, v, w, f, t)`` of a number."""
+    if isinstance(number, int):
+        n = abs(number)
+        return n, n, 0, 0, 0, 0
+    value = abs(number if isinstance(number, Decimal) else Decimal(repr(number)))
+    integer = int(value)
+    digits = format(value, "f")
+    fraction = digits.partition(".")[2]
+    trimmed = fraction.rstrip("0")
+    return value, integer, len(fraction), len(trimmed), int(fraction or 0), int(trimmed or 0)
+
+
+def _locale_rules(locale: str) -> dict[str, str]:
+    """The CLDR rules for a locale code, falling back to its language."""
+    code = locale.lower().replace("_", "-")
+    if code in _CLDR_RULES:
+        return _CLDR_RULES[code]
+    return _CLDR_RULES.get(code.split("-", 1)[0], {})
+
+
+@lru_cache(maxsize=256)
+def plural_rule(locale: str) -> PluralRule:
+    """The compiled cardinal plural rule of ``locale``.
+
+    The locale's CLDR conditions are translated into the body of one
+    Python function and compiled once; the function maps a number to
+    its category (``"one"``, ``"few"``, ..., ``"other"``).
+    """
+    rules = _locale_rules(locale)
+    if not rules:
+        return lambda number: "other"
+    branches = [
+        f"    if {_compile_condition(rules[category])}:\n        return {category!r}\n"
+        for category in _CATEGORY_ORDER
+        if category in rules
+    ]
+    source = "def rule(number):\n    n, i, v, w, f, t = operands(number)\n" + "".join(branches) + "    return 'other'\n"
+    namespace: dict[str, object] = {"operands": _operands}
+    exec(compile(source, f"<plural rule {locale}>", "exec"), namespace)
+    rule: PluralRule = namespace["rule"]  # type: ignore[assignment]
+    return rule
+
+
+# ── Message render plans ─────────────────────────────────────────
+
+
+@dataclass(frozen=True, slots=True)
+class _Arg:
+    """A ``{name}`` argument."""
+
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Pound:
+    """``#`` inside a plural branch: the number minus the offset."""
+
+
+@dataclass(frozen=True, slots=True)
+class _Plural:
+    name: str
+    offset: int
+    exact: dict[str, tuple[_Part, ...]]
+    """``=N`` branches, keyed by the number's canonical string."""
+    forms: dict[str, tuple[_Part, ...]]
+
+
+@dataclass(frozen=True, slots=True)
+class _Select:
+    name: str
+    forms: dict[str, tuple[_Part, ...]]
+
+
+_Part = str | _Arg | _Pound | _Plural | _Select
+
+_HEAD = re.compile(r"\s*([^\s,{}]+)\s*(?:,\s*(plural|select)\s*,)?\s*")
+_SELECTOR = re.compile(r"\s*(=?[^\s{}]+)\s*\{")
+_OFFSET = re.compile(r"\s*offset:\s*(\d+)")
+
+MESSAGE_PATTERN = re.compile(r"\{\s*[^\s,{}]+\s*,\s*(?:plural|select)\s*,")
+"""Detects a plural or select argument in a text."""
+
+
+class _MessageParser:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.pos = 0
+
+    def error(self, message: str) -> FormatError:
+        return FormatError(f"{message} at {self.pos} in message {self.text!r}")
+
+    def parse(self, *, in_plural: bool = False, nested: bool = False) -> tuple[_Part, ...]:
+        parts: list[_Part] = []
+        buffer: list[str] = []
+        text = self.text
+        while self.pos < len(text):
+            char = text[self.pos]
+            if char == "}":
+                if not nested:
+                    raise self.error("unbalanced '}'")
+                break
+            if char == "#" and in_plural:
+                self.pos += 1
+                if buffer:
+                    parts.append("".join(buffer))
+                    buffer = []
+                parts.append(_Pound())
+                continue
+            if char == "{":
+                if buffer:
+                    parts.append("".join(buffer))
+                    buffer = []
+                parts.append(self.argument())
+                continue
+            buffer.append(char)
+            self.pos += 1
+        if buffer:
+            parts.append("".join(buffer))
+        return tuple(parts)
+
+    def argument(self) -> _Part:
+        self.pos += 1  # "{"
+        head = _HEAD.match(self.text, self.pos)
+        if head is None:
+            raise self.error("expected an argument name")
+        name, kind = head.group(1), head.group(2)
+        self.pos = head.end()
+        if kind is None:
+            self.expect("}")
+            return _Arg(name)
+        offset = 0
+        if kind == "plural":
+            match = _OFFSET.match(self.text, self.pos)
+            if match is not None:
+                offset = int(match.group(1))
+                self.pos = match.end()
+        forms: dict[str, tuple[_Part, ...]] = {}
+        exact: dict[str, tuple[_Part, ...]] = {}
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.text) and self.text[self.pos] == "}":
+                self.pos += 1
+                break
+            selector = _SELECTOR.match(self.text, self.pos)
+            if selector is None:
+                raise self.error(f"expected a {kind} selector")
+            key = selector.group(1)
+            self.pos = selector.end()
+            branch = self.parse(in_plural=kind == "plural", nested=True)
+            self.expect("}")
+            if kind == "plural" and key.startswith("="):
+                exact[_canonical(key[1:])] = branch
+            else:
+                forms[key] = branch
+        if "other" not in forms:
+            raise self.error(f"{kind} argument {name!r} needs an 'other' branch")
+        if kind == "plural":
+            return _Plural(name=name, offset=offset, exact=exact, forms=forms)
+        return _Select(name=name, forms=forms)
+
+    def expect(self, char: str) -> None:
+        if self.pos >= len(self.text) or self.text[self.pos] != char:
+            raise self.error(f"expected {char!r}")
+        self.pos += 1
+
+
+def _canonical(number: object) -> str:
+    """A number's canonical string, so ``=1`` matches ``1``, ``1.0`` and ``Decimal("1")``."""
+    try:
+        value = Decimal(str(number))
+    except InvalidOperation:
+        return str(number)
+    return format(value.normalize(), "f")
+
+
+@lru_cache(maxsize=4096)
+def compile_message(text: str) -> tuple[_Part, ...]:
+    """Split a message into its render plan (memoized by text).
+
+    Raises:
+        FormatError: When the message is malformed.
+    """
+    return _MessageParser(text).parse()
+
+
+def is_message(text: str) -> bool:
+    """Whether ``text`` is a well-formed message with a plural or select argument."""
+    if MESSAGE_PATTERN.search(text) is None:
+        return False
+    try:
+        compile_message(text)
+    except FormatError:
+        return False
+    return True
+
+
+# ── Translation ──────────────────────────────────────────────────
+
+# Inside a unit handed to a translator, ``#``, ``{name}`` and nested
+# plural/select arguments are replaced by ``\uE000<i>\uE001`` markers,
+# the same private-use characters the translators mask variables with.
+_MARK_START = "\ue000"
+_MARK_END = "\ue001"
+
+
+def map_message(text: str, translate: Callable[[str], str]) -> str:
+    """Rebuild a message with ``translate`` applied to each of its texts.
+
+    The top-level text and every plural/select branch is one unit, with
+    its arguments masked, so only prose reaches ``translate``: keywords,
+    selectors, braces and ``#`` are kept. Units without letters are kept
+    as they are. Units are visited in a fixed order, so two passes over
+    the same text see the same units.
+
+    Raises:
+        FormatError: When the message is malformed.
+    """
+    return _map_parts(compile_message(text), translate)
+
+
+def _map_parts(parts: tuple[_Part, ...], translate: Callable[[str], str]) -> str:
+    pieces: list[str] = []
+    masked: list[str] = []
+    for part in parts:
+        if isinstance(part, str):
+            pieces.append(part)
+        else:
+            pieces.append(f"{_MARK_START}{len(masked)}{_MARK_END}")
+            masked.append(_map_argument(part, translate))
+    unit = "".join(pieces)
+    if any(char.isalpha() for part in parts if isinstance(part, str) for char in part):
+        unit = translate(unit)
+    for i, argument in enumerate(masked):
+        unit = unit.replace(f"{_MARK_START}{i}{_MARK_END}", argument)
+    return unit
+
+
+def _map_argument(part: _Arg | _Pound | _Plural | _Select, translate: Callable[[str], str]) -> str:
+    """Serialize one argument, translating the branches of a plural or select."""
+    if isinstance(part, _Arg):
+        return f"{{{part.name}}}"
+    if isinstance(part, _Pound):
+        return "#"
+    if isinstance(part, _Plural):
+        head = f"{part.name}, plural," + (f" offset:{part.offset}" if part.offset else "")
+        branches = [(f"={key}", branch) for key, branch in part.exact.items()] + list(part.forms.items())
+    else:
+        head = f"{part.name}, select,"
+        branches = list(part.forms.items())
+    body = " ".join(f"{key} {{{_map_parts(branch, translate)}}}" for key, branch in branches)
+    return f"{{{head} {body}}}"
+
+
+def render_message(text: str, locale: str | None, values: Mapping[str, object]) -> str:
+    """Render a plural/select message for ``locale`` with ``values``.
+
+    Args:
+        text: The message (source or translated).
+        locale: The locale whose plural rules apply; ``None`` uses
+            only the ``other`` and ``=N`` branches.
+        values: The argument values by name.
+
+    Raises:
+        FormatError: When the message is malformed or an argument is
+            missing.
+    """
+    rule = plural_rule(locale or "")
+    out: list[str] = []
+    _render(compile_message(text), rule, values, None, out)
+    return "".join(out)
+
+
+def _render(
+    plan: tuple[_Part, ...],
+    rule: PluralRule,
+    values: Mapping[str, object],
+    pound: object,
+    out: list[str],
+) -> None:
+    for part in plan:
+        if isinstance(part, str):
+            out.append(part)
+        elif isinstance(part, _Arg):
+            out.append(str(_value(values, part.name)))
+        elif isinstance(part, _Pound):
+            out.append(str(pound))
+        elif isinstance(part, _Plural):
+            number = _value(values, part.name)
+            if not isinstance(number, (int, float, Decimal)):
+                raise FormatError(f"plural argument {part.name!r} must be a number, got {type(number).__name__}")
+            shown = number - part.offset
+            branch = part.exact.get(_canonical(number))
+            if branch is None:
+                branch = part.forms.get(rule(shown), part.forms["other"])
+            _render(branch, rule, values, shown, out)
+        else:
+            selected = part.forms.get(str(_value(values, part.name)), part.forms["other"])
+            _render(selected, rule, values, pound, out)
+
+
+def _value(values: Mapping[str, object], name: str) -> object:
+    try:
+        return values[name]
+    except KeyError:
+        raise FormatError(f"missing message argument {name!r}") from None
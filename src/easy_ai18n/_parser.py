@@ -5,6 +5,10 @@ Extracts the source code block of a translation function call,
 parses it into an AST, traverses the AST to locate the call node,
 and extracts the string and f-string variables.
 
+PEP 750 template strings (``_(t"...")``, Python 3.14+) skip all of
+that: the ``Template`` already carries the static strings and the
+evaluated values, so the call is rendered without touching the frame.
+
 Everything that depends only on the call site's source text is
 compiled once into an immutable ``_CompiledCall``; each invocation
 then only evaluates the precompiled expressions against the caller's
@@ -18,19 +22,38 @@ source-text round trip).
 from __future__ import annotations
 
 import ast
+import bisect
 import itertools
 import os
-from dataclasses import dataclass
+import re
+import unicodedata
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
 from types import CodeType, FrameType
-from typing import Any
+from typing import Any, cast
 
-from ._types import Text
+from ._types import Text, TextId
 from .errors import EvaluationError, FormatError, UnsupportedSyntaxError
 
+try:
+    from string.templatelib import Template as _Template
+
+    _TEMPLATE_TYPES: tuple[type, ...] = (_Template,)
+except ImportError:  # Python < 3.14: no t-strings
+    _TEMPLATE_TYPES = ()
+
+# ``ast.TemplateStr`` / ``ast.Interpolation`` only exist on Python 3.14+;
+# empty tuples make the isinstance checks below simply never match.
+_TEMPLATE_NODES: tuple[type, ...] = tuple(filter(None, [getattr(ast, "TemplateStr", None)]))
+_INTERPOLATION_NODES: tuple[type, ...] = tuple(filter(None, [getattr(ast, "Interpolation", None)]))
+
 _CONVERSIONS = {97: "a", 114: "r", 115: "s"}
 
+_METHOD_CALLS = ("lazy", "icu", "log")
+"""``I18n`` methods whose calls carry translatable text, e.g. ``_.lazy("...")``."""
+
 _FILE_CACHE_MAX = 512
 """How many source files the byte-line cache may hold.
 
@@ -69,6 +92,46 @@ class _CompiledCall:
     sep: str
     raw_parts: tuple[str, ...]
     exprs: tuple[_CompiledExpr, ...]
+    text: Text = field(init=False)
+    """The joined template, built once instead of on every render."""
+    id: TextId = field(init=False)
+    """The template's catalog key, hashed once at compile time."""
+
+    def __post_init__(self) -> None:
+        text = Text(self.sep.join(self.raw_parts))
+        object.__setattr__(self, "text", text)
+        object.__setattr__(self, "id", text.id)
+
+
+@dataclass(frozen=True, slots=True)
+class CallSite:
+    """A call position plus its namespaces, detached from the live frame.
+
+    Mirrors the frame attributes the parser reads, so it can stand in
+    for a frame. A frame's ``f_lasti`` moves on as it keeps executing;
+    capturing it here pins the call for compiling later (lazy strings).
+    A function's locals are copied for the same reason: a loop variable
+    read later would hold its last value.
+    """
+
+    f_code: CodeType
+    f_lasti: int
+    f_globals: dict[str, Any]
+    f_locals: Mapping[str, Any]
+
+    @classmethod
+    def of(cls, frame: FrameType) -> CallSite:
+        """Snapshot the call position and locals of ``frame``; globals are kept by reference.
+
+        At module level the locals are the globals: they are kept by
+        reference too rather than copying the whole module namespace.
+        A function's locals are copied, which also stops its frame from
+        being kept alive.
+        """
+        f_locals = frame.f_locals
+        if f_locals is not frame.f_globals:
+            f_locals = dict(f_locals)
+        return cls(frame.f_code, frame.f_lasti, frame.f_globals, f_locals)
 
 
 @dataclass(kw_only=True)
@@ -78,11 +141,83 @@ class StringData:
     compiled: _CompiledCall
 
 
+# ── 预筛选 ────────────────────────────────────────────────────
+
+
+@lru_cache(maxsize=32)
+def _name_pattern(func_names: tuple[str, ...]) -> re.Pattern[str]:
+    """Standalone occurrences of any of ``func_names``.
+
+    Only ASCII identifier characters count as neighbours: an ASCII
+    letter, digit or ``_`` touching a name is always part of the same
+    token (or a syntax error), while non-ASCII neighbours merely yield
+    extra candidates. Extra candidates cost time, never correctness.
+    """
+    names = "|".join(
+        re.escape(unicodedata.normalize("NFKC", name)) for name in sorted(func_names, key=len, reverse=True)
+    )
+    return re.compile(rf"(?<![A-Za-z0-9_])(?:{names})(?![A-Za-z0-9_])")
+
+
+def candidate_lines(source: str, func_names: Sequence[str]) -> list[int]:
+    """The 1-based lines where a translation call could start, in order.
+
+    Every recognized call (``_()``, ``obj._()``, ``_[...]()``,
+    ``_.lazy()``...) contains one of ``func_names`` as a name token, so
+    a file with no candidate line has no translation call: no false
+    negatives, only possible false positives (names in strings or
+    comments). Identifiers are NFKC-normalized by Python, so non-ASCII
+    sources are also scanned in normalized form.
+    """
+    pattern = _name_pattern(tuple(func_names))
+    offsets = [m.start() for m in pattern.finditer(source)]
+    if not source.isascii():
+        # NFKC 可能改变字符数, 逐行规范化以保持行号不变
+        for lineno, line in enumerate(source.split("\n"), 1):
+            if not line.isascii() and pattern.search(unicodedata.normalize("NFKC", line)):
+                offsets.append(_line_offset(source, lineno))
+    if not offsets:
+        return []
+    newlines = [m.start() for m in re.finditer("\n", source)]
+    return sorted({bisect.bisect_left(newlines, offset) + 1 for offset in offsets})
+
+
+def _line_offset(source: str, lineno: int) -> int:
+    """The offset of the first character of 1-based line ``lineno``."""
+    offset = 0
+    for _ in range(lineno - 1):
+        offset = source.index("\n", offset) + 1
+    return offset
+
+
 class CallVisitor(ast.NodeVisitor):
-    def __init__(self, func_names: list[str]):
+    def __init__(self, func_names: list[str], lines: Sequence[int] | None = None):
+        """Collect translation calls.
+
+        Args:
+            func_names: The translation function names.
+            lines: Sorted candidate lines (``candidate_lines``). When
+                given, statements spanning none of them are skipped.
+        """
         self.func_names = func_names
+        self.lines = lines
         self.nodes: list[ast.Call] = []
 
+    def generic_visit(self, node: ast.AST) -> None:
+        if self.lines is not None and isinstance(node, ast.stmt) and not self._spans_candidate(node):
+            return
+        super().generic_visit(node)
+
+    def _spans_candidate(self, node: ast.stmt) -> bool:
+        """Whether any candidate line lies within the statement, decorators included."""
+        assert self.lines is not None
+        start = node.lineno
+        for decorator in getattr(node, "decorator_list", ()):
+            start = min(start, decorator.lineno)
+        end = node.end_lineno if node.end_lineno is not None else start
+        i = bisect.bisect_left(self.lines, start)
+        return i < len(self.lines) and self.lines[i] <= end
+
     def visit_Call(self, node: ast.Call) -> None:
         func = node.func
         # 后置选择器: _()
@@ -98,6 +233,16 @@ class CallVisitor(ast.NodeVisitor):
         ):
             new_call = ast.Call(func=func.slice, args=node.args, keywords=node.keywords)
             self.nodes.append(ast.copy_location(new_call, node))
+        # 方法调用: _.lazy()/_.icu() 或 obj._.lazy()/obj._.icu()
+        elif (
+            isinstance(func, ast.Attribute)
+            and func.attr in _METHOD_CALLS
+            and (
+                (isinstance(func.value, ast.Name) and func.value.id in self.func_names)
+                or (isinstance(func.value, ast.Attribute) and func.value.attr in self.func_names)
+            )
+        ):
+            self.nodes.append(node)
         # 深入其他可能的子节点
         self.generic_visit(node)
 
@@ -112,6 +257,9 @@ class UnsupportedSyntaxValidator:
         # 用 Tuple 包一层是为了不遍历 func(如 async 代码中合法的 _[await x](...))
         combined = ast.Tuple(elts=[*call_node.args, *(kw.value for kw in call_node.keywords)], ctx=ast.Load())
         for node in ast.walk(combined):
+            if isinstance(node, _TEMPLATE_NODES):
+                self._validate_template(node)
+                continue
             if not isinstance(node, ast.JoinedStr):
                 continue
             for value in node.values:
@@ -120,6 +268,19 @@ class UnsupportedSyntaxValidator:
                 if any(isinstance(child, ast.Await) for child in ast.walk(value.value)):
                     self._raise_unsupported(value.value)
 
+    def _validate_template(self, node: ast.AST) -> None:
+        # t-string 在运行时只携带已求值的格式说明, 动态格式说明无法还原出构建期的占位符
+        for value in getattr(node, "values", []):
+            spec = getattr(value, "format_spec", None)
+            if spec is None:
+                continue
+            if any(isinstance(child, (ast.FormattedValue, *_INTERPOLATION_NODES)) for child in ast.walk(spec)):
+                location = self._location(value)
+                raise UnsupportedSyntaxError(
+                    f"Build failed: dynamic format spec not allowed inside t-string {location}"
+                    f"\nUse a literal format spec, or an f-string instead."
+                )
+
     def _raise_unsupported(self, node: ast.AST) -> None:
         location = self._location(node)
         message = (
@@ -150,13 +311,15 @@ def _make_placeholder(source: str, conversion: str | None, spec: _CompiledSpec |
 
 
 def _compile_joined(values: list[ast.expr], *, compile_code: bool) -> tuple[str, tuple[_CompiledExpr, ...]]:
-    """Compile the values of a ``JoinedStr`` into text plus compiled expressions."""
+    """Compile the values of a ``JoinedStr`` or ``TemplateStr`` into text plus compiled expressions."""
     parts: list[str] = []
     exprs: list[_CompiledExpr] = []
     for value in values:
         if isinstance(value, ast.Constant):
             parts.append(str(value.value))
-        elif isinstance(value, ast.FormattedValue):
+        elif isinstance(value, (ast.FormattedValue, *_INTERPOLATION_NODES)):
+            # t-string 的 Interpolation 与 FormattedValue 字段一致
+            value = cast(ast.FormattedValue, value)
             source = ast.unparse(value.value)
             conversion = _CONVERSIONS.get(value.conversion)
             spec = _compile_spec(value.format_spec, compile_code=compile_code)
@@ -201,11 +364,11 @@ def _compile_call(call_node: ast.Call, default_sep: str, *, compile_code: bool)
             # 常量字符串直接添加
             raw_parts.append(str(arg.value))
             continue
-        if not isinstance(arg, ast.JoinedStr):
+        if not isinstance(arg, (ast.JoinedStr, *_TEMPLATE_NODES)):
             # 直接构造等价的 f-string 节点, 避免 "unparse → 拼字符串 → 重新 parse" 的往返
             arg = ast.JoinedStr(values=[ast.FormattedValue(value=arg, conversion=-1, format_spec=None)])
         # 单个参数内部以空串拼接, 参数之间才用 sep 连接
-        part, found = _compile_joined(arg.values, compile_code=compile_code)
+        part, found = _compile_joined(cast(ast.JoinedStr, arg).values, compile_code=compile_code)
         raw_parts.append(part)
         exprs.extend(found)
     return _CompiledCall(sep=sep, raw_parts=tuple(raw_parts), exprs=tuple(exprs))
@@ -225,7 +388,7 @@ def _apply_conversion(value: object, conversion: str) -> object:
     return value
 
 
-def _resolve_spec(spec: _CompiledSpec, globals_dict: dict[str, Any], locals_dict: dict[str, Any]) -> str:
+def _resolve_spec(spec: _CompiledSpec, globals_dict: dict[str, Any], locals_dict: Mapping[str, Any]) -> str:
     """Resolve a format spec template to a concrete spec string."""
     if spec.concrete is not None:
         return spec.concrete
@@ -235,7 +398,7 @@ def _resolve_spec(spec: _CompiledSpec, globals_dict: dict[str, Any], locals_dict
     return resolved
 
 
-def _evaluate_raw(expr: _CompiledExpr, globals_dict: dict[str, Any], locals_dict: dict[str, Any]) -> object:
+def _evaluate_raw(expr: _CompiledExpr, globals_dict: dict[str, Any], locals_dict: Mapping[str, Any]) -> object:
     """Evaluate without error wrapping (used inside format specs)."""
     if expr.code is None:
         raise RuntimeError(f"expression {expr.source!r} was not compiled")
@@ -247,7 +410,7 @@ def _evaluate_raw(expr: _CompiledExpr, globals_dict: dict[str, Any], locals_dict
     return value
 
 
-def _evaluate_expr(expr: _CompiledExpr, globals_dict: dict[str, Any], locals_dict: dict[str, Any]) -> object:
+def _evaluate_expr(expr: _CompiledExpr, globals_dict: dict[str, Any], locals_dict: Mapping[str, Any]) -> object:
     """Evaluate one expression, mirroring the original error layering."""
     if expr.code is None:
         raise EvaluationError(f"expression {expr.source!r} was not compiled")
@@ -268,7 +431,7 @@ def _evaluate_expr(expr: _CompiledExpr, globals_dict: dict[str, Any], locals_dic
 def evaluate_call(
     compiled: _CompiledCall,
     globals_dict: dict[str, Any],
-    locals_dict: dict[str, Any],
+    locals_dict: Mapping[str, Any],
 ) -> dict[str, object]:
     """Evaluate the dynamic part of a compiled call: placeholder -> value."""
     variables: dict[str, object] = {}
@@ -277,6 +440,95 @@ def evaluate_call(
     return variables
 
 
+def substitute_call(
+    compiled: _CompiledCall,
+    raw_string: str,
+    globals_dict: dict[str, Any],
+    locals_dict: Mapping[str, Any],
+) -> str:
+    """Evaluate a compiled call straight into ``raw_string``, without a variables dict.
+
+    Same result as substituting ``evaluate_call``'s variables in order.
+    """
+    for expr in compiled.exprs:
+        raw_string = raw_string.replace(expr.placeholder, str(_evaluate_expr(expr, globals_dict, locals_dict)))
+    return raw_string
+
+
+# ── 模板字符串 (PEP 750) ────────────────────────────────────────
+
+
+def is_template_call(args: tuple[object, ...]) -> bool:
+    """True when every argument is a ``string.templatelib.Template``."""
+    return bool(args) and bool(_TEMPLATE_TYPES) and all(isinstance(arg, _TEMPLATE_TYPES) for arg in args)
+
+
+@lru_cache(maxsize=_FILE_CACHE_MAX)
+def _normalize_expression(expression: str) -> str:
+    """The expression text as the build side spells it (``ast.unparse`` form)."""
+    return ast.unparse(ast.parse(f"({expression.strip()})", mode="eval").body)
+
+
+@lru_cache(maxsize=2048)
+def _compile_template(
+    shape: tuple[tuple[tuple[str, ...], tuple[tuple[str, str | None, str], ...]], ...],
+    sep: str,
+) -> _CompiledCall:
+    """Compile the static part of a t-string call from its shape.
+
+    ``shape`` holds, per argument, the static strings plus each
+    interpolation's ``(expression, conversion, format_spec)``; it is
+    all a placeholder needs, so equal shapes share one compiled call.
+    """
+    raw_parts: list[str] = []
+    exprs: list[_CompiledExpr] = []
+    for strings, interpolations in shape:
+        parts = [strings[0]]
+        for (expression, conversion, format_spec), string in zip(interpolations, strings[1:], strict=True):
+            source = _normalize_expression(expression)
+            spec = _CompiledSpec(concrete=format_spec, template=None, exprs=()) if format_spec else None
+            placeholder = _make_placeholder(source, conversion, spec)
+            exprs.append(
+                _CompiledExpr(placeholder=placeholder, source=source, code=None, conversion=conversion, spec=spec)
+            )
+            parts.append(placeholder)
+            parts.append(string)
+        raw_parts.append("".join(parts))
+    return _CompiledCall(sep=sep, raw_parts=tuple(raw_parts), exprs=tuple(exprs))
+
+
+def evaluate_templates(templates: tuple[Any, ...], sep: str) -> StringData:
+    """Render ``Template`` arguments without any frame introspection.
+
+    The placeholder text matches what ``extract_all`` produces for the
+    same ``TemplateStr`` nodes, so both sides agree on the ``TextId``;
+    the variables are the already-evaluated interpolation values.
+    """
+    shape = tuple(
+        (
+            template.strings,
+            tuple((i.expression, i.conversion, i.format_spec) for i in template.interpolations),
+        )
+        for template in templates
+    )
+    try:
+        compiled = _compile_template(shape, sep)
+    except SyntaxError as e:
+        raise EvaluationError(str(e)) from e
+    values = [i.value for template in templates for i in template.interpolations]
+    variables: dict[str, object] = {}
+    for expr, value in zip(compiled.exprs, values, strict=True):
+        if expr.conversion:
+            value = _apply_conversion(value, expr.conversion)
+        if expr.spec is not None:
+            try:
+                value = format(value, expr.spec.concrete or "")
+            except Exception as e:
+                raise FormatError(str(e)) from e
+        variables[expr.placeholder] = value
+    return StringData(string=compiled.text, variables=variables, compiled=compiled)
+
+
 class ASTParser:
     def __init__(self, sep: str, func_names: list[str]):
         self.sep = sep
@@ -297,7 +549,7 @@ class ASTParser:
             return tuple(f.read().splitlines(keepends=True))
 
     @staticmethod
-    def _call_span(frame: FrameType) -> tuple[int, int, int, int] | None:
+    def _call_span(frame: FrameType | CallSite) -> tuple[int, int, int, int] | None:
         """The source span of the CALL instruction, straight from the code object.
 
         Returns ``(lineno, end_lineno, col_offset, end_col_offset)`` (1-based
@@ -314,7 +566,7 @@ class ASTParser:
             return None
         return lineno, end_lineno, col_offset, end_col_offset
 
-    def get_code_block(self, frame: FrameType) -> str:
+    def get_code_block(self, frame: FrameType | CallSite) -> str:
         """The exact source text of the call, or ``""`` when unavailable."""
         span = self._call_span(frame)
         if span is None:
@@ -339,7 +591,7 @@ class ASTParser:
         except UnicodeDecodeError:
             return ""
 
-    def compile_from_frame(self, frame: FrameType) -> _CompiledCall | None:
+    def compile_from_frame(self, frame: FrameType | CallSite) -> _CompiledCall | None:
         """Compile the translation call at the given frame, or None when unavailable."""
         call_text = self.get_code_block(frame)
         if not call_text:
@@ -351,11 +603,10 @@ class ASTParser:
         return _compile_call(target_nodes[0], self.sep, compile_code=True)
 
     @staticmethod
-    def evaluate(compiled: _CompiledCall, frame: FrameType) -> StringData:
+    def evaluate(compiled: _CompiledCall, frame: FrameType | CallSite) -> StringData:
         """Evaluate a compiled call against the frame's namespace."""
         variables = evaluate_call(compiled, frame.f_globals, frame.f_locals)
-        template = compiled.sep.join(compiled.raw_parts)
-        return StringData(string=Text(template) if template else Text(""), variables=variables, compiled=compiled)
+        return StringData(string=compiled.text, variables=variables, compiled=compiled)
 
     def extract_all(
         self,
@@ -363,6 +614,7 @@ class ASTParser:
         node: ast.AST,
         source_path: Path | None = None,
         source: str | None = None,
+        lines: Sequence[int] | None = None,
     ) -> list[StringData]:
         """Extract all translation strings from an AST node.
 
@@ -370,11 +622,13 @@ class ASTParser:
             node: The AST node to search.
             source_path: The source file path (for error reporting).
             source: The source code (for error reporting).
+            lines: Sorted candidate lines from ``candidate_lines``;
+                statements spanning none of them are not walked.
 
         Returns:
             A list of ``StringData`` objects for each matched call.
         """
-        target_nodes = self.get_target_nodes(node)
+        target_nodes = self.get_target_nodes(node, lines)
         if not target_nodes:
             return []
 
@@ -383,18 +637,11 @@ class ASTParser:
         for call_node in target_nodes:
             validator.validate_call(call_node)
             compiled = _compile_call(call_node, self.sep, compile_code=False)
-            template = compiled.sep.join(compiled.raw_parts)
             variables: dict[str, object] = {expr.placeholder: None for expr in compiled.exprs}
-            results.append(
-                StringData(
-                    string=Text(template) if template else Text(""),
-                    variables=variables,
-                    compiled=compiled,
-                )
-            )
+            results.append(StringData(string=compiled.text, variables=variables, compiled=compiled))
         return results
 
-    def get_target_nodes(self, node: ast.AST) -> list[ast.Call]:
-        visitor = CallVisitor(self.func_names)
+    def get_target_nodes(self, node: ast.AST, lines: Sequence[int] | None = None) -> list[ast.Call]:
+        visitor = CallVisitor(self.func_names, lines)
         visitor.visit(node)
         return visitor.nodes
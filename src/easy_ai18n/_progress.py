@@ -140,6 +140,8 @@ class LineReporter:
         # Same semantics as rich: completed=None means "do not update"
         if fields.get("completed") is not None:
             self.tasks[task_id]["completed"] = fields["completed"]
+        if fields.get("total") is not None:
+            self.tasks[task_id]["total"] = fields["total"]
 
     def remove_task(self, task_id: object) -> None:
         pass
@@ -191,6 +193,17 @@ class ProgressHandle:
             self.reporter.advance(self.children[locale], n)
             self.reporter.advance(self.parent, n)
 
+    def extend(self, locale: str, n: int) -> None:
+        """Streaming builds: ``n`` more items were queued for ``locale``."""
+        self.locale_totals[locale] = self.locale_totals.get(locale, 0) + n
+        total = sum(self.locale_totals.values())
+        if self.live is not None:
+            self.live.update(self.children[locale], total=self.locale_totals[locale])
+            self.live.update(self.parent, total=total)
+        elif self.reporter is not None:
+            self.reporter.update(self.children[locale], total=self.locale_totals[locale])
+            self.reporter.update(self.parent, total=total)
+
     def retrying(self, locale: str) -> None:
         """Translation failed; a retry is in progress."""
         desc = self._desc(locale, retrying=True)
@@ -301,24 +314,29 @@ async def translation_progress(
     locale_totals: dict[str, int],
     *,
     show_progress: bool,
+    streaming: bool = False,
 ) -> AsyncIterator[ProgressHandle]:
     """Set up the progress UI for ``locale_totals`` (locale -> item count).
 
     Display order follows the insertion order of ``locale_totals``.
     The parent task shows the number of languages being translated.
     Automatic degradation:
-    - ``show_progress=False`` / total of 0 → no-op
+    - ``show_progress=False`` / total of 0 (unless ``streaming``) → no-op
     - non-terminal / dumb terminal → ``LineReporter``
     - real terminal → rich ``Progress``
+
+    With ``streaming``, totals start as given (usually 0) and grow
+    through ``ProgressHandle.extend`` as work is discovered.
     """
     total = sum(locale_totals.values())
-    if not show_progress or total == 0:
+    if not show_progress or (total == 0 and not streaming):
         yield ProgressHandle(locale_order=list(locale_totals), locale_totals=locale_totals)
         return
 
     console = Console(stderr=True)  # force_terminal defaults to None = auto-detect
     if not console.is_terminal or console.is_dumb_terminal:
-        reporter = LineReporter(console, summary=_make_summary(locale_totals), interval=_PROGRESS_INTERVAL)
+        summary = f"Translating {_lang_label(len(locale_totals))} while scanning sources" if streaming else None
+        reporter = LineReporter(console, summary=summary or _make_summary(locale_totals), interval=_PROGRESS_INTERVAL)
         with reporter:
             parent = reporter.add_task("Total", total=total)
             children: dict[str, Any] = {}
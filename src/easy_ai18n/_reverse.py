@@ -0,0 +1,115 @@
+"""
+Reverse lookup from translated text back to its ``TextId``.
+
+Chat bots with reply keyboards receive the localized button label as
+the message text. A ``ReverseIndex`` maps every translated text of
+every locale to its ID once, at load and reload, so identifying the
+source string is a dictionary lookup instead of a scan of the catalog.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+
+from ._types import Text, TextId
+
+Normalizer = Callable[[str], str]
+
+
+def normalize_text(text: str) -> str:
+    """Case- and whitespace-insensitive form: casefolded, runs of whitespace collapsed."""
+    return " ".join(text.split()).casefold()
+
+
+@dataclass(frozen=True, slots=True)
+class ReverseMatch:
+    """Where a translated text came from."""
+
+    locale: str
+    """The locale whose translation matched."""
+
+    id: TextId
+    """The ID of the source string."""
+
+    source: str | None
+    """The source template, when known (a call site rendering it has been compiled)."""
+
+
+class ReverseIndex:
+    def __init__(self, *, source_locale: str, normalize: Normalizer | None = None) -> None:
+        """Set up an empty index (``rebuild`` fills it).
+
+        Args:
+            source_locale: The source language; its texts are their own
+                translation and are matched by hashing.
+            normalize: Applied to indexed and looked-up texts, e.g.
+                ``normalize_text``. ``None`` matches exactly.
+        """
+        self.source_locale = source_locale
+        self.normalize = normalize
+        self.sources: dict[TextId, str] = {}
+        """Source templates by ID, recorded as call sites are compiled."""
+        self._index: dict[str, dict[str, TextId]] = {}
+        self._source_keys: dict[str, TextId] = {}
+        self._locales: Mapping[str, Mapping[TextId, str]] = {}
+
+    def rebuild(self, locales: Mapping[str, Mapping[TextId, str]]) -> None:
+        """Index every locale from scratch (catalog load and reload).
+
+        When two IDs share a translation, the first in ID order wins.
+        """
+        index: dict[str, dict[str, TextId]] = {}
+        for locale, texts in locales.items():
+            by_text: dict[str, TextId] = {}
+            for text_id in sorted(texts):
+                by_text.setdefault(self._key(texts[text_id]), text_id)
+            index[locale] = by_text
+        self._index = index
+        self._locales = locales
+
+    def add(self, locale: str, text_id: TextId, text: str) -> None:
+        """Index one translation added at runtime."""
+        self._index.setdefault(locale, {}).setdefault(self._key(text), text_id)
+
+    def record_sources(self, texts: Iterable[Text]) -> None:
+        """Remember source templates so matches can report them."""
+        for text in texts:
+            if text:
+                self.sources[text.id] = str(text)
+                self._source_keys.setdefault(self._key(text), text.id)
+
+    def lookup(self, text: str, locale: str | None = None) -> ReverseMatch | None:
+        """Find the source string of a translated text.
+
+        Args:
+            text: The translated text, e.g. an incoming message.
+            locale: The locale to search. ``None`` searches every
+                locale, then the source texts.
+
+        Returns:
+            The match, or ``None`` when no translation equals ``text``.
+        """
+        key = self._key(text)
+        if locale is None:
+            for match_locale, by_text in self._index.items():
+                text_id = by_text.get(key)
+                if text_id is not None:
+                    return ReverseMatch(match_locale, text_id, self.sources.get(text_id))
+        elif locale != self.source_locale:
+            text_id = self._index.get(locale, {}).get(key)
+            return ReverseMatch(locale, text_id, self.sources.get(text_id)) if text_id is not None else None
+
+        # The source language has no catalog: its texts are matched
+        # against the recorded sources, or by ID when matching exactly.
+        text_id = self._source_keys.get(key)
+        if text_id is None and self.normalize is None:
+            candidate = Text.id_of(text)
+            if any(candidate in texts for texts in self._locales.values()):
+                text_id = candidate
+        if text_id is None:
+            return None
+        return ReverseMatch(self.source_locale, text_id, self.sources.get(text_id, text))
+
+    def _key(self, text: str) -> str:
+        return self.normalize(text) if self.normalize is not None else text
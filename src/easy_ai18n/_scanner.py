@@ -0,0 +1,246 @@
+"""
+Project scanner: finds the Python files a build extracts strings from.
+
+Include and exclude patterns are compiled once into one regular
+expression each, and matched against ``/``-separated paths relative to
+the project root, so the walk never builds ``Path`` objects for
+directories it only passes through. The walk itself uses
+``os.scandir``, whose directory entries answer ``is_dir`` without a
+``stat`` call on most platforms.
+
+Directories are pruned when they match an exclude pattern, when a
+``.gitignore``/``.ignore`` file (or ``.git/info/exclude``) ignores
+them, or when they contain a ``pyvenv.cfg`` (a virtual environment,
+whatever its name).
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Iterable
+from pathlib import Path
+
+IGNORE_FILES = (".gitignore", ".ignore")
+"""Per-directory ignore files, in increasing precedence."""
+
+_FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+
+def _translate_segment(segment: str) -> str:
+    """Regex for one glob path segment: ``*``, ``?``, ``[...]`` and ``\\`` escapes never cross ``/``."""
+    out: list[str] = []
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            while i < n and segment[i] == "*":
+                i += 1
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "\\" and i < n:
+            out.append(re.escape(segment[i]))
+            i += 1
+        elif c == "[":
+            j = i + 1 if i < n and segment[i] in "!^" else i
+            if j < n and segment[j] == "]":
+                j += 1
+            j = segment.find("]", j)
+            if j < 0:
+                out.append(re.escape(c))
+                continue
+            body = segment[i:j]
+            i = j + 1
+            negate = body[:1] in ("!", "^")
+            body = body[1:] if negate else body
+            body = body.replace("\\", "\\\\")
+            out.append(f"(?!/)[{'^' if negate else ''}{body}]")
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def _pattern_regex(pattern: str) -> str | None:
+    """Regex for the ``include``/``exclude`` rule, ``None`` when it can never match.
+
+    A path matches when it equals the pattern, descends from it, or
+    glob-matches its trailing segments (``PurePath.match``).
+    """
+    path = Path(pattern)
+    if path.is_absolute():
+        return None
+    parts = path.parts
+    if not parts:  # "." names the project root: everything descends from it
+        return ".*"
+    literal = re.escape("/".join(parts))
+    glob = "/".join(_translate_segment(part) for part in parts)
+    return f"{literal}(?:/.*)?|(?:.*/)?{glob}"
+
+
+class PathMatcher:
+    """``include``/``exclude`` patterns compiled into a single regex."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        regexes = [r for r in map(_pattern_regex, patterns) if r is not None]
+        self._regex = re.compile("|".join(f"(?:{r})" for r in regexes), _FLAGS) if regexes else None
+
+    def __bool__(self) -> bool:
+        return self._regex is not None
+
+    def match(self, rel: str) -> bool:
+        """Whether the ``/``-separated path ``rel`` (relative to the project root) matches a pattern."""
+        return self._regex is not None and self._regex.fullmatch(rel) is not None
+
+
+class IgnoreRules:
+    """The rules of one ignore file, applying below its directory."""
+
+    def __init__(self, base: str, lines: Iterable[str]) -> None:
+        """Compile gitignore-syntax ``lines``.
+
+        Args:
+            base: The directory of the ignore file, relative to the
+                project root (``""`` for the root).
+            lines: The file's lines.
+        """
+        self.base = base
+        self._negated: dict[str, bool] = {}
+        dir_rules: list[str] = []
+        file_rules: list[str] = []
+        for line in lines:
+            parsed = self._parse(line)
+            if parsed is None:
+                continue
+            regex, negated, dir_only = parsed
+            group = f"r{len(self._negated)}"
+            self._negated[group] = negated
+            dir_rules.append(f"(?P<{group}>{regex})")
+            if not dir_only:
+                file_rules.append(f"(?P<{group}>{regex})")
+        # The leftmost alternative that matches wins, so the last rule
+        # (which takes precedence in gitignore) comes first.
+        self._dir_regex = re.compile("|".join(reversed(dir_rules)), _FLAGS) if dir_rules else None
+        self._file_regex = re.compile("|".join(reversed(file_rules)), _FLAGS) if file_rules else None
+
+    @staticmethod
+    def _parse(line: str) -> tuple[str, bool, bool] | None:
+        """``(regex, negated, dir_only)`` of one line, ``None`` for blanks and comments."""
+        line = line.rstrip("\n\r")
+        stripped = line.rstrip(" ")
+        if stripped.endswith("\\") and len(stripped) < len(line):
+            stripped += " "  # an escaped trailing space is kept
+        line = stripped
+        if not line or line.startswith("#"):
+            return None
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        elif line.startswith(("\\!", "\\#")):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            return None
+        anchored = "/" in line
+        segments = line.lstrip("/").split("/")
+        out: list[str] = []
+        for i, segment in enumerate(segments):
+            last = i == len(segments) - 1
+            if segment == "**":
+                out.append(".*" if last else "(?:.*/)?")
+            else:
+                out.append(_translate_segment(segment) + ("" if last else "/"))
+        prefix = "" if anchored else "(?:.*/)?"
+        return prefix + "".join(out), negated, dir_only
+
+    def match(self, rel: str, is_dir: bool) -> bool | None:
+        """``True`` when ignored, ``False`` when re-included by a ``!`` rule, ``None`` when no rule matches."""
+        regex = self._dir_regex if is_dir else self._file_regex
+        if regex is None:
+            return None
+        local = rel[len(self.base) + 1 :] if self.base else rel
+        m = regex.fullmatch(local)
+        if m is None or m.lastgroup is None:
+            return None
+        return not self._negated[m.lastgroup]
+
+
+def _read_rules(path: str, base: str) -> IgnoreRules | None:
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return IgnoreRules(base, f)
+    except OSError:
+        return None
+
+
+def _ignored(rules: tuple[IgnoreRules, ...], rel: str, is_dir: bool) -> bool:
+    """Whether the innermost ignore file with a matching rule ignores ``rel``."""
+    for rule_set in reversed(rules):
+        verdict = rule_set.match(rel, is_dir)
+        if verdict is not None:
+            return verdict
+    return False
+
+
+def scan_project(
+    root: Path,
+    *,
+    include: Iterable[str] = (),
+    exclude: Iterable[str] = (),
+    ignore_files: bool = True,
+) -> list[Path]:
+    """The project's ``.py`` files, depth-first in name order.
+
+    Args:
+        root: The project root.
+        include: Patterns a file must match (any file when empty).
+        exclude: Patterns of directories to prune.
+        ignore_files: Whether ``.gitignore``/``.ignore`` files and
+            ``.git/info/exclude`` prune the walk as well.
+    """
+    include_matcher = PathMatcher(include)
+    exclude_matcher = PathMatcher(exclude)
+    root_rules: tuple[IgnoreRules, ...] = ()
+    if ignore_files:
+        info_exclude = _read_rules(os.path.join(root, ".git", "info", "exclude"), "")
+        root_rules = (info_exclude,) if info_exclude is not None else ()
+
+    files: list[Path] = []
+    stack: list[tuple[str, str, tuple[IgnoreRules, ...]]] = [(str(root), "", root_rules)]
+    while stack:
+        path, rel, rules = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        names = {entry.name for entry in entries}
+        if rel and "pyvenv.cfg" in names:
+            continue
+        if ignore_files:
+            for name in IGNORE_FILES:
+                if name in names:
+                    rule_set = _read_rules(os.path.join(path, name), rel)
+                    if rule_set is not None:
+                        rules = (*rules, rule_set)
+
+        subdirs: list[tuple[str, str, tuple[IgnoreRules, ...]]] = []
+        for entry in entries:
+            child = f"{rel}/{entry.name}" if rel else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if not exclude_matcher.match(child) and not (rules and _ignored(rules, child, True)):
+                    subdirs.append((entry.path, child, rules))
+            elif entry.name.endswith(".py"):
+                if rules and _ignored(rules, child, False):
+                    continue
+                if include_matcher and not include_matcher.match(child):
+                    continue
+                files.append(Path(entry.path))
+        stack.extend(reversed(subdirs))
+    return files
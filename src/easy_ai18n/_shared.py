@@ -0,0 +1,339 @@
+"""
+Catalog snapshots shared between processes.
+
+A ``CatalogPublisher`` (the catalog daemon) parses the YAML files once
+and publishes each version of the catalog as a snapshot in
+``multiprocessing.shared_memory``. Worker processes read snapshots with
+a ``SnapshotReader`` instead of parsing YAML themselves, and poll a
+small header segment for new versions. Readers look texts up in place
+(``SharedTexts``): the translations exist once per host, not once per
+worker.
+
+Layout: the header segment ``{name}`` holds the current version
+(unsigned 64-bit). Version ``v`` lives in its own segment ``{name}.{v}``:
+the directory length (unsigned 64-bit), the directory as UTF-8 JSON
+``{locale: [table offset, record count]}``, then the data area: one
+record table per locale, sorted by the UTF-8 bytes of the ``TextId``,
+followed by the UTF-8 strings the records point to. A published segment
+is never modified, only unlinked once two newer versions exist, so a
+reader never sees a partial snapshot; a reader that loses the race with
+an unlink simply retries with the newer version.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+import threading
+from collections.abc import Iterator, Mapping, MutableMapping
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from ._loader import Loader
+from ._types import TextId
+
+_U64 = struct.Struct("<Q")
+_RECORD = struct.Struct("<QIQI")
+"""``(key offset, key length, value offset, value length)``, offsets into the data area."""
+_RETRIES = 5
+_MISSES_MAX = 4096
+"""Missing keys a ``SharedTexts`` remembers before it starts over."""
+
+_created: set[str] = set()
+"""Segments created (and tracked) by publishers in this process."""
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without the resource tracker owning it.
+
+    Before Python 3.13 every attaching process registers the segment
+    with its resource tracker, which unlinks it when that process
+    exits; only the publisher may unlink.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    from multiprocessing import resource_tracker
+
+    shm = shared_memory.SharedMemory(name)
+    if name not in _created:  # the tracker entry is the local publisher's own
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+def _create(name: str, size: int) -> shared_memory.SharedMemory:
+    shm = shared_memory.SharedMemory(name, create=True, size=size)
+    _created.add(name)
+    return shm
+
+
+def _unlink(shm: shared_memory.SharedMemory) -> None:
+    shm.close()
+    shm.unlink()
+    _created.discard(shm.name)
+
+
+def _buffer(segment: shared_memory.SharedMemory) -> memoryview:
+    """The segment's buffer; fails once the segment is closed."""
+    buf = segment.buf
+    if buf is None:
+        raise ValueError(f"Shared memory {segment.name!r} is closed")
+    return buf
+
+
+def _encode(locales: Mapping[str, Mapping[TextId, str]]) -> bytes:
+    """A snapshot segment's content (see the module docstring)."""
+    table_size = sum(len(texts) for texts in locales.values()) * _RECORD.size
+    directory: dict[str, tuple[int, int]] = {}
+    records = bytearray()
+    blob = bytearray()
+    for locale, texts in locales.items():
+        directory[locale] = (len(records), len(texts))
+        for key, value in sorted((k.encode(), str(v).encode()) for k, v in texts.items()):
+            key_offset = table_size + len(blob)
+            blob += key
+            records += _RECORD.pack(key_offset, len(key), key_offset + len(key), len(value))
+            blob += value
+    head = json.dumps(directory, separators=(",", ":")).encode()
+    return _U64.pack(len(head)) + head + records + blob
+
+
+class SharedTexts(MutableMapping[TextId, str]):
+    """One locale's translations, read in place from a snapshot segment.
+
+    The first lookup of a key binary-searches the locale's record table
+    and decodes only the text found; the result is kept in a plain dict,
+    so later lookups cost a dict lookup and the process holds only the
+    texts it actually renders. Keys found missing are remembered too (up
+    to ``_MISSES_MAX``). Keys added at runtime (``BackgroundFiller``) go
+    to a local overlay; the snapshot itself is read-only. Each snapshot
+    version gets new instances, so nothing cached outlives its version.
+    """
+
+    __slots__ = ("_segment", "_buf", "_base", "_table", "_count", "_extra", "_decoded", "_misses")
+
+    def __init__(self, segment: shared_memory.SharedMemory, base: int, table: int, count: int) -> None:
+        self._segment = segment  # keeps the segment mapped while this locale is in use
+        self._buf = _buffer(segment)
+        self._base = base
+        self._table = base + table
+        self._count = count
+        self._extra: dict[TextId, str] = {}
+        self._decoded: dict[TextId, str] = {}
+        self._misses: set[TextId] = set()
+
+    def _record(self, index: int) -> tuple[int, int, int, int]:
+        record: tuple[int, int, int, int] = _RECORD.unpack_from(self._buf, self._table + index * _RECORD.size)
+        return record
+
+    def _key(self, index: int) -> bytes:
+        key_offset, key_length, _, _ = self._record(index)
+        start = self._base + key_offset
+        return self._buf[start : start + key_length].tobytes()
+
+    def _find(self, key: str) -> int:
+        """The record index of ``key``, or ``-1``."""
+        target = key.encode()
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            probe = self._key(middle)
+            if probe < target:
+                low = middle + 1
+            elif probe > target:
+                high = middle
+            else:
+                return middle
+        return -1
+
+    def __getitem__(self, key: TextId) -> str:
+        try:
+            return self._decoded[key]
+        except KeyError:
+            pass
+        index = -1 if key in self._misses else self._find(key)
+        if index < 0:
+            if len(self._misses) >= _MISSES_MAX:
+                self._misses.clear()
+            self._misses.add(key)
+            raise KeyError(key)
+        _, _, value_offset, value_length = self._record(index)
+        start = self._base + value_offset
+        value = self._decoded[key] = str(self._buf[start : start + value_length], "utf-8")
+        return value
+
+    def get(self, key: TextId, default: Any = None) -> Any:
+        """``Mapping.get`` without raising and catching ``KeyError`` for cached texts and known misses."""
+        value = self._decoded.get(key)
+        if value is not None:
+            return value
+        if key in self._misses:
+            return default
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        try:
+            self[TextId(key)]
+        except KeyError:
+            return False
+        return True
+
+    def __setitem__(self, key: TextId, value: str) -> None:
+        self._extra[key] = self._decoded[key] = value
+        self._misses.discard(key)
+
+    def __delitem__(self, key: TextId) -> None:
+        if key not in self._extra:
+            raise TypeError(f"Snapshot translations are read-only: {key!r}")
+        del self._extra[key]
+        del self._decoded[key]
+
+    def __iter__(self) -> Iterator[TextId]:
+        yield from self._extra
+        for index in range(self._count):
+            key = TextId(self._key(index).decode())
+            if key not in self._extra:
+                yield key
+
+    def __len__(self) -> int:
+        return self._count + sum(1 for key in self._extra if self._find(key) < 0)
+
+
+def _source_signature(locales_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """``(path, mtime, size)`` of every YAML file: changes when any file does."""
+    signature = []
+    for file in sorted(locales_dir.rglob("*.yaml")):
+        try:
+            stat = file.stat()
+        except OSError:
+            continue
+        signature.append((str(file), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+class CatalogPublisher:
+    """Loads a locales directory once and publishes versioned snapshots."""
+
+    def __init__(self, locales_dir: Path, name: str) -> None:
+        """Create the header segment (nothing is published yet).
+
+        Args:
+            locales_dir: The directory for YAML translation files.
+            name: The shared-memory name readers attach to. Keep it
+                short: some platforms limit names to about 30 bytes.
+        """
+        self.locales_dir = Path(locales_dir)
+        self.name = name
+        self.version = 0
+        self._header = _create(name, _U64.size)
+        _U64.pack_into(_buffer(self._header), 0, 0)
+        self._segments: dict[int, shared_memory.SharedMemory] = {}
+        self._signature: tuple[tuple[str, int, int], ...] | None = None
+
+    def publish(self) -> int:
+        """Parse the YAML files and publish them as the next version.
+
+        Returns:
+            The published version.
+        """
+        self._signature = _source_signature(self.locales_dir)
+        locales = Loader(self.locales_dir).load_locales_file()
+        payload = _encode(locales)
+        version = self.version + 1
+        segment = _create(f"{self.name}.{version}", len(payload))
+        _buffer(segment)[: len(payload)] = payload
+        self._segments[version] = segment
+        # The new segment is complete before readers can learn its version.
+        _U64.pack_into(_buffer(self._header), 0, version)
+        self.version = version
+        for old in [v for v in self._segments if v < version - 1]:
+            self._release(old)
+        logger.info(f"Published catalog {self.name!r} version {version} ({len(payload)} bytes)")
+        return version
+
+    def publish_if_changed(self) -> bool:
+        """Publish a new version when a YAML file was added, removed or modified."""
+        if self._signature is not None and _source_signature(self.locales_dir) == self._signature:
+            return False
+        self.publish()
+        return True
+
+    def serve_forever(self, poll_interval: float = 1.0, stop: threading.Event | None = None) -> None:
+        """Publish, then republish whenever the YAML files change, until ``stop`` is set."""
+        stop = stop or threading.Event()
+        try:
+            self.publish_if_changed()
+            while not stop.wait(poll_interval):
+                try:
+                    self.publish_if_changed()
+                except ValueError as e:  # a file mid-edit: keep serving the last version
+                    logger.warning(f"Catalog {self.name!r} not republished: {e}")
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Unlink every segment; attached readers keep the versions they hold mapped."""
+        for version in list(self._segments):
+            self._release(version)
+        _unlink(self._header)
+
+    def _release(self, version: int) -> None:
+        _unlink(self._segments.pop(version))
+
+
+class SnapshotReader:
+    """Attaches to a publisher's snapshots by name."""
+
+    def __init__(self, name: str) -> None:
+        """Attach to the header segment.
+
+        Raises:
+            FileNotFoundError: When no publisher with ``name`` is running.
+        """
+        self.name = name
+        self._header = _attach(name)
+
+    def version(self) -> int:
+        """The latest published version (``0`` before the first publish)."""
+        version: int = _U64.unpack_from(_buffer(self._header), 0)[0]
+        return version
+
+    def load(self) -> tuple[int, dict[str, SharedTexts]]:
+        """Attach to the latest snapshot: ``(version, locales)``.
+
+        Each locale is a ``SharedTexts`` view of the segment, which
+        stays mapped until the last of them is dropped.
+
+        Raises:
+            LookupError: When nothing has been published yet.
+        """
+        for _ in range(_RETRIES):
+            version = self.version()
+            if version == 0:
+                raise LookupError(f"Catalog {self.name!r} has not been published yet")
+            try:
+                segment = _attach(f"{self.name}.{version}")
+            except FileNotFoundError:  # superseded while we read the header
+                continue
+            buf = _buffer(segment)
+            (size,) = _U64.unpack_from(buf, 0)
+            head = buf[_U64.size : _U64.size + size]
+            try:
+                directory: dict[str, list[int]] = json.loads(bytes(head))
+            finally:
+                head.release()
+            base = _U64.size + size
+            locales = {locale: SharedTexts(segment, base, *entry) for locale, entry in directory.items()}
+            return version, locales
+        raise LookupError(f"Catalog {self.name!r} changed too often to read a snapshot")
+
+    def close(self) -> None:
+        self._header.close()
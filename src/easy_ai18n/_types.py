@@ -8,6 +8,11 @@ TextId = NewType("TextId", str)
 """A hash-based identifier for a translatable string."""
 
 
+def _hash_id(text: str) -> TextId:
+    """The 12-hex MD5 ID of a text (uncached)."""
+    return TextId(hashlib.md5(text.encode("utf-8")).hexdigest()[:12])
+
+
 @lru_cache(maxsize=8192)
 def _text_id(text: str) -> TextId:
     """The 12-hex MD5 ID of a text, memoized by content.
@@ -18,7 +23,18 @@ def _text_id(text: str) -> TextId:
     every render; the LRU bound keeps dynamically generated texts from
     growing memory without limit.
     """
-    return TextId(hashlib.md5(text.encode("utf-8")).hexdigest()[:12])
+    return _hash_id(text)
+
+
+@lru_cache(maxsize=4096)
+def _dynamic_text_id(text: str) -> TextId:
+    """The ID of a runtime value, memoized apart from ``_text_id``.
+
+    Values looked up by content (database labels, config strings) can be
+    high-cardinality; a separate LRU keeps them from evicting the IDs of
+    the static call-site templates.
+    """
+    return _hash_id(text)
 
 
 class Text(str):
@@ -35,5 +51,21 @@ class Text(str):
         return _text_id(text)
 
 
+class DynamicText(Text):
+    """A runtime value looked up in the catalogs by content.
+
+    Same ID as ``Text``; only the memo cache differs.
+    """
+
+    @property
+    def id(self) -> TextId:
+        """The 12-hex MD5 ID of this text."""
+        return _dynamic_text_id(self)
+
+
+class MessageText(Text):
+    """A plural/select message (ICU subset), rendered per locale by ``_message``."""
+
+
 TextMap = dict[TextId, str]
 """A mapping from ``TextId`` to the corresponding text."""
@@ -3,26 +3,98 @@ Translation function and language selector.
 """
 
 import inspect
+import re
 import sys
+import time
+import weakref
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
-from types import CodeType, FrameType
-from typing import Self, SupportsIndex
+from types import FrameType
+from typing import TYPE_CHECKING, Any, ClassVar, Self, SupportsIndex, get_origin
 
 from loguru import logger
 
-from ._loader import Loader
-from ._parser import ASTParser, _CompiledCall
-from ._types import Text, TextMap
+from ._catalog import CallKey, get_catalog
+from ._message import render_message
+from ._parser import ASTParser, CallSite, _CompiledCall, evaluate_templates, is_template_call, substitute_call
+from ._types import DynamicText, MessageText, Text, TextId
 from .errors import EvaluationError, FormatError, UnsupportedSyntaxError
 
+if TYPE_CHECKING:
+    from ._filler import BackgroundFiller
+    from ._reverse import Normalizer, ReverseIndex, ReverseMatch
+    from .translators import BaseTranslator
+
 __all__ = [
     "PreLocaleSelector",
     "LocaleContent",
+    "LazyLocaleContent",
     "I18n",
     "PostLocaleSelector",
 ]
 
 
+MissingHook = Callable[[str, TextId, str, tuple[str, ...]], None]
+"""``(locale, text ID, source text, placeholders)``: reports a key missing at render time."""
+
+
+def _template_source(template: Any) -> str:
+    """A t-string spelled back as its source text, used when rendering fails."""
+    return "".join(item if isinstance(item, str) else "{" + item.expression + "}" for item in template)
+
+
+_MEMO_MAX = 4096
+"""Cap for one render scope; a scope that outgrows it starts over."""
+
+_render_memo: ContextVar[dict[tuple[object, ...], Any] | None] = ContextVar("easy_ai18n_render_memo", default=None)
+"""The active render scope's memo (see ``I18n.render_scope``), or ``None``."""
+
+
+def _memo_values(values: Iterable[object]) -> tuple[object, ...] | None:
+    """Variable values as part of a memo key, or ``None`` when one is unhashable.
+
+    The type is kept next to each value: ``1``, ``1.0`` and ``True``
+    compare equal but render differently.
+    """
+    key = tuple((type(value), value) for value in values)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _memo_store(memo: dict[tuple[object, ...], Any], key: tuple[object, ...], value: Any) -> None:
+    if len(memo) >= _MEMO_MAX:
+        memo.clear()
+    memo[key] = value
+
+
+@lru_cache(maxsize=4096)
+def _encoded_segments(raw_string: str, placeholders: tuple[str, ...]) -> tuple[bytes | int, ...]:
+    """``raw_string`` split at its placeholders, constant parts UTF-8 encoded.
+
+    Placeholders become their index in ``placeholders``. Keyed by the
+    template content, so an entry is shared by every view of a catalog
+    and can never go stale when translations are reloaded or filled.
+    """
+    if not placeholders:
+        return (raw_string.encode(),)
+    index = {placeholder: i for i, placeholder in enumerate(placeholders)}
+    pattern = re.compile("|".join(re.escape(p) for p in sorted(index, key=len, reverse=True)))
+    segments: list[bytes | int] = []
+    pos = 0
+    for match in pattern.finditer(raw_string):
+        segments.append(raw_string[pos : match.start()].encode())
+        segments.append(index[match.group()])
+        pos = match.end()
+    segments.append(raw_string[pos:].encode())
+    return tuple(segments)
+
+
 class PreLocaleSelector[L]:
     """Pre-call language selector.
 
@@ -47,7 +119,9 @@ class PreLocaleSelector[L]:
 
         When the selected locale is the source language, the joined
         arguments are already the final text: frame introspection,
-        AST parsing and hashing are skipped entirely.
+        AST parsing and hashing are skipped entirely. Other locales are
+        rendered straight from the compiled call site (see
+        ``I18n.select``), without building a ``LocaleContent``.
 
         Args:
             args: The text parts to translate.
@@ -58,11 +132,11 @@ class PreLocaleSelector[L]:
             The translated string.
         """
         sep = sep or self.sep
+        if is_template_call(args):
+            return self.i18n.t(*args, sep=sep)[self.locale]
         if self.locale == self.i18n.source_locale:
             return sep.join(str(item) for item in args)
-        current_frame = inspect.currentframe()
-        frame = current_frame.f_back if current_frame else None
-        return self.i18n.t(*args, sep=sep, frame=frame)[self.locale]
+        return self.i18n.select(self.locale, args, sep=sep, frame=sys._getframe(1))
 
 
 class LocaleContent[L](str):
@@ -76,11 +150,12 @@ class LocaleContent[L](str):
         cls,
         *,
         text: str,
-        locales: dict[str, TextMap],
+        locales: Mapping[str, Mapping[TextId, str]],
         variables: dict[str, object] | None = None,
         locale: str,
         source_locale: str | None = None,
         post_locale_selector: "type[PostLocaleSelector[L]] | None" = None,
+        on_missing: "MissingHook | None" = None,
     ) -> Self:
         return str.__new__(cls, text)
 
@@ -88,11 +163,12 @@ class LocaleContent[L](str):
         self,
         *,
         text: str,
-        locales: dict[str, TextMap],
+        locales: Mapping[str, Mapping[TextId, str]],
         variables: dict[str, object] | None = None,
         locale: str,
         source_locale: str | None = None,
         post_locale_selector: "type[PostLocaleSelector[L]] | None" = None,
+        on_missing: "MissingHook | None" = None,
     ):
         self._text = text
         self._locales = locales
@@ -100,6 +176,7 @@ class LocaleContent[L](str):
         self._locale = locale
         self._source_locale = source_locale
         self._post_locale_selector = post_locale_selector or PostLocaleSelector[L]
+        self._on_missing = on_missing
 
     def __str__(self) -> str:
         return self.__call__(self._locale)
@@ -136,27 +213,204 @@ class LocaleContent[L](str):
                 variables=self._variables,
                 locale=locale,
                 source_locale=self._source_locale,
+                on_missing=self._on_missing,
             )
         )
 
+    def as_bytes(self, locale: L | str | None = None) -> bytes:
+        """The UTF-8 encoded translation, e.g. for a response body.
+
+        Same text as ``content(locale).encode()``, but the constant
+        parts are encoded once per template and locale and reused; only
+        the variable values are encoded per call, and a constant string
+        returns the same cached ``bytes`` object every time.
+
+        Args:
+            locale: The locale to render. Defaults to the content's
+                default locale.
+
+        Returns:
+            The translated string as UTF-8 bytes.
+        """
+        return self._post_locale_selector(
+            text=self._text,
+            locales=self._locales,
+            variables=self._variables,
+            locale=self._locale if locale is None else locale,
+            source_locale=self._source_locale,
+            on_missing=self._on_missing,
+        ).format_bytes()
+
     def __int__(self) -> int:
         return int(self.__str__())
 
 
+class LazyLocaleContent[L]:
+    """A translation deferred until it is first rendered.
+
+    Created by ``_.lazy(...)``. Only the call site is recorded at
+    definition time; the source read, AST parse, evaluation and lookup
+    run on the first ``str()`` or locale selection, and the resulting
+    ``LocaleContent`` is memoized. f-string expressions are evaluated
+    at that first render, against a copy of the defining locals taken
+    at the call, so a loop variable keeps the value it had then.
+
+    Compared and hashed by identity: using one as a dict key or set
+    member translates nothing.
+
+    ``_.log(...)`` creates one bound to the log locale: ``str()`` renders
+    that locale instead of the default one.
+    """
+
+    __slots__ = ("_i18n", "_args", "_sep", "_site", "_content", "_locale")
+
+    def __init__(
+        self,
+        *,
+        i18n: "I18n[L]",
+        args: tuple[object, ...],
+        sep: str | None,
+        site: CallSite | None,
+        locale: str | None = None,
+    ):
+        self._i18n = i18n
+        self._args = args
+        self._sep = sep
+        self._site = site
+        self._content: LocaleContent[L] | None = None
+        self._locale = locale
+
+    def resolve(self) -> "LocaleContent[L]":
+        """Translate now (once) and return the memoized ``LocaleContent``."""
+        content = self._content
+        if content is None:
+            # ``site`` is only ``None`` for t-strings, which never read the frame.
+            content = self._i18n.t(*self._args, sep=self._sep, frame=self._site)
+            self._content = content
+            # The call site is only needed once; drop the namespace references.
+            self._site = None
+        return content
+
+    def __str__(self) -> str:
+        content = self.resolve()
+        return str(content) if self._locale is None else content(self._locale)
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.__str__(), format_spec)
+
+    def __getitem__(self, locale: L | str) -> str:
+        """Select a locale via ``_.lazy("text")[locale]`` syntax."""
+        return self.resolve()(locale)
+
+    def __call__(self, locale: L | str) -> str:
+        """Select a locale via ``_.lazy("text")(locale)`` syntax."""
+        return self.resolve()(locale)
+
+
 class PostLocaleSelector[L]:
     """Post-call language selector.
 
     Used via ``_("text")[locale]`` or ``_("text")(locale)`` syntax.
+
+    Selector objects that are not locale codes (e.g. a Telegram
+    ``Message``) are turned into a locale by ``resolve`` (or
+    ``resolve_async``). Results are cached per object, weakly keyed and
+    bounded by ``resolve_ttl``, so a lookup that hits a database runs
+    once per object instead of once per rendered string.
     """
 
+    resolve_ttl: ClassVar[float | None] = 60.0
+    """Seconds a resolved locale stays cached; ``None`` keeps it for the object's lifetime."""
+
+    _resolved: ClassVar[weakref.WeakKeyDictionary[Any, tuple[str | None, float]]] = weakref.WeakKeyDictionary()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Each selector class resolves differently, so each keeps its own cache.
+        cls._resolved = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def resolve(cls, selector: L) -> str | None:
+        """Map a selector object to a locale code.
+
+        Override this in subclasses; the default resolves nothing, so
+        the source text is rendered.
+
+        Args:
+            selector: The non-string object passed as a locale.
+
+        Returns:
+            The locale code, or ``None`` for the source text.
+        """
+        return None
+
+    @classmethod
+    async def resolve_async(cls, selector: L) -> str | None:
+        """Asynchronous counterpart of ``resolve``.
+
+        Override this when the lookup needs I/O; it defaults to
+        ``resolve``.
+        """
+        return cls.resolve(selector)
+
+    @classmethod
+    def locale_of(cls, selector: L) -> str | None:
+        """The cached locale for ``selector``, resolving it synchronously on a miss."""
+        hit = cls._cached(selector)
+        if hit is not None:
+            return hit[0]
+        locale = cls.resolve(selector)
+        cls._store(selector, locale)
+        return locale
+
+    @classmethod
+    async def prefetch(cls, selector: L) -> str | None:
+        """Resolve ``selector`` with ``resolve_async`` and cache the result.
+
+        Await this once per handled update; every string rendered for
+        the same object afterwards reuses the cached locale.
+        """
+        hit = cls._cached(selector)
+        if hit is not None:
+            return hit[0]
+        locale = await cls.resolve_async(selector)
+        cls._store(selector, locale)
+        return locale
+
+    @classmethod
+    def _cached(cls, selector: L) -> tuple[str | None] | None:
+        """``(locale,)`` when a fresh entry exists, else ``None``."""
+        try:
+            entry = cls._resolved.get(selector)
+        except TypeError:  # unhashable or not weak-referenceable: never cached
+            return None
+        if entry is None:
+            return None
+        locale, expires = entry
+        if expires <= time.monotonic():
+            return None
+        return (locale,)
+
+    @classmethod
+    def _store(cls, selector: L, locale: str | None) -> None:
+        expires = float("inf") if cls.resolve_ttl is None else time.monotonic() + cls.resolve_ttl
+        try:
+            cls._resolved[selector] = (locale, expires)
+        except TypeError:
+            pass
+
     def __init__(
         self,
         *,
         text: str,
-        locales: dict[str, TextMap],
+        locales: Mapping[str, Mapping[TextId, str]],
         variables: dict[str, object] | None = None,
         locale: L | str,
         source_locale: str | None = None,
+        on_missing: MissingHook | None = None,
     ):
         """Set up the post-call selector with translation data.
 
@@ -170,12 +424,17 @@ class PostLocaleSelector[L]:
                 requested locale equals it, the original text is
                 returned as-is (the source language never has a
                 translation).
+            on_missing: Called with ``(locale, text ID, text,
+                placeholders)`` when the locale has no translation for
+                the text (runtime translation); the source text is
+                rendered meanwhile.
         """
         self.text = text
         self.locales = locales
         self.variables = variables or {}
         self.locale = locale
         self.source_locale = source_locale
+        self.on_missing = on_missing
 
     def __str__(self) -> str:
         return self.__getitem__(self.locale)
@@ -199,21 +458,96 @@ class PostLocaleSelector[L]:
 
         Args:
             locale: The locale code to translate to. If not a string,
-                the original text is returned with variables
-                substituted.
+                it is resolved through ``locale_of``; when that yields
+                no locale, the original text is returned with
+                variables substituted.
 
         Returns:
             The formatted and translated string.
+
+        Inside ``I18n.render_scope()`` the result is memoized by
+        selector class, catalog, text, resolved locale and variable
+        values for the rest of the scope.
+        """
+        memo = _render_memo.get()
+        if memo is None:
+            return self._render(*self._lookup(locale))
+        values = _memo_values(self.variables.values())
+        if values is None:
+            return self._render(*self._lookup(locale))
+        code = locale if isinstance(locale, str) else self.locale_of(locale)
+        key = ("format", type(self), id(self.locales), self.source_locale, type(self.text), self.text, code, values)
+        hit: tuple[str, Mapping[str, Mapping[TextId, str]]] | None = memo.get(key)
+        # The entry holds the catalog it was rendered from, so that
+        # catalog's id cannot be reused by another one while it lives.
+        if hit is not None and hit[1] is self.locales:
+            return hit[0]
+        rendered = self._render(*self._lookup(locale))
+        _memo_store(memo, key, (rendered, self.locales))
+        return rendered
+
+    def format_bytes(self, locale: L | str | None = None) -> bytes:
+        """UTF-8 encoded ``format``, reusing pre-encoded constant parts.
+
+        The translated template is split at its placeholders and the
+        constant parts are encoded once (memoized by template content);
+        each call only encodes the variable values. Values are inserted
+        as-is, never re-scanned for placeholders.
+
+        Args:
+            locale: The locale code to translate to. Defaults to the
+                selector's locale.
+
+        Returns:
+            The formatted and translated string as UTF-8 bytes.
         """
+        raw_string, render_locale = self._lookup(self.locale if locale is None else locale)
+        if isinstance(self.text, MessageText):
+            return self._render(raw_string, render_locale).encode()
+        segments = _encoded_segments(raw_string, tuple(self.variables))
+        if len(segments) == 1 and isinstance(segments[0], bytes):
+            return segments[0]
+        values = tuple(self.variables.values())
+        return b"".join(
+            segment if isinstance(segment, bytes) else str(values[segment]).encode() for segment in segments
+        )
+
+    def _lookup(self, locale: L | str) -> tuple[str, str | None]:
+        """The raw string to render for ``locale``, and the locale it is in."""
         if not isinstance(locale, str):
-            return self._format(self.text)
+            resolved = self.locale_of(locale)
+            if resolved is None:
+                return self.text, self.source_locale
+            locale = resolved
         # The source language never has a translation: the source text
         # is its own "translation". Short-circuit before hashing and
         # dictionary lookups.
         if self.source_locale is not None and locale == self.source_locale:
-            return self._format(self.text)
-        translated = self.locales.get(locale, {}).get(Text.id_of(self.text), self.text)
-        return self._format(translated)
+            return self.text, locale
+        text_id = self.text.id if isinstance(self.text, Text) else Text.id_of(self.text)
+        translated = self.locales.get(locale, {}).get(text_id)
+        if translated is None:
+            if self.on_missing is not None and self.text:
+                placeholders = () if isinstance(self.text, MessageText) else tuple(self.variables)
+                self.on_missing(locale, text_id, self.text, placeholders)
+            return self.text, self.source_locale
+        return translated, locale
+
+    def _render(self, raw_string: str, locale: str | None) -> str:
+        """Substitute the variables, picking plural/select forms for messages.
+
+        A malformed translated message falls back to the source message.
+        """
+        if not isinstance(self.text, MessageText):
+            return self._format(raw_string)
+        try:
+            return render_message(raw_string, locale, self.variables)
+        except FormatError as e:
+            if raw_string == self.text:
+                raise
+            # No traceback: loguru's diagnose would render this content again while formatting the frame.
+            logger.error(f"I18N message error ({locale}), falling back to the source message: {e}")
+            return render_message(self.text, self.source_locale, self.variables)
 
     def _format(self, raw_string: str) -> str:
         for v in self.variables:
@@ -223,7 +557,7 @@ class PostLocaleSelector[L]:
 
 class I18n[L]:
     _CACHE_MAX = 2048
-    """Per-instance cap for compiled call sites and parse failures.
+    """Cap for compiled call sites and parse failures.
 
     Hot reload churns keys (a new code object per edit), so the cache
     must stay bounded; evicted entries are simply re-parsed once.
@@ -239,6 +573,9 @@ class I18n[L]:
         default_locale: str | None = None,
         pre_locale_selector: type[PreLocaleSelector[L]] | None = None,
         post_locale_selector: type[PostLocaleSelector[L]] | None = None,
+        shared_catalog: str | None = None,
+        log_locale: str | None = None,
+        load_namespaces: Iterable[str] | None = None,
     ) -> None:
         """Set up the translation runtime.
 
@@ -253,11 +590,28 @@ class I18n[L]:
                 ``source_locale``.
             pre_locale_selector: The pre-call locale selector class.
             post_locale_selector: The post-call locale selector class.
+            shared_catalog: The name of a catalog daemon's snapshot
+                (``EasyAI18n.serve_catalog``) to read instead of
+                parsing the YAML files; new versions are picked up
+                automatically.
+            log_locale: The locale ``_.log(...)`` messages render in.
+                Defaults to ``source_locale``.
+            load_namespaces: Load only these catalog shards (plus the
+                common one) when the catalogs are sharded per namespace
+                (``build(namespaces=...)``). ``None`` loads everything.
+
+        The loaded translations and the compiled call-site cache live in
+        a process-wide ``Catalog`` keyed by the resolved ``locales_dir``:
+        creating another instance for the same directory (e.g. per
+        module, or per default locale) re-parses nothing.
         """
-        self._cache: dict[tuple[CodeType, int, str], _CompiledCall] = {}
-        self._parse_failures: set[tuple[CodeType, int, str]] = set()
+        catalog = get_catalog(locales_dir, shared=shared_catalog, namespaces=load_namespaces)
+        self._catalog = catalog
+        self._cache: dict[CallKey, _CompiledCall] = catalog.calls(func_names)
+        self._parse_failures: set[CallKey] = catalog.failures(func_names)
         self.source_locale = source_locale.lower()
         self.default_locale = default_locale or self.source_locale
+        self.log_locale = log_locale or self.source_locale
 
         self.sep = sep
         self.locales_dir = locales_dir
@@ -265,9 +619,21 @@ class I18n[L]:
         self.pre_locale_selector: type[PreLocaleSelector[L]] = pre_locale_selector or PreLocaleSelector[L]
         self.post_locale_selector: type[PostLocaleSelector[L]] = post_locale_selector or PostLocaleSelector[L]
         self.content: type[LocaleContent[L]] = LocaleContent[L]
-        self.locales = Loader(self.locales_dir).load_locales_file()
+        self.locales = catalog.locales
+        # A selector that overrides rendering must see every call, so the
+        # direct path of ``select`` is only taken with the stock one.
+        selector_class = get_origin(self.post_locale_selector) or self.post_locale_selector
+        self._direct = all(
+            getattr(selector_class, name) is getattr(PostLocaleSelector, name)
+            for name in ("__getitem__", "format", "_lookup", "_render", "_format")
+        )
 
-    def t(self, *args: object, sep: str | None = None, frame: FrameType | None = None) -> LocaleContent[L]:
+    def t(
+        self,
+        *args: object,
+        sep: str | None = None,
+        frame: FrameType | CallSite | None = None,
+    ) -> LocaleContent[L]:
         """Translate text by parsing the caller's AST node.
 
         This is the core translation entry point. It extracts the
@@ -278,17 +644,23 @@ class I18n[L]:
         expressions) is cached by ``(code object, call offset, sep)``;
         every invocation only re-evaluates the expressions.
 
+        When every argument is a PEP 750 ``Template`` (``_(t"...")``),
+        the text and variables come straight from the template: no
+        frame, source read, AST parse or ``eval`` is involved.
+
         Args:
             args: The text parts to join and translate.
             sep: The separator between text parts. Defaults to the
                 configured separator.
-            frame: The caller's stack frame. If ``None``, the current
-                frame is used.
+            frame: The caller's stack frame, or a ``CallSite`` captured
+                from it earlier. If ``None``, the current frame is used.
 
         Returns:
             A ``LocaleContent`` object that supports locale selection.
         """
         sep = sep or self.sep
+        if is_template_call(args):
+            return self._t_template(args, sep)
         original = Text(sep.join([str(item) for item in args]))
         f = frame or sys._getframe(1)
         if not f:
@@ -318,9 +690,102 @@ class I18n[L]:
             return self._fallback(original)
 
         # FIFO 上限: 热重载产生的死条目恰好是最老的, 先被逐出;
+        if cache_key not in self._cache and self._catalog.reverse is not None:
+            self._catalog.reverse.record_sources((compiled.text,))
         self._cache[cache_key] = compiled
         if len(self._cache) > self._CACHE_MAX:
             del self._cache[next(iter(self._cache))]
+
+        memo = _render_memo.get()
+        memo_key = None
+        if memo is not None:
+            values = _memo_values(result.variables.values())
+            if values is not None:
+                memo_key = ("t", self, cache_key, values)
+                hit: LocaleContent[L] | None = memo.get(memo_key)
+                if hit is not None:
+                    return hit
+        content = self.content(
+            text=result.string,
+            locales=self.locales,
+            variables=result.variables,
+            locale=self.default_locale,
+            source_locale=self.source_locale,
+            post_locale_selector=self.post_locale_selector,
+            on_missing=self._missing_hook(),
+        )
+        if memo is not None and memo_key is not None:
+            _memo_store(memo, memo_key, content)
+        return content
+
+    def select(
+        self,
+        locale: L,
+        args: tuple[object, ...],
+        *,
+        sep: str | None = None,
+        frame: FrameType | CallSite | None = None,
+    ) -> str:
+        """Translate text into one locale, straight from the compiled call site.
+
+        Equivalent to ``t(*args, sep=sep, frame=frame)[locale]`` (it is
+        the path behind ``_[locale](...)``), but once the call site is
+        compiled only that locale is rendered: no joined original text,
+        no ``LocaleContent`` or ``PostLocaleSelector``, and no
+        variables dictionary. First calls, failures, t-strings and
+        custom post-call selectors take the ``t`` path.
+
+        Args:
+            locale: The locale to render (or a selector object,
+                resolved through ``locale_of``).
+            args: The text parts to translate.
+            sep: The separator between text parts. Defaults to the
+                configured separator.
+            frame: The caller's stack frame, or a ``CallSite``. If
+                ``None``, the current frame is used.
+
+        Returns:
+            The translated string.
+        """
+        sep = sep or self.sep
+        f = frame or sys._getframe(1)
+        cache_key = (f.f_code, f.f_lasti, sep)
+        compiled = self._cache.get(cache_key) if self._direct else None
+        if compiled is None or cache_key in self._parse_failures:
+            return self.t(*args, sep=sep, frame=f)[locale]
+
+        if isinstance(locale, str):
+            code: str | None = locale
+        elif isinstance(locale, (SupportsIndex, slice)):
+            return self.t(*args, sep=sep, frame=f)[locale]
+        else:
+            code = self.post_locale_selector.locale_of(locale)
+        raw_string: str = compiled.text
+        if code is not None and code != self.source_locale:
+            catalog = self.locales.get(code)
+            translated = catalog.get(compiled.id) if catalog is not None else None
+            if translated is not None:
+                raw_string = translated
+            else:
+                on_missing = self._missing_hook()
+                if on_missing is not None and raw_string:
+                    placeholders = tuple(dict.fromkeys(expr.placeholder for expr in compiled.exprs))
+                    on_missing(code, compiled.id, raw_string, placeholders)
+        if not compiled.exprs:
+            return raw_string
+        try:
+            return substitute_call(compiled, raw_string, f.f_globals, f.f_locals)
+        except (FormatError, EvaluationError):
+            # The ``t`` path logs the error and falls back to the original text.
+            return self.t(*args, sep=sep, frame=f)[locale]
+
+    def _t_template(self, templates: tuple[object, ...], sep: str) -> LocaleContent[L]:
+        """Translate t-string arguments without frame introspection."""
+        try:
+            result = evaluate_templates(templates, sep)
+        except (FormatError, EvaluationError):
+            logger.exception("I18N t-string error")
+            return self._fallback(Text(sep.join(_template_source(template) for template in templates)))
         return self.content(
             text=result.string,
             locales=self.locales,
@@ -328,9 +793,115 @@ class I18n[L]:
             locale=self.default_locale,
             source_locale=self.source_locale,
             post_locale_selector=self.post_locale_selector,
+            on_missing=self._missing_hook(),
+        )
+
+    def _missing_hook(self) -> MissingHook | None:
+        """The runtime-translation hook, or ``None`` when it is off."""
+        filler = self._catalog.filler
+        return filler.submit if filler is not None and not filler.stopped else None
+
+    def enable_runtime_translation(
+        self,
+        translator: "BaseTranslator",
+        *,
+        locales: list[str] | None = None,
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+        max_failures: int = 3,
+        save_to_file: bool = True,
+    ) -> "BackgroundFiller":
+        """Translate keys missing from a locale in the background.
+
+        A missing key still renders as the source text immediately; it
+        is also queued to a background worker that batches the misses
+        through ``translator``, writes the results into the live catalog
+        (and the YAML file), and stops itself after ``max_failures``
+        consecutive failed batches. Applies to every instance sharing
+        this ``locales_dir``.
+
+        Args:
+            translator: The translator used for missing keys.
+            locales: The locales that may be filled. Defaults to the
+                locales already present in the catalog.
+            batch_size: The most keys sent per locale in one batch.
+            flush_interval: Seconds to wait for more misses before a
+                batch is sent.
+            max_failures: Consecutive failed batches after which the
+                worker stops.
+            save_to_file: Whether filled keys are also written to the
+                locale's YAML file.
+
+        Returns:
+            The running ``BackgroundFiller`` (``join()`` waits for the
+            queue, ``stop()`` turns runtime translation off).
+        """
+        from ._filler import BackgroundFiller
+
+        if self._catalog.filler is not None:
+            self._catalog.filler.stop()
+        filler = BackgroundFiller(
+            catalog=self._catalog,
+            translator=translator,
+            source_locale=self.source_locale,
+            locales=locales,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            max_failures=max_failures,
+            save_to_file=save_to_file,
+        )
+        self._catalog.filler = filler
+        return filler
+
+    def enable_reverse_index(self, *, normalize: "bool | Normalizer" = False) -> "ReverseIndex":
+        """Index every translation by its text, for reverse lookups with ``reverse``.
+
+        Built once now and rebuilt whenever the catalog reloads; keys
+        filled by runtime translation are added as they arrive. Applies
+        to every instance sharing this ``locales_dir``.
+
+        Args:
+            normalize: ``True`` matches case- and
+                whitespace-insensitively; a callable supplies a custom
+                normalization. Defaults to exact matching.
+
+        Returns:
+            The ``ReverseIndex``.
+        """
+        from ._reverse import ReverseIndex, normalize_text
+
+        index = ReverseIndex(
+            source_locale=self.source_locale,
+            normalize=normalize_text if normalize is True else normalize or None,
         )
+        index.rebuild(self.locales)
+        # Call sites compiled so far; later ones are recorded in ``t``.
+        index.record_sources(compiled.text for compiled in self._catalog.compiled_calls())
+        self._catalog.reverse = index
+        return index
+
+    def reverse(self, text: str, locale: str | None = None) -> "ReverseMatch | None":
+        """Find which source string a translated text came from.
+
+        E.g. a reply-keyboard button label received as message text.
+        A dictionary lookup per locale; the exact-match index is built
+        on first use unless ``enable_reverse_index`` chose otherwise.
+
+        Args:
+            text: The translated text.
+            locale: The locale it is in. ``None`` tries every locale,
+                then the source language.
 
-    def _poison(self, cache_key: tuple[CodeType, int, str]) -> None:
+        Returns:
+            A ``ReverseMatch`` with the locale, the ``TextId`` and the
+            source template (when known), or ``None``.
+        """
+        index = self._catalog.reverse
+        if index is None:
+            index = self.enable_reverse_index()
+        return index.lookup(text, locale)
+
+    def _poison(self, cache_key: CallKey) -> None:
         """Record a parse failure, clearing the set when it outgrows the cap."""
         self._parse_failures.add(cache_key)
         if len(self._parse_failures) > self._CACHE_MAX:
@@ -347,10 +918,147 @@ class I18n[L]:
         )
 
     def clear_cache(self) -> None:
-        """Clear the AST parse cache and failure record."""
+        """Clear the AST parse cache and failure record.
+
+        The cache is shared with every instance using the same
+        ``locales_dir`` and ``func_names``, so they are cleared too.
+        """
         self._cache.clear()
         self._parse_failures.clear()
 
+    def dynamic(self, value: object) -> LocaleContent[L]:
+        """Translate a runtime value by looking its content up in the catalogs.
+
+        ``_(label)`` compiles to the template ``{label}``, which no
+        catalog contains; ``_.dynamic(label)`` instead hashes the value
+        itself, so strings from a database or config are translated
+        when the build registered them (``build(dynamic_texts=...)``).
+        No frame is inspected.
+
+        Args:
+            value: The value to translate (converted with ``str``).
+
+        Returns:
+            A ``LocaleContent`` object that supports locale selection.
+        """
+        return self.content(
+            text=DynamicText(value),
+            locales=self.locales,
+            locale=self.default_locale,
+            source_locale=self.source_locale,
+            post_locale_selector=self.post_locale_selector,
+            on_missing=self._missing_hook(),
+        )
+
+    def icu(self, message: str, /, **values: object) -> LocaleContent[L]:
+        """Translate a plural/select message (an ICU MessageFormat subset).
+
+        Every form lives under one catalog key, and the right branch is
+        picked per locale with compiled CLDR plural rules, e.g.
+        ``_.icu("{n, plural, one {# file} other {# files}}", n=count)``.
+        ``message`` must be a string literal (it is the catalog key); the
+        values are passed by keyword, so no frame is inspected.
+
+        Args:
+            message: The message text.
+            values: The argument values by name.
+
+        Returns:
+            A ``LocaleContent`` object that supports locale selection.
+        """
+        return self.content(
+            text=MessageText(message),
+            locales=self.locales,
+            variables=values,
+            locale=self.default_locale,
+            source_locale=self.source_locale,
+            post_locale_selector=self.post_locale_selector,
+            on_missing=self._missing_hook(),
+        )
+
+    def lazy(self, *args: object, sep: str | None = None) -> LazyLocaleContent[L]:
+        """Translate text on first use instead of at the call.
+
+        Meant for module- and class-level strings (``ERRORS = {1:
+        _.lazy("...")}``): importing the module records only the call
+        site, so modules whose strings are never shown parse nothing.
+
+        Args:
+            args: The text parts to translate.
+            sep: The separator between text parts. Defaults to the
+                configured separator.
+
+        Returns:
+            A ``LazyLocaleContent`` that translates on first render.
+        """
+        if is_template_call(args):
+            return LazyLocaleContent(i18n=self, args=args, sep=sep, site=None)
+        frame = sys._getframe(1)
+        return LazyLocaleContent(i18n=self, args=args, sep=sep, site=CallSite.of(frame))
+
+    def log(self, *args: object, sep: str | None = None) -> LazyLocaleContent[L]:
+        """A log message translated only if a handler emits it.
+
+        ``logger.debug(_.log(f"..."))`` records only the call site; the
+        AST parse, evaluation and lookup run when the record is
+        formatted (``str()``), in ``log_locale``. Records dropped by
+        level, in ``logging`` or ``loguru``, therefore cost no
+        translation. Handlers format while the logging call runs (a
+        ``QueueHandler`` formats before enqueueing), so f-string
+        variables still hold the values of the call.
+
+        Args:
+            args: The text parts to translate.
+            sep: The separator between text parts. Defaults to the
+                configured separator.
+
+        Returns:
+            A ``LazyLocaleContent`` bound to ``log_locale``.
+        """
+        if is_template_call(args):
+            return LazyLocaleContent(i18n=self, args=args, sep=sep, site=None, locale=self.log_locale)
+        frame = sys._getframe(1)
+        return LazyLocaleContent(i18n=self, args=args, sep=sep, site=CallSite.of(frame), locale=self.log_locale)
+
+    @staticmethod
+    @contextmanager
+    def render_scope() -> Iterator[None]:
+        """Memoize rendering for one request or task.
+
+        Inside the scope, ``t`` returns the same ``LocaleContent`` for a
+        call site evaluated to the same variable values, and
+        ``PostLocaleSelector.format`` reuses strings already rendered
+        for the same text, locale and values (a table header per row, a
+        status label in a loop). Unhashable values are not memoized.
+        The memo lives in a context variable, so concurrent requests
+        never share it, and it is discarded when the outermost scope
+        exits; nested scopes reuse it, e.g.
+        ``with _.render_scope(): return [_("状态")[user] for row in rows]``.
+        """
+        if _render_memo.get() is not None:
+            yield
+            return
+        token = _render_memo.set({})
+        try:
+            yield
+        finally:
+            _render_memo.reset(token)
+
+    async def prefetch_locale(self, selector: L) -> str | None:
+        """Resolve a selector object once, ahead of rendering.
+
+        Delegates to the post-call selector's ``prefetch``; await it at
+        the start of handling an update so every ``_[selector](...)``
+        and ``content[selector]`` for that object hits the cache.
+
+        Args:
+            selector: The selector object (e.g. a ``Message``).
+
+        Returns:
+            The resolved locale code, or ``None``.
+        """
+        return await self.post_locale_selector.prefetch(selector)
+
     def __getitem__(self, locale: L) -> PreLocaleSelector[L]:
         """Select a locale via ``I18n[locale]`` syntax.
 
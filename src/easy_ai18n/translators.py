@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from . import TextId, TextMap
+from ._message import map_message
 from .errors import BuildDependencyError, TranslationError
 
 if TYPE_CHECKING:
@@ -74,6 +75,7 @@ class BaseTranslator(abc.ABC):
         target_lang: str,
         source_lang: str,
         on_progress: Callable[[int], None] | None = None,
+        on_chunk: Callable[[TextMap], None] | None = None,
     ) -> TextMap:
         """Translate texts by slicing them into chunks.
 
@@ -88,6 +90,9 @@ class BaseTranslator(abc.ABC):
             source_lang: The language code of the source texts, passed
                 through to every chunk.
             on_progress: Called with the chunk size after each chunk.
+            on_chunk: Called with each chunk's translations as soon as
+                it completes (the build journals them to resume after a
+                crash).
         """
         items = list(texts.items())
         sem = asyncio.Semaphore(self.max_concurrency)
@@ -95,6 +100,8 @@ class BaseTranslator(abc.ABC):
         async def run_chunk(chunk: TextMap) -> TextMap:
             async with sem:
                 result = await self.translate_chunk(texts=chunk, target_lang=target_lang, source_lang=source_lang)
+                if on_chunk:
+                    on_chunk(result)
                 if on_progress:
                     on_progress(len(chunk))
                 return result
@@ -107,6 +114,58 @@ class BaseTranslator(abc.ABC):
         return merged
 
 
+# ── Placeholder masking ──────────────────────────────────────────
+
+# Translators receive ``\uE000<i>\uE001`` instead of the real
+# ``{variable}`` tokens, so a variable name can never collide with the
+# marker (the old ``{{i}}`` scheme could be corrupted by a literal
+# ``{{0}}`` in the source) and translation cannot mangle it. The markers
+# are restored after translation.
+_MASK_START = "\ue000"
+_MASK_END = "\ue001"
+
+
+def _mask(text: str, placeholders: tuple[str, ...]) -> str:
+    for i, placeholder in enumerate(placeholders):
+        text = text.replace(placeholder, f"{_MASK_START}{i}{_MASK_END}")
+    return text
+
+
+def _restore(text: str, placeholders: tuple[str, ...]) -> str:
+    for i, placeholder in enumerate(placeholders):
+        text = text.replace(f"{_MASK_START}{i}{_MASK_END}", placeholder)
+    return text
+
+
+async def _translate_messages(
+    translator: BaseTranslator,
+    messages: TextMap,
+    *,
+    target_lang: str,
+    source_lang: str,
+) -> TextMap:
+    """Translate plural/select messages branch by branch, keeping their ICU structure.
+
+    Sending a whole message would let the translator rewrite keywords
+    and selectors (``plural`` -> ``pluriel``), after which it no longer
+    parses. Instead each branch text is sent on its own, with ``#`` and
+    arguments masked, and the message is rebuilt around the results.
+    """
+    units: TextMap = {}
+
+    def collect(unit: str) -> str:
+        units[TextId(f"m{len(units)}")] = unit
+        return unit
+
+    for text in messages.values():
+        map_message(text, collect)
+    translated = (
+        await translator.translate(texts=units, target_lang=target_lang, source_lang=source_lang) if units else {}
+    )
+    results = iter([translated[key] for key in units])
+    return {text_id: map_message(text, lambda _unit: next(results)) for text_id, text in messages.items()}
+
+
 # ── Google Translate ────────────────────────────────────────────
 
 # googletrans's table lacks the common zh-hans/zh-hant spellings; map
@@ -1,9 +1,13 @@
+import asyncio
 import os
+import re
+import sys
+from pathlib import Path
 
 import pytest
 
-from easy_ai18n import EasyAI18n
-from easy_ai18n.errors import UnsupportedSyntaxError
+from easy_ai18n import EasyAI18n, PostLocaleSelector, Text, TextId
+from easy_ai18n.errors import BuildError, UnsupportedSyntaxError
 from easy_ai18n.translators import BaseTranslator
 
 os.putenv("I18N_LOG_LEVEL", "DEBUG")
@@ -220,3 +224,1039 @@ def test_pre_locale_selector_source_short_circuits():
     assert _["zh-hans"]("你好", "世界", sep="-") == "你好-世界"
     assert _["zh-hans"](f"数字: {1}") == "数字: 1"
     assert _["zh-hans"]("a", "b", sep="-") == "a-b"
+
+
+def test_pre_locale_selector_direct_path():
+    """After the first call, _[locale](...) renders from the compiled site without building a LocaleContent."""
+    i18n = EasyAI18n("zh-hans", locales_dir="tests/i18n")
+    _ = i18n.i18n()
+
+    def render(name):
+        return _["en"]("你好, 世界"), _["en"](f"你好 {name}"), _["fr"](f"你好 {name}")
+
+    expected = ("Hello World", _("你好 {name}")["en"].replace("{name}", "Bob"), "你好 Bob")
+    assert render("Bob") == expected
+
+    content_class = _.content
+    _.content = None  # any LocaleContent construction would now fail
+    try:
+        assert render("Bob") == expected
+        assert render("Ann")[2] == "你好 Ann"
+    finally:
+        _.content = content_class
+
+
+def test_as_bytes():
+    """as_bytes matches encoding the rendered string and reuses pre-encoded constant parts."""
+    i18n = EasyAI18n("zh-hans", locales_dir="tests/i18n")
+    _ = i18n.i18n()
+    greeting = _("你好, 世界")
+    assert greeting.as_bytes("en") == b"Hello World"
+    assert greeting.as_bytes("en") is greeting.as_bytes("en")
+    assert greeting.as_bytes() == "你好, 世界".encode()
+
+    for name in ("Bob", "世界", 42):
+        content = _(f"你好 {name}")
+        for locale in ("en", "ja", "fr", "zh-hans"):
+            assert content.as_bytes(locale) == content(locale).encode()
+    message = _.icu("{n, plural, other {# 个}}", n=3)
+    assert message.as_bytes("en") == "3 个".encode()
+
+
+def test_instances_share_catalog(tmp_path):
+    """Instances on the same locales_dir share one loaded catalog and call-site cache."""
+    i18n = EasyAI18n("zh-hans", locales_dir="tests/i18n")
+    _ = i18n.i18n()
+    _ja = EasyAI18n("zh-hans", locales_dir=Path("tests/i18n").absolute()).i18n(default_locale="ja")
+
+    assert _.locales is _ja.locales
+    assert _._cache is _ja._cache
+    assert _("你好, 世界")["en"] == "Hello World"
+    assert str(_ja("世界")) == "世界"
+
+    # A build refreshes the shared catalog in place
+    source = tmp_path / "app.py"
+    source.write_text("_('你好')\n", encoding="utf-8")
+    app = EasyAI18n("zh-hans", locales_dir=tmp_path / "locales")
+    _app = app.i18n()
+    assert _app.locales == {}
+    app.build(
+        project_root=tmp_path,
+        to_locales=["en"],
+        include=[source.name],
+        translator=NoOpTranslator(),
+        show_progress=False,
+    )
+    assert _app.locales["en"]
+
+    # Reloads swap the data in without an empty moment: when the old
+    # translations are released, the live catalog already holds the new ones
+    locales = _app.locales
+    fresh = dict(locales["en"])
+    seen = []
+
+    class Probe(dict):
+        def __del__(self):
+            seen.append(dict(locales.get("en") or {}))
+
+    locales["en"] = Probe(fresh)
+    _app._catalog._load = lambda: {"en": dict(fresh)}
+    _app._catalog.reload()
+    assert seen == [fresh] and _app.locales is locales
+
+
+def test_post_locale_selector_resolve_cache():
+    """Selector objects are resolved once and reused until the TTL expires."""
+
+    class User:
+        def __init__(self, lang):
+            self.lang = lang
+
+    calls = []
+
+    class UserSelector(PostLocaleSelector[User]):
+        @classmethod
+        def resolve(cls, selector):
+            calls.append(selector)
+            return selector.lang
+
+        @classmethod
+        async def resolve_async(cls, selector):
+            calls.append(selector)
+            return selector.lang
+
+    _ = EasyAI18n("zh-hans", locales_dir="tests/i18n").i18n(post_locale_selector=UserSelector)
+    user = User("en")
+    assert _("你好, 世界")[user] == "Hello World"
+    assert _["zh-hans"]("你好, 世界") == "你好, 世界"
+    assert _[user]("你好, 世界") == "Hello World"
+    assert len(calls) == 1
+
+    other = User("ja")
+    assert asyncio.run(_.prefetch_locale(other)) == "ja"
+    assert _("世界")(other) == "世界"
+    assert len(calls) == 2
+
+    UserSelector.resolve_ttl = 0
+    UserSelector._resolved.clear()
+    _("hello")[user]
+    _("hello")[user]
+    assert len(calls) == 4
+
+
+@pytest.mark.skipif(sys.version_info < (3, 14), reason="t-strings need Python 3.14+")
+def test_template_strings(tmp_path, monkeypatch):
+    """t-strings render from the Template alone and share IDs with the build side."""
+    source = tmp_path / "tstrings.py"
+    source.write_text(
+        "def demo(_, name, count):\n"
+        "    return _(t'你好, {name}'), _(t'数量: {count:03d}'), _(t'{name!r}')\n",
+        encoding="utf-8",
+    )
+    app = EasyAI18n("zh-hans", locales_dir=tmp_path / "locales")
+    app.build(
+        project_root=tmp_path,
+        to_locales=["en"],
+        include=[source.name],
+        translator=NoOpTranslator(),
+        show_progress=False,
+    )
+    _ = app.i18n()
+
+    def no_frame(*args, **kwargs):
+        raise AssertionError("t-strings must not inspect the caller's frame")
+
+    monkeypatch.setattr(sys, "_getframe", no_frame)
+    namespace = {}
+    exec(source.read_text(encoding="utf-8"), namespace)
+    greeting, count, quoted = namespace["demo"](_, "Alice", 7)
+
+    assert Text.id_of(str.__str__(greeting)) in _.locales["en"]
+    assert greeting["en"] == "你好, Alice"
+    assert str(count) == "数量: 007"
+    assert str(quoted) == "'Alice'"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 14), reason="t-strings need Python 3.14+")
+def test_build_rejects_dynamic_spec_in_t_string(tmp_path):
+    source = tmp_path / "dynamic_spec.py"
+    source.write_text("def demo(_, n, w):\n    _(t'{n:{w}}')\n", encoding="utf-8")
+
+    i18n = EasyAI18n("zh-hans", locales_dir=tmp_path / "locales")
+    with pytest.raises(UnsupportedSyntaxError, match="dynamic format spec not allowed inside t-string"):
+        i18n.build(
+            project_root=tmp_path,
+            to_locales=["en"],
+            include=[source.name],
+            translator=NoOpTranslator(),
+            show_progress=False,
+        )
+
+
+def test_lazy(tmp_path):
+    """Lazy strings record only the call site and translate on first use."""
+    i18n = EasyAI18n("zh-hans", locales_dir="tests/i18n")
+    _ = i18n.i18n()
+    _.clear_cache()
+
+    one = 1
+    errors = {1: _.lazy("你好, 世界"), 2: _.lazy(f"数字: {one}")}
+    assert not _._cache
+
+    assert errors[1]["en"] == "Hello World"
+    assert errors[2]("en") == "Number: 1"
+    assert str(errors[1]) == "你好, 世界"
+    assert f"{errors[1]}" == "你好, 世界"
+    assert errors[1].resolve() is errors[1].resolve()
+    assert len(_._cache) == 2
+
+    # Variables keep the value they had when the lazy string was created
+    def numbered():
+        out = []
+        for one in (1, 2, 3):
+            out.append(_.lazy(f"数字: {one}"))
+        return out
+
+    lazies = numbered()
+    assert len({lazy for lazy in lazies}) == 3 and len(_._cache) == 2  # hashing translates nothing
+    assert [str(lazy) for lazy in lazies] == ["数字: 1", "数字: 2", "数字: 3"]
+    assert [lazy["en"] for lazy in lazies] == ["Number: 1", "Number: 2", "Number: 3"]
+
+    # At module level the locals are the globals: referenced, not copied
+    module = {"_": _}
+    exec("site = _.lazy('你好, 世界')._site", module)
+    assert module["site"].f_locals is module
+
+    # The build side extracts _.lazy() calls like any other call
+    source = tmp_path / "lazy.py"
+    source.write_text("ERRORS = {1: _.lazy('你好')}\n", encoding="utf-8")
+    app = EasyAI18n("zh-hans", locales_dir=tmp_path / "locales")
+    app.build(
+        project_root=tmp_path,
+        to_locales=["en"],
+        include=[source.name],
+        translator=NoOpTranslator(),
+        show_progress=False,
+    )
+    assert Text.id_of("你好") in app.i18n().locales["en"]
+
+
+def test_loader_parallel_matches_serial(tmp_path, monkeypatch):
+    from easy_ai18n import _loader
+    from easy_ai18n._loader import Loader
+
+    (tmp_path / "en.yaml").write_text("aaaaaaaaaaaa: Hello\n", encoding="utf-8")
+    (tmp_path / "ja.yaml").write_text("aaaaaaaaaaaa: こんにちは\n", encoding="utf-8")
+    (tmp_path / "ru.yaml").write_text("", encoding="utf-8")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "en.yaml").write_text("a: [unclosed\n", encoding="utf-8")  # duplicate: ignored unparsed
+
+    serial = Loader(tmp_path).load_locales_file()
+    assert serial == {"en": {"aaaaaaaaaaaa": "Hello"}, "ja": {"aaaaaaaaaaaa": "こんにちは"}}
+    assert Loader(tmp_path, jobs=2).load_locales_file() == serial
+    assert Loader(tmp_path, jobs=2).load_locales_file(["ja"]) == {"ja": serial["ja"]}
+
+    # load_jobs is build-only: a runtime load (often at import time) never starts a process pool.
+    with monkeypatch.context() as m:
+        m.setattr(_loader, "ProcessPoolExecutor", None)
+        _ = EasyAI18n("zh-hans", locales_dir=tmp_path, load_jobs=2).i18n()
+        assert _.locales == serial
+
+    (tmp_path / "zh.yaml").write_text("a: [unclosed\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="zh.yaml"):
+        Loader(tmp_path, jobs=2).load_locales_file()
+
+
+def test_runtime_translation_fills_missing_keys(tmp_path, monkeypatch):
+    """Missing keys render as source text and are filled in the background."""
+
+    class TaggingTranslator(BaseTranslator):
+        def __init__(self):
+            super().__init__(batch_size=10)
+            self.calls = 0
+            self.fail = False
+
+        async def translate_chunk(self, *, texts, target_lang, source_lang):
+            self.calls += 1
+            if self.fail:
+                raise RuntimeError("rate limited")
+            return {k: f"[{target_lang}] {v}" for k, v in texts.items()}
+
+    locales_dir = tmp_path / "locales"
+    locales_dir.mkdir()
+    (locales_dir / "en.yaml").write_text("aaaaaaaaaaaa: Hello\n", encoding="utf-8")
+    _ = EasyAI18n("zh-hans", locales_dir=locales_dir).i18n()
+    translator = TaggingTranslator()
+    filler = _.enable_runtime_translation(translator, flush_interval=0.05)
+
+    name = "Alice"
+    assert _(f"你好, {name}")["en"] == "你好, Alice"
+    assert _(f"你好, {name}")["en"] == "你好, Alice"  # deduplicated while in flight
+    assert _("你好")["fr"] == "你好"  # not a catalog locale: never filled
+    assert filler.join(timeout=5)
+
+    assert _(f"你好, {name}")["en"] == "[en] 你好, Alice"
+    assert translator.calls == 1
+    from easy_ai18n._loader import Loader
+
+    assert Loader(locales_dir).load_locales_file()["en"][Text.id_of("你好, {name}")] == "[en] 你好, {name}"
+
+    # A failed batch is retried by the next render that misses the key
+    translator.fail = True
+    assert _("再见")["en"] == "再见"
+    assert filler.join(timeout=5)
+    translator.fail = False
+    assert _("再见")["en"] == "再见"
+    assert filler.join(timeout=5)
+    assert _("再见")["en"] == "[en] 再见"
+    assert translator.calls == 3 and not filler._pending
+
+    # Any other error fails only its batch: the worker keeps serving
+    from easy_ai18n import _filler
+
+    with monkeypatch.context() as m:
+        m.setattr(_filler, "_restore", lambda text, placeholders: int(text))
+        assert _("早上好")["en"] == "早上好"
+        assert filler.join(timeout=5)
+    assert _("早上好")["en"] == "早上好"
+    assert filler.join(timeout=5)
+    assert _("早上好")["en"] == "[en] 早上好"
+
+    # stop() cancels the worker task and lets the thread exit cleanly
+    assert _("晚安")["en"] == "晚安"
+    filler.stop()
+    filler._thread.join(timeout=5)
+    assert not filler._thread.is_alive()
+    # A miss racing the shutdown finds the loop closed and is dropped instead of failing the render
+    filler.stopped = False
+    assert _("午安")["en"] == "午安" and filler.stopped
+
+
+def test_dynamic_lookup(tmp_path):
+    """Runtime values are looked up by content, apart from the static-template ID cache."""
+    from easy_ai18n._types import _dynamic_text_id, _text_id
+
+    _ = EasyAI18n("zh-hans", locales_dir="tests/i18n").i18n()
+    label = "列表测试"
+    assert _(label)["en"] == label  # compiles to "{label}": never in a catalog
+    _text_id.cache_clear()
+    assert _.dynamic(label)["en"] == "List Test"
+    assert _.dynamic("未知")["en"] == "未知"
+    assert _text_id.cache_info().currsize == 0
+    assert _dynamic_text_id.cache_info().currsize >= 2
+
+    source = tmp_path / "app.py"
+    source.write_text("_('你好')\n", encoding="utf-8")
+    app = EasyAI18n("zh-hans", locales_dir=tmp_path / "locales")
+    app.build(
+        project_root=tmp_path,
+        to_locales=["en"],
+        include=[source.name],
+        translator=NoOpTranslator(),
+        show_progress=False,
+        dynamic_texts=["已完成", "已完成"],
+    )
+    locales = app.i18n().locales
+    assert set(locales["en"]) == {Text.id_of("你好"), Text.id_of("已完成")}
+
+
+def test_icu_plural_and_select(tmp_path):
+    """Plural/select messages pick forms with compiled CLDR rules; all forms share one key."""
+    from easy_ai18n._message import plural_rule
+
+    ru = plural_rule("ru")
+    assert [ru(n) for n in (1, 2, 5, 11, 21, 22, 1.5)] == ["one", "few", "many", "many", "one", "few", "other"]
+    assert plural_rule("ja")(1) == "other"
+    assert plural_rule("pt-BR") is plural_rule("pt-BR")
+
+    message = "{n, plural, =0 {没有文件} other {# 个文件}}, {who, select, me {我的} other {别人的}}"
+    source = tmp_path / "app.py"
+    source.write_text(f"_.icu({message!r}, n=count, who=owner)\n", encoding="utf-8")
+    locales_dir = tmp_path / "locales"
+    locales_dir.mkdir()
+    (locales_dir / "ru.yaml").write_text(
+        f"{Text.id_of(message)}: '{{n, plural, =0 {{нет файлов}} one {{# файл}} few {{# файла}} many {{# файлов}}"
+        f" other {{# файла}}}}, {{who, select, me {{мои}} other {{чужие}}}}'\n",
+        encoding="utf-8",
+    )
+    app = EasyAI18n("zh-hans", locales_dir=locales_dir)
+    app.build(
+        project_root=tmp_path,
+        to_locales=["ru"],
+        include=[source.name],
+        translator=NoOpTranslator(),
+        show_progress=False,
+    )
+    _ = app.i18n()
+    assert list(_.locales["ru"]) == [Text.id_of(message)]  # already translated: kept, not stale
+
+    assert str(_.icu(message, n=0, who="me")) == "没有文件, 我的"
+    assert str(_.icu(message, n=3, who="x")) == "3 个文件, 别人的"
+    assert _.icu(message, n=0, who="me")["ru"] == "нет файлов, мои"
+    assert _.icu(message, n=21, who="me")["ru"] == "21 файл, мои"
+    assert _.icu(message, n=3, who="x")["ru"] == "3 файла, чужие"
+    assert _.icu(message, n=5, who="x")("ru") == "5 файлов, чужие"
+
+    # Only branch texts reach the translator: keywords and selectors survive one that rewrites ASCII words
+    class ShoutingTranslator(BaseTranslator):
+        async def translate_chunk(self, *, texts, target_lang, source_lang):
+            return {k: re.sub(r"[a-z]+", lambda m: m.group().upper(), f"[{target_lang}] {v}") for k, v in texts.items()}
+
+    app.build(
+        project_root=tmp_path,
+        to_locales=["fr"],
+        include=[source.name],
+        translator=ShoutingTranslator(),
+        show_progress=False,
+    )
+    assert _.icu(message, n=0, who="me")["fr"] == "[FR] 没有文件, [FR] 我的"
+    assert _.icu(message, n=3, who="x")["fr"] == "[FR] 3 个文件, [FR] 别人的"
+
+
+def test_export_bundles(tmp_path):
+    """Bundles hold only their files' IDs, use content-hashed names and are rewritten only on change."""
+    import gzip
+    import json
+
+    (tmp_path / "web" / "checkout").mkdir(parents=True)
+    (tmp_path / "web" / "checkout" / "pay.py").write_text("_('付款')\n_(f'合计 {total}')\n", encoding="utf-8")
+    (tmp_path / "server.py").write_text("_('服务器错误')\n", encoding="utf-8")
+    app = EasyAI18n("zh-hans", locales_dir=tmp_path / "locales")
+
+    def build():
+        app.build(
+            project_root=tmp_path,
+            to_locales=["en"],
+            translator=NoOpTranslator(),
+            show_progress=False,
+            bundles={"checkout": ["web/checkout"]},
+            bundle_compress=["gzip"],
+        )
+        out = tmp_path / "locales" / "bundles"
+        return out, json.loads((out / "manifest.json").read_text(encoding="utf-8"))
+
+    out, manifest = build()
+    assert set(manifest["checkout"]) == {"zh-hans", "en"}
+    bundle = out / manifest["checkout"]["en"]
+    data = json.loads(bundle.read_text(encoding="utf-8"))
+    assert set(data) == {Text.id_of("付款"), Text.id_of("合计 {total}")}
+    assert json.loads(gzip.decompress(bundle.with_name(bundle.name + ".gz").read_bytes())) == data
+    mtime = bundle.stat().st_mtime_ns
+
+    _, same = build()  # nothing changed: same names, files untouched
+    assert same == manifest and bundle.stat().st_mtime_ns == mtime
+
+    (tmp_path / "web" / "checkout" / "pay.py").write_text("_('付款')\n", encoding="utf-8")
+    _, changed = build()
+    assert changed["checkout"]["en"] != manifest["checkout"]["en"]
+    assert not bundle.exists()  # superseded files are pruned
+
+
+def test_shared_catalog_snapshot(tmp_path):
+    """Workers read the daemon's shared-memory snapshot instead of YAML and pick up new versions."""
+    import subprocess
+
+    from easy_ai18n._catalog import reload_catalog
+    from easy_ai18n._shared import CatalogPublisher, SharedTexts
+
+    locales_dir = tmp_path / "locales"
+    locales_dir.mkdir()
+    others = {Text.id_of(f"词{n}"): f"Word {n} ✓" for n in range(20)}
+    lines = [f"{Text.id_of('你好')}: Hello"] + [f"{i}: {text}" for i, text in others.items()]
+    (locales_dir / "en.yaml").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    name = f"eai18n-{os.getpid()}"
+    publisher = CatalogPublisher(locales_dir, name)  # stand-in for the daemon process
+    try:
+        assert publisher.publish() == 1
+        # The worker's own locales_dir is empty: every translation comes from the snapshot.
+        _ = EasyAI18n("zh-hans", locales_dir=tmp_path / "worker", shared_catalog=name).i18n()
+        assert _("你好")["en"] == "Hello"
+        assert _._catalog.version == 1
+
+        # Texts are looked up in the segment, not copied; runtime additions stay local.
+        en = _._catalog.locales["en"]
+        assert isinstance(en, SharedTexts) and len(en) == 21
+        assert all(en[i] == text for i, text in others.items()) and set(en) == {Text.id_of("你好"), *others}
+        assert Text.id_of("你好") in en._decoded  # decoded once, then served from a dict
+        assert en.get(TextId("missing")) is None and TextId("missing") not in en
+        en[TextId("added")] = en[TextId("missing")] = "Added"
+        assert en["added"] == en["missing"] == "Added" and len(en) == 23
+
+        # A build's reload leaves snapshot catalogs to the daemon instead of re-reading the old version.
+        reload_catalog(tmp_path / "worker")
+        assert _._catalog.locales["en"] is en
+
+        (locales_dir / "en.yaml").write_text(f"{Text.id_of('你好')}: Hi there\n", encoding="utf-8")
+        assert publisher.publish_if_changed() and not publisher.publish_if_changed()
+        assert _._catalog.refresh() and not _._catalog.refresh()
+        assert _("你好")["en"] == "Hi there"
+
+        # Another process attaches too, and exiting does not unlink the publisher's segments.
+        code = (
+            "from easy_ai18n._shared import SnapshotReader;"
+            f"version, locales = SnapshotReader({name!r}).load();"
+            "print(version, locales['en'][%r])" % Text.id_of("你好")
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+        assert out.stdout.split() == ["2", "Hi", "there"]
+        assert _._catalog.refresh() is False and _._catalog._reader.load()[0] == 2
+    finally:
+        publisher.close()
+
+
+def test_reverse_index(tmp_path):
+    """Translated texts map back to their ID and source template, exactly or normalized, and follow reloads."""
+    locales_dir = tmp_path / "locales"
+    locales_dir.mkdir()
+    (locales_dir / "en.yaml").write_text(f"{Text.id_of('设置')}: Settings\n", encoding="utf-8")
+    _ = EasyAI18n("zh-hans", locales_dir=locales_dir).i18n()
+    assert _("设置")["en"] == "Settings"  # compiles the call site, so the source is known
+
+    match = _.reverse("Settings", "en")
+    assert (match.locale, match.id, match.source) == ("en", Text.id_of("设置"), "设置")
+    assert _.reverse("Settings").locale == "en"
+    assert _.reverse("设置").locale == "zh-hans"
+    assert _.reverse(" settings ", "en") is None and _.reverse("Settings", "ja") is None
+
+    _.enable_reverse_index(normalize=True)
+    assert _.reverse("  SETTINGS ", "en").id == Text.id_of("设置")
+
+    (locales_dir / "en.yaml").write_text(f"{Text.id_of('设置')}: Preferences\n", encoding="utf-8")
+    _._catalog.reload()
+    assert _.reverse("preferences").id == Text.id_of("设置")
+    assert _.reverse("settings", "en") is None
+
+
+def test_render_scope():
+    """Inside a render scope, repeated renders are memoized by call site, locale and values; outside, nothing is kept."""
+    from easy_ai18n.i18n import _render_memo
+
+    i18n = EasyAI18n("zh-hans", locales_dir="tests/i18n")
+    _ = i18n.i18n()
+    with _.render_scope():
+        contents = [_(f"你好 {name}") for name in ("Bob", "Bob", "Ann")]
+        assert contents[0] is contents[1] and contents[0] is not contents[2]
+        assert [c["en"] for c in contents] == [_(f"你好 {n}")["en"] for n in ("Bob", "Bob", "Ann")]
+        memo = _render_memo.get()
+        assert any(key[0] == "format" for key in memo)
+        with _.render_scope():
+            assert _render_memo.get() is memo
+        # 1 and True are equal but render differently
+        assert [str(_(f"值 {v}")) for v in (1, True)] == ["值 1", "值 True"]
+        assert str(_(f"列表 {[1]}")) == "列表 [1]"  # unhashable values are simply not memoized
+
+        # Selector classes that render differently never share entries
+        class Loud(PostLocaleSelector):
+            def _format(self, raw_string):
+                return super()._format(raw_string).upper()
+
+        class Quiet(PostLocaleSelector):
+            def _format(self, raw_string):
+                return super()._format(raw_string).lower()
+
+        shared = {"locales": _.locales, "text": Text("你好, 世界"), "source_locale": "zh-hans"}
+        assert Loud(locale="en", **shared).format("en") == "HELLO WORLD"
+        assert Quiet(locale="en", **shared).format("en") == "hello world"
+    assert _render_memo.get() is None
+
+
+def test_lazy_log_messages():
+    """_.log(...) translates into the log locale only when a handler emits the record."""
+    import logging
+
+    from loguru import logger as loguru_logger
+
+    i18n = EasyAI18n("zh-hans", locales_dir="tests/i18n")
+    _ = i18n.i18n(log_locale="en")
+    calls = []
+    real_t = _.t
+
+    def counting_t(*args, **kwargs):
+        calls.append(args)
+        return real_t(*args, **kwargs)
+
+    _.t = counting_t
+    records = []
+    handler = logging.Handler(logging.INFO)
+    handler.emit = lambda record: records.append(record.getMessage())
+    log = logging.getLogger("easy_ai18n.test_log")
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    messages = []
+    sink_id = loguru_logger.add(messages.append, level="INFO", format="{message}")
+    try:
+        name = "世界"
+        log.debug(_.log(f"你好 {name}"))
+        assert calls == [] and records == []
+
+        log.info(_.log("你好, 世界"))
+        loguru_logger.info(_.log("你好, 世界"))
+        assert records == ["Hello World"]
+        assert [m.strip() for m in messages] == ["Hello World"]
+        assert len(calls) == 2
+    finally:
+        log.removeHandler(handler)
+        loguru_logger.remove(sink_id)
+
+
+def test_parallel_extraction_matches_serial(tmp_path):
+    """Extraction across worker processes merges to the same entries, and syntax errors keep their context."""
+    from easy_ai18n._builder import Builder
+
+    for i in range(6):
+        (tmp_path / f"m{i}.py").write_text(f"_('共享')\n_(f'文件 {i} {{x}}')\n", encoding="utf-8")
+
+    def extract(jobs):
+        builder = Builder(
+            sep=" ",
+            func_names=["_"],
+            locales_dir=tmp_path / "locales",
+            to_locales=["en"],
+            source_locale="zh-hans",
+            project_root=tmp_path,
+            translator=NoOpTranslator(),
+            jobs=jobs,
+        )
+        return builder.extract_entries()
+
+    serial = extract(None)
+    assert len(serial) == 7
+    parallel = extract(2)
+    assert list(parallel.items()) == list(serial.items())
+
+    (tmp_path / "m3.py").write_text("async def f(_):\n    _(f'{await g()}')\n", encoding="utf-8")
+    with pytest.raises(UnsupportedSyntaxError, match="await not allowed inside f-string") as exc_info:
+        extract(2)
+    assert "m3.py" in str(exc_info.value) and "await g()" in str(exc_info.value)
+
+
+def test_extraction_cache(tmp_path, monkeypatch):
+    """Later builds parse only new or changed files; settings changes invalidate the cache."""
+    import easy_ai18n._builder as builder_module
+    from easy_ai18n._builder import Builder
+
+    (tmp_path / "a.py").write_text("_('甲')\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("_(f'乙 {x}')\n", encoding="utf-8")
+    parsed = []
+    real_parse = builder_module._parse_source_file
+
+    def counting_parse(file, sep, func_names):
+        parsed.append(file.name)
+        return real_parse(file, sep, func_names)
+
+    monkeypatch.setattr(builder_module, "_parse_source_file", counting_parse)
+
+    def extract(func_names=("_",)):
+        parsed.clear()
+        return Builder(
+            sep=" ",
+            func_names=list(func_names),
+            locales_dir=tmp_path / "locales",
+            to_locales=["en"],
+            source_locale="zh-hans",
+            project_root=tmp_path,
+            translator=NoOpTranslator(),
+        ).extract_entries()
+
+    first = extract()
+    assert sorted(parsed) == ["a.py", "b.py"] and (tmp_path / "locales" / ".cache").is_dir()
+    assert (tmp_path / "locales" / ".cache" / ".gitignore").read_text(encoding="utf-8") == "*\n"
+    assert extract() == first and parsed == []
+
+    (tmp_path / "b.py").write_text("_(f'乙 {y}')\n", encoding="utf-8")
+    (tmp_path / "c.py").write_text("_('丙')\n", encoding="utf-8")
+    second = extract()
+    assert sorted(parsed) == ["b.py", "c.py"]
+    assert set(second) == {Text.id_of("甲"), Text.id_of("乙 {y}"), Text.id_of("丙")}
+
+    (tmp_path / "a.py").unlink()
+    assert Text.id_of("甲") not in extract() and parsed == []
+    extract(func_names=("_", "gettext"))
+    assert sorted(parsed) == ["b.py", "c.py"]
+
+
+def test_prefilter_matches_full_extraction():
+    """Pruning the AST walk to candidate lines extracts exactly what a full walk does."""
+    import ast
+
+    from easy_ai18n._parser import ASTParser, candidate_lines
+
+    tricky = """
+import x as __
+_x = "_('not a call')"  # _('nor this')
+
+
+@deco(_("装饰器"))
+def f(obj, _y=__):
+    return obj._("方法")
+
+
+class C:
+    label = _["en"](
+        "多行"
+        "字符串"
+    )
+
+    async def g(self):
+        _.lazy("惰性")
+        _.icu("{n, plural, other {# 项}}")
+        _.log("日志")
+"""
+    sources = [tricky, "print('nothing')\n", "__ = 1\n_x(1)\n"]
+    root = Path(__file__).parent.parent
+    sources += [file.read_text(encoding="utf-8") for file in [*root.glob("src/**/*.py"), *root.glob("tests/*.py")]]
+
+    parser = ASTParser(sep=" ", func_names=["_"])
+    for source in sources:
+        module = ast.parse(source)
+        full = parser.extract_all(node=module, source=source)
+        lines = candidate_lines(source, ["_"])
+        pruned = parser.extract_all(node=module, source=source, lines=lines) if lines else []
+        assert [s.string for s in pruned] == [s.string for s in full]
+
+    assert [s.string for s in parser.extract_all(node=ast.parse(tricky), lines=candidate_lines(tricky, ["_"]))] == [
+        "方法",
+        "装饰器",
+        "多行字符串",
+        "惰性",
+        "{n, plural, other {# 项}}",
+        "日志",
+    ]
+    assert candidate_lines("__ = 1\n_x(1)\n", ["_"]) == []
+    # Identifiers are NFKC-normalized: a fullwidth ``ｔ`` is a call to ``t``.
+    assert candidate_lines("a = 1\nｔ('全角')\n", ["t"]) == [2]
+
+
+def test_scanner_patterns_and_ignore_files(tmp_path):
+    """Compiled patterns agree with the ``PurePath`` rule; ignore files and virtualenvs prune the walk."""
+    from pathlib import PurePosixPath
+
+    from easy_ai18n._scanner import PathMatcher, scan_project
+
+    patterns = ["src", "src/app", "*.py", "tests/*.py", "a/**/b.py", "test_[a-c]*.py", "x?.py", ".", "/abs"]
+    paths = ["src", "src/app/m.py", "srcx/m.py", "m.py", "tests/t.py", "deep/tests/t.py", "a/b.py", "a/z/b.py"]
+    paths += ["test_b1.py", "test_d1.py", "xy.py", "x/y.py", "m.txt"]
+    for pattern in patterns:
+        for rel in paths:
+            p = PurePosixPath(pattern)
+            expected = (
+                rel == str(p)
+                or PurePosixPath(rel).is_relative_to(p)
+                or (not p.is_absolute() and bool(p.parts) and PurePosixPath(rel).match(pattern))
+            )
+            assert PathMatcher([pattern]).match(rel) == expected, (pattern, rel)
+
+    files = {
+        "main.py": "",
+        "build/gen.py": "",
+        "node_modules/pkg/x.py": "",
+        "env/pyvenv.cfg": "",
+        "env/lib/site.py": "",
+        "pkg/keep.py": "",
+        "pkg/skip_me.py": "",
+        "pkg/sub/skip_me.py": "",
+        "pkg/sub/logs/a.py": "",
+        "pkg/.ignore": "!sub/skip_me.py\n",
+        "docs/conf.py": "",
+        ".gitignore": "# comment\n/build/\nskip_*.py\nlogs/\n\\#hash.py\n",
+        "#hash.py": "",
+    }
+    for name, content in files.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(content, encoding="utf-8")
+
+    def scan(**kwargs):
+        return [p.relative_to(tmp_path).as_posix() for p in scan_project(tmp_path, exclude=["node_modules"], **kwargs)]
+
+    assert scan() == ["main.py", "docs/conf.py", "pkg/keep.py", "pkg/sub/skip_me.py"]
+    assert scan(include=["pkg"]) == ["pkg/keep.py", "pkg/sub/skip_me.py"]
+    assert "build/gen.py" in scan(ignore_files=False)
+    assert "env/lib/site.py" not in scan(ignore_files=False)
+
+
+def test_streaming_build(tmp_path, monkeypatch):
+    """A streaming build translates while scanning and writes the same catalogs as a batch build."""
+    import yaml
+
+    from easy_ai18n import _builder
+
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(10):
+        (src / f"m{i}.py").write_text(f"_('共享')\n_('文件 {i}')\n", encoding="utf-8")
+
+    events = []
+    parse = _builder._parse_source_file
+    monkeypatch.setattr(_builder, "_parse_source_file", lambda *a: events.append("parse") or parse(*a))
+    monkeypatch.setattr(_builder, "_STREAM_CHUNK", 1)
+    monkeypatch.setattr(_builder, "_STREAM_QUEUE", 1)
+
+    class RecordingTranslator(NoOpTranslator):
+        async def translate_chunk(self, *, texts, target_lang, source_lang):
+            events.append("translate")
+            return await super().translate_chunk(texts=texts, target_lang=target_lang, source_lang=source_lang)
+
+    def build(locales_dir, translator, streaming):
+        i18n = EasyAI18n("zh-hans", locales_dir=locales_dir)
+        i18n.build(
+            ["en", "ja"],
+            project_root=src,
+            translator=translator,
+            show_progress=False,
+            extract_cache=False,
+            streaming=streaming,
+        )
+        return {locale: yaml.safe_load((locales_dir / f"{locale}.yaml").read_text("utf-8")) for locale in ("en", "ja")}
+
+    streamed = build(tmp_path / "streamed", RecordingTranslator(), True)
+    assert events.index("translate") < len(events) - 1 - events[::-1].index("parse")
+    assert streamed == build(tmp_path / "batch", NoOpTranslator(), False)
+    assert len(streamed["en"]) == 11
+
+    (src / "m9.py").unlink()
+    events.clear()
+    streamed = build(tmp_path / "streamed", RecordingTranslator(), True)
+    assert "translate" not in events
+    assert len(streamed["en"]) == 10 and "文件 9" not in streamed["ja"].values()
+
+
+def test_watch_rebuilds_incrementally(tmp_path):
+    """Watch mode translates only new keys and rewrites only the catalogs that changed."""
+    import threading
+    import time
+
+    import yaml
+
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.py").write_text("_('甲')\n", encoding="utf-8")
+    (src / "b.py").write_text("_('乙')\n", encoding="utf-8")
+    locales_dir = tmp_path / "i18n"
+
+    translated = []
+
+    class CountingTranslator(NoOpTranslator):
+        async def translate_chunk(self, *, texts, target_lang, source_lang):
+            translated.extend((target_lang, str(text)) for text in texts.values())
+            return await super().translate_chunk(texts=texts, target_lang=target_lang, source_lang=source_lang)
+
+    def catalog(locale):
+        return set(yaml.safe_load((locales_dir / f"{locale}.yaml").read_text("utf-8")).values())
+
+    def wait_for(condition):
+        deadline = time.monotonic() + 10
+        while not condition():
+            assert time.monotonic() < deadline, "watch did not rebuild in time"
+            time.sleep(0.02)
+
+    stop = threading.Event()
+    i18n = EasyAI18n("zh-hans", locales_dir=locales_dir)
+    watcher = threading.Thread(
+        target=i18n.watch,
+        args=(["en", "ja"],),
+        kwargs={
+            "project_root": src,
+            "translator": CountingTranslator(),
+            "show_progress": False,
+            "poll_interval": 0.02,
+            "debounce": 0.05,
+            "extract_cache": False,
+            "checkpoint": False,
+            "stop": stop,
+        },
+    )
+    watcher.start()
+    try:
+        wait_for(lambda: (locales_dir / "ja.yaml").exists() and catalog("ja") == {"甲", "乙"})
+        translated.clear()
+
+        (src / "a.py").write_text("_('甲')\n_('丙')\n", encoding="utf-8")
+        wait_for(lambda: catalog("ja") == {"甲", "乙", "丙"})
+        assert sorted(translated) == [("en", "丙"), ("ja", "丙")]
+
+        (src / "b.py").unlink()
+        wait_for(lambda: catalog("en") == {"甲", "丙"} and catalog("ja") == {"甲", "丙"})
+
+        # A translation deleted by hand is filled in again; the other catalog is left alone.
+        ja_mtime = (locales_dir / "ja.yaml").stat().st_mtime_ns
+        translated.clear()
+        (locales_dir / "en.yaml").write_text(yaml.safe_dump({Text.id_of("甲"): "甲"}), encoding="utf-8")
+        wait_for(lambda: catalog("en") == {"甲", "丙"})
+        assert translated == [("en", "丙")]
+        assert (locales_dir / "ja.yaml").stat().st_mtime_ns == ja_mtime
+    finally:
+        stop.set()
+        watcher.join(10)
+    assert not watcher.is_alive()
+    assert not (locales_dir / ".cache").exists()
+
+
+def test_sharded_catalogs(tmp_path):
+    """Namespaced builds write per-namespace shards, rewrite only changed ones, and load selectively."""
+    import yaml
+
+    src = tmp_path / "src"
+    (src / "billing").mkdir(parents=True)
+    (src / "web").mkdir()
+    (src / "billing" / "pay.py").write_text("_('付款')\n_('确定')\n", encoding="utf-8")
+    (src / "web" / "home.py").write_text("_('首页')\n_('确定')\n", encoding="utf-8")
+    locales_dir = tmp_path / "i18n"
+    locales_dir.mkdir()
+    (locales_dir / "en.yaml").write_text(yaml.safe_dump({"stale": "old"}), encoding="utf-8")
+
+    def build():
+        EasyAI18n("zh-hans", locales_dir=locales_dir).build(
+            "en",
+            project_root=src,
+            translator=NoOpTranslator(),
+            show_progress=False,
+            namespaces={"billing": ["billing"], "web": ["web"]},
+        )
+
+    def shard(name):
+        return set(yaml.safe_load((locales_dir / "en" / f"{name}.yaml").read_text("utf-8")).values())
+
+    build()
+    assert not (locales_dir / "en.yaml").exists()
+    assert (shard("billing"), shard("web"), shard("common")) == ({"付款"}, {"首页"}, {"确定"})
+
+    mtimes = {name: (locales_dir / "en" / f"{name}.yaml").stat().st_mtime_ns for name in ("web", "common")}
+    (src / "billing" / "pay.py").write_text("_('付款')\n_('确定')\n_('退款')\n", encoding="utf-8")
+    build()
+    assert shard("billing") == {"付款", "退款"}
+    assert {name: (locales_dir / "en" / f"{name}.yaml").stat().st_mtime_ns for name in mtimes} == mtimes
+
+    web_only = EasyAI18n("zh-hans", locales_dir=locales_dir, load_namespaces=["web"]).i18n()
+    assert set(web_only.locales["en"].values()) == {"首页", "确定"}
+    everything = EasyAI18n("zh-hans", locales_dir=locales_dir).i18n()
+    assert set(everything.locales["en"].values()) == {"付款", "退款", "首页", "确定"}
+
+    # Without a common shard a directory is no sharded locale: its files stay flat catalogs and flat writes keep them.
+    from easy_ai18n._loader import Loader, dump_locale_file
+
+    legacy = tmp_path / "legacy"
+    (legacy / "generated").mkdir(parents=True)
+    (legacy / "generated" / "en.yaml").write_text("a: Hello\n", encoding="utf-8")
+    (legacy / "en").mkdir()
+    (legacy / "en" / "ja.yaml").write_text("a: こんにちは\n", encoding="utf-8")
+    assert Loader(legacy).load_locales_file() == {"en": {"a": "Hello"}, "ja": {"a": "こんにちは"}}
+    dump_locale_file(legacy, "en", {"a": "Hi"})
+    assert (legacy / "en" / "ja.yaml").exists()
+
+
+def test_checkpointed_build_resumes(tmp_path):
+    """Finished chunks are journaled, finished locales are published early, and a rerun requests only the rest."""
+    import asyncio
+
+    import yaml
+
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "m.py").write_text("".join(f"_('第 {i} 条')\n" for i in range(6)), encoding="utf-8")
+    locales_dir = tmp_path / "i18n"
+    requested = []
+
+    class FlakyTranslator(NoOpTranslator):
+        def __init__(self, fail_after=None):
+            super().__init__(batch_size=1, max_concurrency=1)
+            self.fail_after = fail_after
+
+        async def translate_chunk(self, *, texts, target_lang, source_lang):
+            if target_lang == "ja":
+                # en is published while ja is still running.
+                for _ in range(200):
+                    if (locales_dir / "en.yaml").exists():
+                        break
+                    await asyncio.sleep(0.01)
+                assert (locales_dir / "en.yaml").exists()
+                if self.fail_after is not None and len([r for r in requested if r[0] == "ja"]) >= self.fail_after:
+                    raise RuntimeError("quota exhausted")
+            requested.append((target_lang, *texts.values()))
+            return await super().translate_chunk(texts=texts, target_lang=target_lang, source_lang=source_lang)
+
+    def build(translator):
+        EasyAI18n("zh-hans", locales_dir=locales_dir).build(
+            ["en", "ja"], project_root=src, translator=translator, show_progress=False, max_retries=0
+        )
+
+    build(FlakyTranslator(fail_after=4))
+    assert len([r for r in requested if r[0] == "ja"]) == 4
+    assert not yaml.safe_load((locales_dir / "ja.yaml").read_text("utf-8"))
+    assert (locales_dir / ".cache" / "journal" / "ja.jsonl").exists()
+
+    requested.clear()
+    build(FlakyTranslator())
+    assert [r[0] for r in requested] == ["ja", "ja"]
+    assert len(yaml.safe_load((locales_dir / "ja.yaml").read_text("utf-8"))) == 6
+    assert not (locales_dir / ".cache" / "journal" / "ja.jsonl").exists()
+
+
+def test_coordinated_build(tmp_path):
+    """Work units are leased exactly once, expired leases are handed out again, and results merge once."""
+    import sqlite3
+    import threading
+
+    import yaml
+
+    from easy_ai18n._coordinator import QUEUE_FILE, WorkQueue
+
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "m.py").write_text(
+        "".join(f"_('第 {i} 条')\n" for i in range(5)) + "name = 'x'\n_(f'你好 {name}')\n", encoding="utf-8"
+    )
+    locales_dir = tmp_path / "i18n"
+    i18n = EasyAI18n("zh-hans", locales_dir=locales_dir)
+    stopped = threading.Event()
+    stopped.set()
+    assert not i18n.coordinate(["en", "ja"], project_root=src, chunk_size=2, stop=stopped)
+
+    queue = WorkQueue(locales_dir / ".cache" / QUEUE_FILE)
+    assert queue.progress() == {"en": {"pending": 3}, "ja": {"pending": 3}}
+    assert (locales_dir / ".cache" / ".gitignore").exists()
+    crashed = queue.lease("crashed", lease_seconds=-1.0)
+    assert crashed is not None and crashed.locale == "en"
+    retry = queue.lease("w1", lease_seconds=60.0)
+    assert retry is not None and retry.id == crashed.id
+    assert queue.complete(retry, {i: f"EN {text}" for i, text, _ in retry.entries})
+    assert not queue.complete(crashed, {i: "late" for i, _, _ in crashed.entries})
+    finished = {i for i, _, _ in retry.entries}
+
+    # A worker still holding a unit when the coordinator re-plans cannot complete any new unit
+    stale = queue.lease("stale", lease_seconds=60.0)
+    assert stale is not None and stale.locale == "en"
+    assert not i18n.coordinate(["en", "ja"], project_root=src, chunk_size=2, stop=stopped)
+    assert not queue.complete(stale, {i: "stale" for i, _, _ in stale.entries})
+    assert queue.results("ja") == {} and queue.progress()["ja"] == {"pending": 3}
+
+    requested = []
+
+    class RecordingTranslator(NoOpTranslator):
+        async def translate_chunk(self, *, texts, target_lang, source_lang):
+            requested.extend((target_lang, i) for i in texts)
+            return await super().translate_chunk(texts=texts, target_lang=target_lang, source_lang=source_lang)
+
+    assert i18n.coordinate(
+        ["en", "ja"],
+        project_root=src,
+        chunk_size=2,
+        local_workers=[RecordingTranslator(), RecordingTranslator()],
+        poll_interval=0.01,
+    )
+    assert len(requested) == len(set(requested)) == 12 - len(finished)
+    assert not any(locale == "en" and i in finished for locale, i in requested)
+    en = yaml.safe_load((locales_dir / "en.yaml").read_text("utf-8"))
+    ja = yaml.safe_load((locales_dir / "ja.yaml").read_text("utf-8"))
+    assert len(en) == len(ja) == 6
+    assert all(en[i].startswith("EN ") for i in finished)
+    assert "你好 {name}" in ja.values()
+    assert queue.progress() == {}
+    queue.close()
+
+    # A queue of another schema version is refused, not dropped.
+    with sqlite3.connect(locales_dir / ".cache" / QUEUE_FILE) as db:
+        db.execute("PRAGMA user_version = 99")
+    db.close()
+    with pytest.raises(BuildError, match="schema version 99"):
+        WorkQueue(locales_dir / ".cache" / QUEUE_FILE)